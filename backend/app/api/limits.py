@@ -0,0 +1,48 @@
+from typing import Mapping
+
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+
+from ..services.upload import size_limit_message
+
+
+class RequestSizeLimit:
+    """ASGI middleware capping the request body of selected POST routes.
+
+    Form routes only see their files after the whole multipart body has been
+    received and spooled, so per-file checks come too late to stop a large
+    upload. This cuts the request off at the transport instead: a declared
+    Content-Length over the limit gets a 413 without reading the body, and
+    a body that grows past it (chunked uploads) fails with a 413 as soon as
+    the limit is crossed.
+    """
+
+    def __init__(self, app, limits: Mapping[str, int]):
+        self.app = app
+        self.limits = dict(limits)
+
+    async def __call__(self, scope, receive, send):
+        limit = self.limits.get(scope.get("path")) if scope["type"] == "http" and scope["method"] == "POST" else None
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        declared = dict(scope["headers"]).get(b"content-length")
+        if declared is not None and declared.isdigit() and int(declared) > limit:
+            response = JSONResponse(status_code=413, content={"detail": size_limit_message(limit)})
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    # Form parsing re-raises HTTPExceptions untouched, so this becomes the response
+                    raise HTTPException(status_code=413, detail=size_limit_message(limit))
+            return message
+
+        await self.app(scope, limited_receive, send)
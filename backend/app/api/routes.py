@@ -1,13 +1,28 @@
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form
-from fastapi.responses import JSONResponse
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import Any, Dict, List, Optional
+import asyncio
+from functools import lru_cache
+import json
 import uuid
+import zipfile
 import logging
 from datetime import datetime
 
-from ..models.resume import ResumeData, SkillGapAnalysis, RecommendationRequest, LearningPlan, SavePlanRequest
-from ..services.parser import ResumeParser
-from ..services.nlp import NLPProcessor
+from ..models.resume import SkillGapAnalysis, BatchAnalysisRequest, RecommendationRequest, LearningPlan, SavePlanRequest
+from .. import config
+from ..startup import startup_report
+from ..services.executor import CPUExecutor
+from ..services import workers
+from ..services.parse_cache import ParseCache
+from ..services.pipeline import EXTRACTION_MODES, ResumePipeline, StageTimeout, build_resume_data
+from ..services.upload import (
+    SpooledUpload, UploadRejected, read_pdf_upload, read_zip_member, size_limit_message, zip_pdf_members
+)
+from ..services.gap_engine import GapCache, shared_engine
+from ..services.fuzzy import FuzzyResolver
+from ..services.nlp import SKILL_KEYWORDS, display_skill
+from ..services.bulk_ingest import UserBatchWriter, bounded_as_completed, ingest_record
 from ..services.jobs import JobService
 from ..services.recommend import RecommendationService
 from ..storage.data_store import DataStore
@@ -15,57 +30,173 @@ from ..storage.data_store import DataStore
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-# Initialize services
-resume_parser = ResumeParser()
-nlp_processor = NLPProcessor()
-job_service = JobService()
-recommendation_service = RecommendationService()
-data_store = DataStore()
+# Services are built on first use, so importing this module stays cheap and
+# the app can answer health checks while the parse workers warm up
+@lru_cache(maxsize=None)
+def get_cpu_executor() -> CPUExecutor:
+    return CPUExecutor(
+        max_workers=config.CPU_POOL_SIZE,
+        max_in_flight=config.CPU_MAX_IN_FLIGHT,
+        initializer=workers.init_worker,
+        initargs=(config.CPU_POOL_WARMUP,),
+        max_jobs_per_worker=config.WORKER_MAX_JOBS,
+        max_worker_rss=config.WORKER_MAX_RSS_MB * 1024 * 1024,
+    )
+
+@lru_cache(maxsize=None)
+def get_parse_cache() -> Optional[ParseCache]:
+    if not config.PARSE_CACHE_ENABLED:
+        return None
+    return ParseCache(
+        cache_dir=config.PARSE_CACHE_DIR,
+        fingerprint=workers.extractor_fingerprint(),
+        max_memory_entries=config.PARSE_CACHE_MEMORY_ENTRIES,
+        max_disk_bytes=config.PARSE_CACHE_DISK_BYTES,
+    )
+
+@lru_cache(maxsize=None)
+def get_resume_pipeline() -> ResumePipeline:
+    return ResumePipeline(
+        get_cpu_executor(),
+        cache=get_parse_cache(),
+        pages_per_chunk=config.PDF_PAGES_PER_CHUNK,
+        max_pages=config.PDF_MAX_PAGES,
+        max_chars=config.PDF_MAX_CHARS,
+        nlp_batch_size=config.NLP_BATCH_MAX_SIZE,
+        nlp_batch_wait_ms=config.NLP_BATCH_MAX_WAIT_MS,
+        extraction_timeout=config.EXTRACTION_TIMEOUT_S,
+        nlp_timeout=config.NLP_TIMEOUT_S,
+        storage_timeout=config.STORAGE_TIMEOUT_S,
+    )
+
+@lru_cache(maxsize=None)
+def get_lite_executor() -> CPUExecutor:
+    return CPUExecutor(
+        max_workers=config.LITE_POOL_SIZE,
+        max_in_flight=config.LITE_MAX_IN_FLIGHT,
+        initializer=workers.init_lite_worker,
+        max_jobs_per_worker=config.WORKER_MAX_JOBS,
+        max_worker_rss=config.WORKER_MAX_RSS_MB * 1024 * 1024,
+    )
+
+@lru_cache(maxsize=None)
+def get_lite_pipeline() -> ResumePipeline:
+    return ResumePipeline(
+        get_lite_executor(),
+        cache=get_parse_cache(),
+        pages_per_chunk=config.PDF_PAGES_PER_CHUNK,
+        max_pages=config.PDF_MAX_PAGES,
+        max_chars=config.PDF_MAX_CHARS,
+        nlp_batch_size=1,
+        mode="lite",
+        extraction_timeout=config.EXTRACTION_TIMEOUT_S,
+        nlp_timeout=config.NLP_TIMEOUT_S,
+        storage_timeout=config.STORAGE_TIMEOUT_S,
+    )
+
+def _pipeline_for(mode: Optional[str]) -> ResumePipeline:
+    """Pipeline serving an extraction mode; full unless mode=lite"""
+    mode = (mode or "full").lower()
+    if mode not in EXTRACTION_MODES:
+        raise HTTPException(
+            status_code=400, detail=f"mode must be one of: {', '.join(EXTRACTION_MODES)}"
+        )
+    return get_lite_pipeline() if mode == "lite" else get_resume_pipeline()
+
+@lru_cache(maxsize=None)
+def get_job_service() -> JobService:
+    return JobService()
+
+@lru_cache(maxsize=None)
+def get_gap_cache() -> GapCache:
+    return GapCache(shared_engine(), config.GAP_CACHE_SIZE)
+
+@lru_cache(maxsize=None)
+def get_fuzzy_resolver() -> FuzzyResolver:
+    return FuzzyResolver(config.FUZZY_THRESHOLD, config.FUZZY_TOP_K, config.FUZZY_CACHE_SIZE)
+
+def fuzzy_resolver() -> FuzzyResolver:
+    """Fuzzy resolver indexed over the current role catalog and the extraction keywords"""
+    catalog = get_job_service().get_catalog()
+    
+    def known_skills():
+        # Extraction keywords are known too, so "Java" stays Java rather
+        # than being pulled toward "JavaScript" when no role lists it
+        yield from (display_skill(keyword) for keyword in SKILL_KEYWORDS)
+        yield from (skill for skills in catalog.roles.values() for skill in skills)
+    
+    resolver = get_fuzzy_resolver()
+    resolver.refresh(catalog.version, known_skills)
+    return resolver
+
+@lru_cache(maxsize=None)
+def get_role_ranker():
+    # Imported here so that numpy stays off the startup path
+    from ..services.role_matrix import RoleRanker
+    return RoleRanker(get_job_service())
+
+@lru_cache(maxsize=None)
+def get_recommendation_service() -> RecommendationService:
+    return RecommendationService()
+
+@lru_cache(maxsize=None)
+def get_data_store() -> DataStore:
+    return DataStore()
 
 @router.post("/upload_resume")
 async def upload_resume(
     file: UploadFile = File(...),
-    target_role: str = Form(...)
+    target_role: str = Form(...),
+    mode: str = Form("full")
 ):
-    """Upload and parse a PDF resume"""
+    """Upload and parse a PDF resume
+
+    mode=lite skips spaCy: only skills and contact details are extracted,
+    on a separate worker pool.
+    """
     try:
+        pipeline = _pipeline_for(mode)
+        
         # Validate file
-        if not file.filename.endswith('.pdf'):
+        if not (file.filename or "").lower().endswith('.pdf'):
             raise HTTPException(status_code=400, detail="Only PDF files are supported")
         
-        if file.size and file.size > 5 * 1024 * 1024:  # 5MB limit
-            raise HTTPException(status_code=400, detail="File size must be less than 5MB")
+        if file.size and file.size > config.UPLOAD_MAX_BYTES:
+            raise HTTPException(status_code=400, detail=size_limit_message(config.UPLOAD_MAX_BYTES))
         
-        # Read file content
-        content = await file.read()
+        # Copy the received body in chunks: header and size are checked before it is kept
+        try:
+            upload = await read_pdf_upload(
+                file,
+                max_bytes=config.UPLOAD_MAX_BYTES,
+                spill_bytes=config.UPLOAD_SPILL_BYTES,
+                chunk_size=config.UPLOAD_CHUNK_BYTES
+            )
+        except UploadRejected as e:
+            raise HTTPException(status_code=400, detail=str(e))
         
-        # Parse PDF
-        parsed_text = resume_parser.extract_text(content)
-        if not parsed_text.strip():
+        # Parse PDF and extract structured data in worker processes;
+        # re-uploads of the same PDF are served from the parse cache
+        with upload:
+            try:
+                parsed = await pipeline.parse(upload.source, cache_key=upload.sha256)
+            except StageTimeout as e:
+                raise HTTPException(status_code=422, detail=str(e))
+        if parsed is None:
             raise HTTPException(status_code=400, detail="Could not extract text from PDF")
         
-        # Extract structured data using NLP
-        structured_data = nlp_processor.extract_resume_data(parsed_text)
-        
         # Generate unique user ID
         user_id = f"user_{uuid.uuid4().hex[:8]}"
         
-        # Create resume data object
-        resume_data = ResumeData(
-            user_id=user_id,
-            name=structured_data.get("name", "Unknown"),
-            contact=structured_data.get("contact", {}),
-            skills=structured_data.get("skills", []),
-            #experience=structured_data.get("experience", []),
-            parsed_text_snippet=parsed_text[:200] + "..." if len(parsed_text) > 200 else parsed_text,
-            target_role=target_role,
-            upload_timestamp=datetime.now().isoformat()
-        )
+        # Create resume data object; stages that ran out of time are listed in `truncated`
+        resume_data = build_resume_data(user_id, parsed.text, parsed.data, target_role, list(parsed.truncated))
         
         # Save to storage
-        data_store.save_user_data(user_id, resume_data.dict())
+        result = resume_data.dict()
+        if not await pipeline.store(get_data_store().save_user_data, user_id, result):
+            result["truncated"] = result["truncated"] + ["storage"]
         
-        return resume_data.dict()
+        return result
         
     except HTTPException:
         raise
@@ -73,40 +204,208 @@ async def upload_resume(
         logger.error(f"Error processing resume: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to process resume")
 
+async def _spool_upload(file: UploadFile) -> Dict[str, Any]:
+    """Copy one file of a batch upload to a temp file, validating it on the way"""
+    if not (file.filename or "").lower().endswith('.pdf'):
+        return {"source": file.filename, "status": "error", "error": "Only PDF files are supported"}
+    
+    try:
+        upload = await read_pdf_upload(
+            file,
+            max_bytes=config.UPLOAD_MAX_BYTES,
+            spill_bytes=0,
+            chunk_size=config.UPLOAD_CHUNK_BYTES
+        )
+    except UploadRejected as e:
+        return {"source": file.filename, "status": "error", "error": str(e)}
+    
+    return {"source": file.filename, "status": "pending", "upload": upload}
+
+async def _parse_spooled(item: Dict[str, Any], pipeline: ResumePipeline) -> Dict[str, Any]:
+    """Parse one spooled upload into a bulk ingestion result"""
+    if item["status"] != "pending":
+        return item
+    
+    upload: SpooledUpload = item["upload"]
+    try:
+        with upload:
+            parsed = await pipeline.parse(upload.source, cache_key=upload.sha256)
+        if parsed is None:
+            return {"source": item["source"], "status": "error", "error": "Could not extract text from PDF"}
+        
+        return {
+            "source": item["source"],
+            "status": "ok",
+            "sha256": upload.sha256,
+            "parsed_text": parsed.text,
+            "structured_data": parsed.data,
+            "truncated": list(parsed.truncated)
+        }
+    except StageTimeout as e:
+        return {"source": item["source"], "status": "error", "error": str(e)}
+    except Exception as e:
+        logger.error(f"Error processing {item['source']}: {str(e)}")
+        return {"source": item["source"], "status": "error", "error": "Failed to process resume"}
+
+async def _save_users(save, *args) -> Optional[str]:
+    """Run a UserBatchWriter call off the event loop; an NDJSON error line if it failed"""
+    try:
+        await asyncio.to_thread(save, *args)
+        return None
+    except Exception as e:
+        logger.error(f"Error saving ingested users: {str(e)}")
+        return json.dumps({"source": None, "status": "error", "error": "Failed to save parsed users"}) + "\n"
+
+async def _ingest_stream(jobs, target_role: Optional[str], cleanup):
+    """Run bulk parse jobs with bounded concurrency, yielding NDJSON lines as they finish
+
+    Users are saved in batches off the event loop. The status line has been
+    sent by the time a batch fails, so a failed save is reported as an error
+    line and the unsaved users are retried with the next batch.
+    """
+    writer = UserBatchWriter(get_data_store(), config.INGEST_BATCH_SIZE)
+    flushed = False
+    try:
+        async for result in bounded_as_completed(jobs, config.INGEST_CONCURRENCY):
+            record = ingest_record(result, target_role)
+            user = record.pop("user", None)
+            yield json.dumps(record) + "\n"
+            if user is not None:
+                error = await _save_users(writer.add, user["user_id"], user)
+                if error:
+                    yield error
+        
+        flushed = True
+        error = await _save_users(writer.flush)
+        if error:
+            yield error
+    finally:
+        # The client went away mid-stream: still keep the users parsed so far
+        if not flushed:
+            await _save_users(writer.flush)
+        await cleanup()
+
+async def _resolved(value: Any) -> Any:
+    return value
+
+@router.post("/upload_resumes")
+async def upload_resumes(
+    files: List[UploadFile] = File(...),
+    target_role: Optional[str] = Form(None),
+    mode: str = Form("full")
+):
+    """Upload many PDF resumes; results stream back as NDJSON, one line per file"""
+    pipeline = _pipeline_for(mode)
+    
+    # Spool to our own temp files first: the request's files are closed once
+    # this handler returns, before the streamed body is produced.
+    spooled = [await _spool_upload(file) for file in files]
+    
+    async def jobs():
+        for item in spooled:
+            yield _parse_spooled(item, pipeline)
+    
+    async def cleanup():
+        for item in spooled:
+            if "upload" in item:
+                item["upload"].close()
+    
+    return StreamingResponse(_ingest_stream(jobs(), target_role, cleanup), media_type="application/x-ndjson")
+
+@router.post("/upload_zip")
+async def upload_zip(request: Request):
+    """Upload a zip of PDF resumes; results stream back as NDJSON, one line per member
+
+    Multipart fields: `file` (the zip archive), optional `target_role` and
+    optional `mode` (full or lite).
+    Members are decompressed one at a time straight into the parse pipeline,
+    never extracted to disk, and a corrupt member only fails its own line.
+    """
+    # Parse the form here rather than via File(): FastAPI closes declared
+    # form files when the handler returns, but the archive has to stay open
+    # while the response streams.
+    form = await request.form()
+    file = form.get("file")
+    target_role = form.get("target_role") or None
+    
+    try:
+        pipeline = _pipeline_for(form.get("mode"))
+    except HTTPException:
+        await form.close()
+        raise
+    
+    if file is None or isinstance(file, str):
+        await form.close()
+        raise HTTPException(status_code=400, detail="A zip file is required")
+    
+    if not (file.filename or "").lower().endswith(".zip"):
+        await form.close()
+        raise HTTPException(status_code=400, detail="Only zip archives are supported")
+    
+    try:
+        archive = zipfile.ZipFile(file.file)
+    except zipfile.BadZipFile:
+        await form.close()
+        raise HTTPException(status_code=400, detail="File is not a valid zip archive")
+    
+    members = zip_pdf_members(archive)
+    
+    async def jobs():
+        for info in members:
+            try:
+                upload = await asyncio.to_thread(
+                    read_zip_member, archive, info, config.UPLOAD_MAX_BYTES, config.UPLOAD_CHUNK_BYTES
+                )
+            except UploadRejected as e:
+                yield _resolved({"source": info.filename, "status": "error", "error": str(e)})
+                continue
+            yield _parse_spooled({"source": info.filename, "status": "pending", "upload": upload}, pipeline)
+    
+    async def cleanup():
+        archive.close()
+        await form.close()
+    
+    return StreamingResponse(_ingest_stream(jobs(), target_role, cleanup), media_type="application/x-ndjson")
+
 @router.post("/analyze_skills")
-async def analyze_skills(user_id: str, target_role: str):
-    """Analyze skill gaps for a user"""
+async def analyze_skills(user_id: str, target_role: str, fuzzy: bool = False):
+    """Analyze skill gaps for a user; fuzzy=true resolves near-miss skill names first"""
     try:
         # Get user data
-        user_data = data_store.get_user_data(user_id)
+        user_data = get_data_store().get_user_data(user_id)
         if not user_data:
             raise HTTPException(status_code=404, detail="User not found")
         
         # Get required skills for role
-        required_skills = job_service.get_role_skills(target_role)
+        catalog = get_job_service().get_catalog()
+        required_skills = catalog.roles.get(target_role)
         if not required_skills:
             raise HTTPException(status_code=404, detail="Role not found")
         
         user_skills = user_data.get("skills", [])
-        
-        # Perform analysis
-        matched_skills = []
-        missing_skills = []
-        
-        for skill in required_skills:
-            if any(user_skill.lower() == skill.lower() for user_skill in user_skills):
-                matched_skills.append(skill)
+        fuzzy_matches = None
+        compared_skills = user_skills
+        if fuzzy:
+            if get_fuzzy_resolver().ready():
+                resolver = fuzzy_resolver()
             else:
-                missing_skills.append(skill)
+                # Only the first index build blocks; later ones run in the background
+                resolver = await asyncio.to_thread(fuzzy_resolver)
+            compared_skills, fuzzy_matches = resolver.resolve_all(user_skills)
+        
+        # Perform analysis, memoized until the role catalog changes
+        gap = get_gap_cache().analyze(compared_skills, target_role, required_skills, catalog.version)
         
         analysis = SkillGapAnalysis(
             user_id=user_id,
             target_role=target_role,
-            required_skills=required_skills,
+            # Deduplicated like the match percentage's denominator
+            required_skills=get_gap_cache().engine.required(required_skills),
             user_skills=user_skills,
-            matched_skills=matched_skills,
-            missing_skills=missing_skills,
-            match_percentage=len(matched_skills) / len(required_skills) * 100 if required_skills else 0
+            matched_skills=gap.matched,
+            missing_skills=gap.missing,
+            match_percentage=gap.match_percentage,
+            fuzzy_matches=fuzzy_matches
         )
         
         return analysis.dict()
@@ -117,21 +416,161 @@ async def analyze_skills(user_id: str, target_role: str):
         logger.error(f"Error analyzing skills: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to analyze skills")
 
+def _batch_analysis_lines(user_skills: Dict[str, Optional[List[str]]], roles: Dict[str, List[str]]):
+    """NDJSON lines of user x role gap analyses, every role of a user in one matrix pass"""
+    # Imported here so that numpy stays off the startup path
+    from ..services.role_matrix import RoleMatrix
+    
+    matrix = RoleMatrix(roles)
+    for user_id, skills in user_skills.items():
+        if skills is None:
+            yield json.dumps({"user_id": user_id, "status": "error", "error": "User not found"}) + "\n"
+            continue
+        
+        for gap in matrix.gaps(skills):
+            yield json.dumps({
+                "user_id": user_id,
+                "target_role": gap.role,
+                "status": "ok",
+                "matched_skills": gap.matched,
+                "missing_skills": gap.missing,
+                "match_percentage": gap.score
+            }) + "\n"
+
+@router.post("/analyze_skills/batch")
+async def analyze_skills_batch(request: BatchAnalysisRequest):
+    """Analyze skill gaps for many users against many roles; results stream back as NDJSON
+    
+    `user_ids` is a list of user IDs or "all". The user store is read once,
+    and each line holds one user x role analysis, or an error line for an
+    unknown user.
+    """
+    catalog = get_job_service().get_all_roles()
+    unknown = [role for role in request.roles if role not in catalog]
+    if unknown:
+        raise HTTPException(status_code=404, detail=f"Role not found: {', '.join(unknown)}")
+    
+    # Keep only the skill lists, so the rest of the user records can be freed
+    users = await asyncio.to_thread(get_data_store().get_all_users)
+    if request.user_ids == "all":
+        user_skills = {user_id: data.get("skills", []) for user_id, data in users.items()}
+    else:
+        user_skills = {
+            user_id: users[user_id].get("skills", []) if user_id in users else None
+            for user_id in request.user_ids
+        }
+    del users
+    
+    roles = {role: catalog[role] for role in request.roles}
+    return StreamingResponse(_batch_analysis_lines(user_skills, roles), media_type="application/x-ndjson")
+
+@router.get("/best_roles")
+async def best_roles(user_id: str, k: int = 5, weights: Optional[str] = None):
+    """Rank every role by how much of it a user covers, best k first"""
+    if k < 1:
+        raise HTTPException(status_code=400, detail="k must be at least 1")
+    
+    try:
+        from ..services.role_matrix import parse_weights
+        skill_weights = parse_weights(weights)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    try:
+        user_data = get_data_store().get_user_data(user_id)
+        if not user_data:
+            raise HTTPException(status_code=404, detail="User not found")
+        
+        user_skills = user_data.get("skills", [])
+        # A catalog change rebuilds the matrix, which takes seconds on a large catalog
+        ranked = await asyncio.to_thread(get_role_ranker().best_roles, user_skills, k, skill_weights)
+        
+        return {
+            "user_id": user_id,
+            "roles": [
+                {
+                    "role": score.role,
+                    "match_percentage": score.score,
+                    "matched_skills": score.matched,
+                    "missing_skills": score.missing
+                }
+                for score in ranked
+            ]
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error ranking roles: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to rank roles")
+
 @router.get("/roles")
 async def get_roles():
     """Get available job roles"""
     try:
-        roles = job_service.get_available_roles()
+        roles = get_job_service().get_available_roles()
         return {"roles": roles}
     except Exception as e:
         logger.error(f"Error getting roles: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to get roles")
 
+def _skills_param(skills: str) -> List[str]:
+    """Split a comma-separated skills query parameter"""
+    wanted = [skill.strip() for skill in skills.split(",") if skill.strip()]
+    if not wanted:
+        raise HTTPException(status_code=400, detail="skills must name at least one skill")
+    return wanted
+
+@router.get("/roles/search")
+async def search_roles(q: str = "", offset: int = 0, limit: int = 20):
+    """Roles with a title word starting with each word of q, case-insensitive and paginated"""
+    if offset < 0 or not 1 <= limit <= 100:
+        raise HTTPException(status_code=400, detail="offset must be >= 0 and limit between 1 and 100")
+    try:
+        job_service = get_job_service()
+        if job_service.search_ready():
+            page = job_service.search_roles(q, offset, limit)
+        else:
+            # The first index build takes a while on a large catalog; keep it off the event loop
+            page = await asyncio.to_thread(job_service.search_roles, q, offset, limit)
+        return {"query": q, "offset": offset, "limit": limit, "total": page.total, "roles": page.roles}
+    except Exception as e:
+        logger.error(f"Error searching roles: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to search roles")
+
+@router.get("/roles/by_skills")
+async def get_roles_by_skills(skills: str, match: str = "and"):
+    """Roles requiring all (match=and) or any (match=or) of comma-separated skills"""
+    wanted = _skills_param(skills)
+    try:
+        # The lookup may rebuild the index after a catalog change; keep that off the event loop
+        roles = await asyncio.to_thread(get_job_service().get_roles_by_skills, wanted, match)
+        return {"skills": wanted, "match": match, "roles": roles}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error looking up roles by skills: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to look up roles")
+
+@router.get("/users/by_skills")
+async def get_users_by_skills(skills: str, match: str = "and"):
+    """IDs of users with all (match=and) or any (match=or) of comma-separated skills"""
+    wanted = _skills_param(skills)
+    try:
+        # Rebuilding after another process wrote users.json means parsing it
+        user_ids = await asyncio.to_thread(get_data_store().get_users_by_skills, wanted, match)
+        return {"skills": wanted, "match": match, "user_ids": user_ids}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error looking up users by skills: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to look up users")
+
 @router.post("/recommendations")
 async def get_recommendations(request: RecommendationRequest):
     """Get learning recommendations for missing skills"""
     try:
-        recommendations = recommendation_service.get_recommendations(request.missing_skills)
+        recommendations = get_recommendation_service().get_recommendations(request.missing_skills)
         return {"recommendations": recommendations}
     except Exception as e:
         logger.error(f"Error getting recommendations: {str(e)}")
@@ -142,7 +581,7 @@ async def save_learning_plan(request: SavePlanRequest):
     """Save a learning plan for a user"""
     try:
         # Get existing user data
-        user_data = data_store.get_user_data(request.user_id)
+        user_data = get_data_store().get_user_data(request.user_id)
         if not user_data:
             raise HTTPException(status_code=404, detail="User not found")
         
@@ -155,7 +594,7 @@ async def save_learning_plan(request: SavePlanRequest):
         user_data["learning_plans"].append(plan_data)
         
         # Save updated data
-        data_store.save_user_data(request.user_id, user_data)
+        get_data_store().save_user_data(request.user_id, user_data)
         
         return {"message": "Learning plan saved successfully"}
         
@@ -169,7 +608,7 @@ async def save_learning_plan(request: SavePlanRequest):
 async def get_user_data(user_id: str):
     """Get user data and learning plans"""
     try:
-        user_data = data_store.get_user_data(user_id)
+        user_data = get_data_store().get_user_data(user_id)
         if not user_data:
             raise HTTPException(status_code=404, detail="User not found")
         
@@ -178,4 +617,29 @@ async def get_user_data(user_id: str):
         raise
     except Exception as e:
         logger.error(f"Error getting user data: {str(e)}")
-        raise HTTPException(status_code=500, detail="Failed to get user data")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Failed to get user data")
+
+@router.get("/stats")
+async def get_stats():
+    """Get runtime statistics for the processing subsystems"""
+    resume_pipeline = get_resume_pipeline()
+    parse_cache = get_parse_cache()
+    return {
+        "startup": startup_report.snapshot(),
+        "cpu_executor": resume_pipeline.executor.stats(),
+        "parse_cache": parse_cache.stats() if parse_cache else None,
+        "pdf_engines": resume_pipeline.engine_stats.snapshot(),
+        "nlp": resume_pipeline.nlp_stats.snapshot(),
+        "nlp_batcher": resume_pipeline.nlp_batcher.stats(),
+        "stage_timeouts": resume_pipeline.timeouts,
+        "stage_queue_timeouts": resume_pipeline.queue_timeouts,
+        "gap_cache": get_gap_cache().stats(),
+        "fuzzy": get_fuzzy_resolver().stats(),
+        "lite": {
+            "cpu_executor": get_lite_executor().stats(),
+            "pdf_engines": get_lite_pipeline().engine_stats.snapshot(),
+            "nlp": get_lite_pipeline().nlp_stats.snapshot(),
+            "stage_timeouts": get_lite_pipeline().timeouts,
+            "stage_queue_timeouts": get_lite_pipeline().queue_timeouts
+        }
+    }
@@ -0,0 +1,133 @@
+import os
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment"""
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"Invalid integer for {name}: {value!r}, using {default}")
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float setting from the environment"""
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(f"Invalid number for {name}: {value!r}, using {default}")
+        return default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a boolean setting from the environment"""
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# CPU executor (PDF extraction + NLP run in worker processes)
+CPU_POOL_SIZE = max(1, _env_int("SKILLGAP_CPU_POOL_SIZE", max(1, (os.cpu_count() or 2) - 1)))
+CPU_POOL_WARMUP = _env_bool("SKILLGAP_CPU_POOL_WARMUP", True)
+CPU_MAX_IN_FLIGHT = max(1, _env_int("SKILLGAP_CPU_MAX_IN_FLIGHT", CPU_POOL_SIZE * 2))
+
+# Parse cache (keyed by SHA-256 of the uploaded PDF)
+PARSE_CACHE_ENABLED = _env_bool("SKILLGAP_PARSE_CACHE_ENABLED", True)
+PARSE_CACHE_DIR = os.getenv(
+    "SKILLGAP_PARSE_CACHE_DIR",
+    os.path.join(os.path.dirname(__file__), "data", "parse_cache"),
+)
+PARSE_CACHE_MEMORY_ENTRIES = max(1, _env_int("SKILLGAP_PARSE_CACHE_MEMORY_ENTRIES", 256))
+PARSE_CACHE_DISK_BYTES = max(0, _env_int("SKILLGAP_PARSE_CACHE_DISK_BYTES", 256 * 1024 * 1024))
+
+# PDF text extraction engines, tried in order until one passes the quality check
+PDF_ENGINE_ORDER = tuple(
+    name.strip()
+    for name in os.getenv("SKILLGAP_PDF_ENGINE_ORDER", "pymupdf,pdfplumber").split(",")
+    if name.strip()
+)
+PDF_MIN_WORDS_PER_PAGE = max(0, _env_int("SKILLGAP_PDF_MIN_WORDS_PER_PAGE", 25))
+PDF_MAX_BAD_GLYPH_RATIO = min(1.0, max(0.0, _env_float("SKILLGAP_PDF_MAX_BAD_GLYPH_RATIO", 0.02)))
+
+# Long documents: pages are extracted in ranges of PDF_PAGES_PER_CHUNK across
+# workers, and reading stops at PDF_MAX_PAGES pages or PDF_MAX_CHARS characters
+PDF_PAGES_PER_CHUNK = max(1, _env_int("SKILLGAP_PDF_PAGES_PER_CHUNK", 4))
+PDF_MAX_PAGES = max(1, _env_int("SKILLGAP_PDF_MAX_PAGES", 20))
+PDF_MAX_CHARS = max(0, _env_int("SKILLGAP_PDF_MAX_CHARS", 30000))
+
+# Upload ingestion: uploads are read in chunks, rejected past UPLOAD_MAX_BYTES,
+# and spilled to a temp file once they exceed UPLOAD_SPILL_BYTES
+UPLOAD_MAX_BYTES = max(1, _env_int("SKILLGAP_UPLOAD_MAX_BYTES", 5 * 1024 * 1024))
+UPLOAD_SPILL_BYTES = max(0, _env_int("SKILLGAP_UPLOAD_SPILL_BYTES", 1024 * 1024))
+UPLOAD_CHUNK_BYTES = max(1024, _env_int("SKILLGAP_UPLOAD_CHUNK_BYTES", 64 * 1024))
+# Whole-request caps, enforced before the multipart body is parsed: a single
+# upload may carry UPLOAD_MAX_BYTES plus form overhead, a batch or zip upload
+# UPLOAD_BATCH_MAX_BYTES in total
+UPLOAD_MAX_REQUEST_BYTES = max(1, _env_int("SKILLGAP_UPLOAD_MAX_REQUEST_BYTES", UPLOAD_MAX_BYTES + 64 * 1024))
+UPLOAD_BATCH_MAX_BYTES = max(1, _env_int("SKILLGAP_UPLOAD_BATCH_MAX_BYTES", 200 * 1024 * 1024))
+
+# Bulk ingestion (python -m app.ingest and POST /upload_resumes)
+INGEST_BATCH_SIZE = max(1, _env_int("SKILLGAP_INGEST_BATCH_SIZE", 50))
+INGEST_CONCURRENCY = max(1, _env_int("SKILLGAP_INGEST_CONCURRENCY", CPU_MAX_IN_FLIGHT))
+# python -m app.ingest: seconds one PDF may take before its worker is killed (0 disables)
+INGEST_TIMEOUT_S = max(0.0, _env_float("SKILLGAP_INGEST_TIMEOUT_S", 60.0))
+
+# Role and resource catalogs are served from memory; seconds between stat
+# checks of their JSON files for hot reload
+CATALOG_POLL_INTERVAL_S = max(0.0, _env_float("SKILLGAP_CATALOG_POLL_INTERVAL_S", 1.0))
+# Role catalog location; .json, .jsonl or .sqlite (default app/data/roles.json)
+ROLES_FILE = os.getenv("SKILLGAP_ROLES_FILE") or None
+
+# Gap results memoized per (user skill set, role) until the role catalog changes
+GAP_CACHE_SIZE = max(1, _env_int("SKILLGAP_GAP_CACHE_SIZE", 4096))
+
+# Fuzzy skill resolution (analyze_skills?fuzzy=true): minimum trigram cosine
+# similarity to accept a match, candidates considered per lookup, and how
+# many resolved names to remember
+FUZZY_THRESHOLD = min(1.0, max(0.0, _env_float("SKILLGAP_FUZZY_THRESHOLD", 0.6)))
+FUZZY_TOP_K = max(1, _env_int("SKILLGAP_FUZZY_TOP_K", 3))
+FUZZY_CACHE_SIZE = max(1, _env_int("SKILLGAP_FUZZY_CACHE_SIZE", 4096))
+
+# spaCy pipeline profile:
+#   full     - every component over the whole text
+#   ner      - only NER (and what it depends on) over the whole text
+#   windowed - only NER, run on the header (name) and experience section (orgs)
+NLP_PROFILE = os.getenv("SKILLGAP_NLP_PROFILE", "windowed")
+NLP_HEADER_CHARS = max(1, _env_int("SKILLGAP_NLP_HEADER_CHARS", 400))
+NLP_SECTION_MAX_CHARS = max(1, _env_int("SKILLGAP_NLP_SECTION_MAX_CHARS", 5000))
+
+# NLP micro-batching: resumes reaching the NLP stage within NLP_BATCH_MAX_WAIT_MS
+# of each other are grouped (up to NLP_BATCH_MAX_SIZE) into one nlp.pipe call.
+# A max size of 1 disables batching.
+NLP_BATCH_MAX_SIZE = max(1, _env_int("SKILLGAP_NLP_BATCH_MAX_SIZE", 8))
+NLP_BATCH_MAX_WAIT_MS = max(0, _env_int("SKILLGAP_NLP_BATCH_MAX_WAIT_MS", 5))
+NLP_PIPE_BATCH_SIZE = max(1, _env_int("SKILLGAP_NLP_PIPE_BATCH_SIZE", 32))
+NLP_PIPE_N_PROCESS = max(1, _env_int("SKILLGAP_NLP_PIPE_N_PROCESS", 1))
+
+# Lite extraction mode (mode=lite): regex-only, served by its own small pool
+# of workers that never load spaCy, so lite requests never queue behind full
+# NLP jobs
+LITE_POOL_SIZE = max(1, _env_int("SKILLGAP_LITE_POOL_SIZE", 1))
+LITE_MAX_IN_FLIGHT = max(1, _env_int("SKILLGAP_LITE_MAX_IN_FLIGHT", LITE_POOL_SIZE * 2))
+
+# Per-stage time budgets in seconds (0 disables). An extraction or NLP job
+# that overruns is stopped by killing its worker; the response carries the
+# partial result and lists the stage under `truncated`.
+EXTRACTION_TIMEOUT_S = max(0.0, _env_float("SKILLGAP_EXTRACTION_TIMEOUT_S", 20.0))
+NLP_TIMEOUT_S = max(0.0, _env_float("SKILLGAP_NLP_TIMEOUT_S", 10.0))
+STORAGE_TIMEOUT_S = max(0.0, _env_float("SKILLGAP_STORAGE_TIMEOUT_S", 5.0))
+
+# Worker recycling: a parse worker is retired and replaced between jobs after
+# WORKER_MAX_JOBS jobs or once its RSS exceeds WORKER_MAX_RSS_MB (0 disables)
+WORKER_MAX_JOBS = max(0, _env_int("SKILLGAP_WORKER_MAX_JOBS", 500))
+WORKER_MAX_RSS_MB = max(0, _env_int("SKILLGAP_WORKER_MAX_RSS_MB", 1024))
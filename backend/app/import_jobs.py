@@ -0,0 +1,65 @@
+"""Bulk job-description import.
+
+Usage:
+    python -m app.import_jobs <directory or .jsonl> [--roles-file roles.json] [--workers N]
+
+Extracts skills from every job description in a process pool, aggregates
+them per role title and writes the derived requirements to the role catalog
+in a single atomic write. A running server picks the new catalog up without
+a restart.
+"""
+import argparse
+import logging
+import sys
+from typing import List, Optional
+
+from . import config
+from .services.jd_import import import_job_descriptions
+from .services.jobs import JobService
+
+logger = logging.getLogger(__name__)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.import_jobs", description="Derive role skill requirements from job descriptions"
+    )
+    parser.add_argument("source", help="Directory of .txt/.md job descriptions, or a JSONL file")
+    parser.add_argument("--roles-file", default=None, help="Catalog to write (default: the server's roles file)")
+    parser.add_argument("--workers", type=int, default=config.CPU_POOL_SIZE, help="Worker processes")
+    parser.add_argument("--chunk-size", type=int, default=64, help="Job descriptions per worker job")
+    parser.add_argument("--min-share", type=float, default=0.3, help="Share of a role's postings a skill needs")
+    parser.add_argument("--max-skills", type=int, default=15, help="Most skills kept per role")
+    parser.add_argument("--min-postings", type=int, default=1, help="Fewest postings a role needs")
+    parser.add_argument("--replace", action="store_true", help="Drop roles that were not imported")
+    parser.add_argument("--no-recursive", action="store_true", help="Only scan the top-level directory")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+
+    roles_file = args.roles_file or JobService().roles_file
+    try:
+        counts = import_job_descriptions(
+            args.source,
+            roles_file,
+            max_workers=max(1, args.workers),
+            chunk_size=max(1, args.chunk_size),
+            min_share=min(1.0, max(0.0, args.min_share)),
+            max_skills=max(1, args.max_skills),
+            min_postings=max(1, args.min_postings),
+            merge=not args.replace,
+            recursive=not args.no_recursive,
+        )
+    except (OSError, ValueError) as e:
+        logger.error(f"Import failed: {str(e)}")
+        return 1
+
+    logger.info(
+        f"Import finished: {counts['descriptions']} job descriptions, {counts['titles']} titles, "
+        f"{counts['imported']} roles imported, {counts['roles']} roles in {roles_file}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
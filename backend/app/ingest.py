@@ -0,0 +1,57 @@
+"""Bulk resume ingestion.
+
+Usage:
+    python -m app.ingest <directory> [--output results.jsonl] [--workers N]
+
+Parses every PDF under the directory in a process pool, saves the users to
+the JSON store in batches and writes one JSONL record per resume. Re-running
+with the same output file skips resumes that were already parsed and retries
+the ones that failed. A PDF that crashes its worker or runs past --timeout is
+recorded as failed and the run continues.
+"""
+import argparse
+import logging
+import sys
+from typing import List, Optional
+
+from . import config
+from .services.bulk_ingest import ingest_directory
+from .storage.data_store import DataStore
+
+logger = logging.getLogger(__name__)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.ingest", description="Bulk-ingest PDF resumes")
+    parser.add_argument("directory", help="Directory containing PDF resumes")
+    parser.add_argument("--output", default="ingest_results.jsonl", help="JSONL output (also the checkpoint)")
+    parser.add_argument("--target-role", default=None, help="Target role recorded for every user")
+    parser.add_argument("--workers", type=int, default=config.CPU_POOL_SIZE, help="Worker processes")
+    parser.add_argument("--batch-size", type=int, default=config.INGEST_BATCH_SIZE, help="Users per store write")
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint and start over")
+    parser.add_argument("--no-recursive", action="store_true", help="Only scan the top-level directory")
+    parser.add_argument(
+        "--timeout", type=float, default=config.INGEST_TIMEOUT_S, help="Seconds per PDF before giving up (0 disables)"
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+
+    counts = ingest_directory(
+        args.directory,
+        args.output,
+        DataStore(),
+        target_role=args.target_role,
+        max_workers=max(1, args.workers),
+        batch_size=max(1, args.batch_size),
+        resume=not args.restart,
+        recursive=not args.no_recursive,
+        timeout=args.timeout or None,
+    )
+
+    logger.info(f"Ingestion finished: {counts['ok']} parsed, {counts['error']} failed, {counts['skipped']} skipped")
+    return 0 if counts["error"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,24 +2,64 @@ from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
+from contextlib import asynccontextmanager
 from typing import List, Optional
+import asyncio
 import logging
 
-from .api.routes import router
-from .services.parser import ResumeParser
-from .services.nlp import NLPProcessor
-from .services.jobs import JobService
-from .services.recommend import RecommendationService
-from .storage.data_store import DataStore
+from . import config
+from .api.limits import RequestSizeLimit
+from .startup import startup_report, warm_up
+
+with startup_report.timed_import("app.api.routes"):
+    from .api.routes import (
+        router, get_cpu_executor, get_lite_executor, get_resume_pipeline, get_job_service, get_data_store,
+        fuzzy_resolver
+    )
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Serve right away; parse workers spawn and load spaCy in the background
+    startup_report.mark("live")
+    warmup_task = asyncio.create_task(warm_up(get_cpu_executor(), get_resume_pipeline()))
+    # Lite workers skip spaCy and are up within a fraction of a second
+    get_lite_executor().start()
+    # The fuzzy skill index is small; build it off the event loop
+    fuzzy_task = asyncio.create_task(asyncio.to_thread(fuzzy_resolver))
+    # Likewise the role search index, so the first /roles/search does not wait for it
+    search_task = asyncio.create_task(asyncio.to_thread(get_job_service().warm_search))
+    # Skill indexes are kept up to date by each write from here on
+    role_index_task = asyncio.create_task(asyncio.to_thread(get_job_service().warm_skill_index))
+    user_index_task = asyncio.create_task(asyncio.to_thread(get_data_store().warm_skill_index))
+    yield
+    user_index_task.cancel()
+    role_index_task.cancel()
+    search_task.cancel()
+    fuzzy_task.cancel()
+    warmup_task.cancel()
+    get_cpu_executor().shutdown()
+    get_lite_executor().shutdown()
+
 app = FastAPI(
     title="Skill Gap Finder API",
     description="API for analyzing resume skill gaps and providing learning recommendations",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
+)
+
+# Oversized uploads are refused before their multipart body is received. Added
+# before CORS so CORS wraps it and its 413s carry the headers the frontend needs
+app.add_middleware(
+    RequestSizeLimit,
+    limits={
+        "/api/upload_resume": config.UPLOAD_MAX_REQUEST_BYTES,
+        "/api/upload_resumes": config.UPLOAD_BATCH_MAX_BYTES,
+        "/api/upload_zip": config.UPLOAD_BATCH_MAX_BYTES,
+    },
 )
 
 # CORS middleware
@@ -40,7 +80,30 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "message": "API is running"}
+    """Liveness and readiness together; always 200 while the process is up"""
+    report = startup_report.snapshot()
+    return {
+        "status": "healthy",
+        "message": "API is running",
+        "live": True,
+        "ready": report["ready"],
+        "warmup_error": report["warmup_error"]
+    }
+
+@app.get("/health/live")
+async def liveness_check():
+    return {"live": True}
+
+@app.get("/health/ready")
+async def readiness_check():
+    """503 until the background warm-up has completed"""
+    report = startup_report.snapshot()
+    if not report["ready"]:
+        return JSONResponse(
+            status_code=503,
+            content={"ready": False, "warmup_error": report["warmup_error"]}
+        )
+    return {"ready": True, "startup": report}
 
 if __name__ == "__main__":
     uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
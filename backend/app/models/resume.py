@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Literal, Union
 from datetime import datetime
 
 class ContactInfo(BaseModel):
@@ -25,6 +25,7 @@ class ResumeData(BaseModel):
     parsed_text_snippet: str
     target_role: Optional[str] = None
     upload_timestamp: str
+    truncated: List[str] = []
 
 class SkillGapAnalysis(BaseModel):
     user_id: str
@@ -34,6 +35,11 @@ class SkillGapAnalysis(BaseModel):
     matched_skills: List[str]
     missing_skills: List[str]
     match_percentage: float
+    fuzzy_matches: Optional[Dict[str, str]] = None
+
+class BatchAnalysisRequest(BaseModel):
+    user_ids: Union[Literal["all"], List[str]]
+    roles: List[str]
 
 class LearningResource(BaseModel):
     title: str
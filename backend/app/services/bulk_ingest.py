@@ -0,0 +1,302 @@
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .. import config
+from ..storage.data_store import DataStore
+from . import workers
+from .executor import CPUExecutor, JobTimeout
+from .pipeline import build_resume_data
+
+logger = logging.getLogger(__name__)
+
+# End-of-input marker for run_pool, since any item (even None) may be a job's argument
+_END = object()
+
+# Times ingest_results resubmits a job whose deadline passed before it reached a worker
+_QUEUED_RETRIES = 3
+
+
+class UserBatchWriter:
+    """Buffer parsed users and write them to the DataStore in batches"""
+
+    def __init__(self, data_store: DataStore, batch_size: int = 50):
+        self.data_store = data_store
+        self.batch_size = batch_size
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self.saved = 0
+
+    def add(self, user_id: str, data: Dict[str, Any]) -> bool:
+        """Queue a user; returns True when this call flushed a batch"""
+        self._pending[user_id] = data
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+            return True
+        return False
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        if not self.data_store.save_users_batch(self._pending):
+            raise RuntimeError(f"Failed to save batch of {len(self._pending)} users")
+        self.saved += len(self._pending)
+        self._pending = {}
+
+
+def bulk_user_id(sha256: str) -> str:
+    """Deterministic user ID for bulk ingestion, so re-runs overwrite rather than duplicate"""
+    return f"user_{sha256[:12]}"
+
+
+def ingest_record(result: Dict[str, Any], target_role: Optional[str]) -> Dict[str, Any]:
+    """Turn a worker result into a stored user and its JSONL output record.
+
+    Returns the output record; for successful parses it carries the user
+    data under "user" until the caller hands it to a UserBatchWriter.
+    """
+    if result.get("status") != "ok":
+        return {"source": result["source"], "status": "error", "error": result.get("error", "unknown error")}
+
+    user_id = bulk_user_id(result["sha256"])
+    resume_data = build_resume_data(
+        user_id, result["parsed_text"], result["structured_data"], target_role, result.get("truncated")
+    )
+    user = resume_data.dict()
+
+    return {
+        "source": result["source"],
+        "status": "ok",
+        "user_id": user_id,
+        "name": user["name"],
+        "skills": user["skills"],
+        "engine": result.get("extraction", {}).get("engine"),
+        "truncated": user["truncated"],
+        "user": user,
+    }
+
+
+def read_checkpoint(output_path: str) -> Set[str]:
+    """Sources an existing JSONL output records as parsed successfully.
+
+    Failed sources (worker crashes, timeouts, unreadable files) are not
+    counted as done, so a resumed run tries them again.
+    """
+    done: Set[str] = set()
+    if not os.path.exists(output_path):
+        return done
+
+    with open(output_path, "r") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+                if record.get("status") == "ok":
+                    done.add(record["source"])
+            except (json.JSONDecodeError, KeyError, AttributeError):
+                # A torn last line from an interrupted run; that file is redone
+                continue
+    return done
+
+
+def find_pdfs(directory: str, recursive: bool = True) -> List[str]:
+    """PDF files under a directory, in a stable order"""
+    paths = []
+    if recursive:
+        for root, _, files in os.walk(directory):
+            paths.extend(os.path.join(root, name) for name in files if name.lower().endswith(".pdf"))
+    else:
+        paths = [
+            os.path.join(directory, name) for name in os.listdir(directory)
+            if name.lower().endswith(".pdf")
+        ]
+    return sorted(paths)
+
+
+def run_pool(
+    paths: Iterable[Any],
+    max_workers: int,
+    window: int,
+    job: Callable[[Any], Any] = workers.ingest_resume,
+    initializer: Callable[..., None] = workers.init_worker,
+    initargs: Tuple[Any, ...] = (False,),
+) -> Iterator[Any]:
+    """Run job over each item in a process pool, yielding results as they finish.
+
+    Items default to PDF paths parsed by workers.ingest_resume. At most
+    `window` items are submitted at once so memory stays flat no matter how
+    many are queued.
+    """
+    paths = iter(paths)
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=initializer,
+        initargs=initargs,
+    ) as pool:
+        pending = set()
+        for path in paths:
+            pending.add(pool.submit(job, path))
+            if len(pending) >= window:
+                break
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+                next_path = next(paths, _END)
+                if next_path is not _END:
+                    pending.add(pool.submit(job, next_path))
+
+
+async def ingest_results(
+    paths: Iterable[str],
+    max_workers: int,
+    timeout: Optional[float] = None,
+    job: Callable[[str], Dict[str, Any]] = workers.ingest_resume,
+    initializer: Optional[Callable[..., None]] = workers.init_worker,
+    initargs: Tuple[Any, ...] = (False,),
+) -> AsyncIterator[Dict[str, Any]]:
+    """Run job over each path in a CPUExecutor, yielding result records as they finish.
+
+    A path whose worker crashes, or runs past `timeout` seconds and is
+    killed, comes back as an error record; the executor replaces the worker
+    and the rest of the run carries on. Jobs that time out before any worker
+    took them (while workers start up or are replaced) are retried a few times.
+    """
+    executor = CPUExecutor(
+        max_workers=max_workers,
+        max_in_flight=max_workers,
+        initializer=initializer,
+        initargs=initargs,
+        max_jobs_per_worker=config.WORKER_MAX_JOBS,
+        max_worker_rss=config.WORKER_MAX_RSS_MB * 1024 * 1024,
+    )
+
+    async def run(path: str) -> Dict[str, Any]:
+        for attempt in range(_QUEUED_RETRIES + 1):
+            try:
+                return await executor.run(job, path, timeout=timeout)
+            except JobTimeout as e:
+                error = str(e)
+                if e.queued and attempt < _QUEUED_RETRIES:
+                    continue
+            except Exception as e:
+                error = str(e) or type(e).__name__
+            break
+        logger.error(f"Error ingesting {path}: {error}")
+        return {"source": path, "status": "error", "error": error}
+
+    async def jobs():
+        for path in paths:
+            yield run(path)
+
+    executor.start()
+    try:
+        # No more jobs in flight than workers, so a job's deadline is spent running, not queued
+        async for result in bounded_as_completed(jobs(), max_workers):
+            yield result
+    finally:
+        executor.shutdown()
+
+
+def ingest_directory(
+    directory: str,
+    output_path: str,
+    data_store: DataStore,
+    target_role: Optional[str] = None,
+    max_workers: int = 1,
+    batch_size: int = 50,
+    resume: bool = True,
+    recursive: bool = True,
+    timeout: Optional[float] = None,
+) -> Dict[str, int]:
+    """Parse every PDF under a directory into the user store and a JSONL file.
+
+    Output lines are written only after the batch containing them has been
+    saved, so the JSONL file doubles as the checkpoint: on restart, sources
+    already present are skipped. A PDF that crashes its worker or takes
+    longer than `timeout` seconds is recorded as an error and retried by
+    the next resumed run.
+    """
+    return asyncio.run(_ingest_directory(
+        directory, output_path, data_store, target_role, max_workers, batch_size, resume, recursive, timeout
+    ))
+
+
+async def _ingest_directory(
+    directory: str,
+    output_path: str,
+    data_store: DataStore,
+    target_role: Optional[str],
+    max_workers: int,
+    batch_size: int,
+    resume: bool,
+    recursive: bool,
+    timeout: Optional[float],
+) -> Dict[str, int]:
+    directory = os.path.abspath(directory)
+    done = read_checkpoint(output_path) if resume else set()
+    paths = [path for path in find_pdfs(directory, recursive) if path not in done]
+    logger.info(f"Ingesting {len(paths)} PDFs ({len(done)} already done)")
+
+    writer = UserBatchWriter(data_store, batch_size)
+    counts = {"ok": 0, "error": 0, "skipped": len(done)}
+    unflushed: List[Dict[str, Any]] = []
+
+    with open(output_path, "a" if resume else "w") as out:
+        def write_records() -> None:
+            for record in unflushed:
+                out.write(json.dumps(record) + "\n")
+            out.flush()
+            unflushed.clear()
+
+        async for result in ingest_results(paths, max_workers, timeout):
+            record = ingest_record(result, target_role)
+            counts[record["status"]] += 1
+
+            user = record.pop("user", None)
+            unflushed.append(record)
+
+            if user is None:
+                continue
+            if writer.add(user["user_id"], user):
+                write_records()
+
+        writer.flush()
+        write_records()
+
+    return counts
+
+
+async def bounded_as_completed(
+    coroutines: AsyncIterator[Awaitable[Any]],
+    limit: int
+) -> AsyncIterator[Any]:
+    """Await coroutines with at most `limit` running, yielding results as they finish"""
+    pending: Set[asyncio.Task] = set()
+    exhausted = False
+    iterator = coroutines.__aiter__()
+
+    try:
+        while True:
+            while not exhausted and len(pending) < limit:
+                try:
+                    coroutine = await iterator.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending.add(asyncio.ensure_future(coroutine))
+
+            if not pending:
+                return
+
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        # The consumer went away (e.g. client disconnected): stop outstanding work
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,158 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Callable, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def write_json_atomic(path: str, data: Any, indent: int = 2) -> None:
+    """Write JSON to a temp file beside path, then rename it over path.
+
+    Readers see either the old file or the new one, never a half-written
+    one, and a crash mid-write leaves the old file intact.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=indent)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _load_json(path: str) -> Any:
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def freeze(value: Any) -> Any:
+    """Read-only copy of parsed JSON: dicts become mapping proxies, lists tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Plain, mutable JSON structures from a frozen value, safe to hand out"""
+    if isinstance(value, MappingProxyType):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+class CatalogSnapshot(NamedTuple):
+    version: str
+    data: Any
+    # For a snapshot installed by update(): the version it was derived from,
+    # or None when the file had changed on disk since that version was loaded
+    base: Optional[str] = None
+
+
+class JsonCatalog:
+    """A catalog file served from an immutable in-memory snapshot.
+
+    The file is JSON unless a load/dump pair says otherwise. Readers get
+    the current snapshot without touching the disk; at most once per
+    poll_interval a read also stats the file, and a changed (mtime, size)
+    stamp loads and freezes the new contents and swaps them in with a
+    single assignment, so a reader holds either the old snapshot or the new
+    one. update() writes through dump (write_json_atomic by default) and
+    installs its result directly. A file that fails to parse (for instance
+    while an editor is saving it non-atomically) keeps the previous snapshot.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fallback: Optional[Callable[[], Any]] = None,
+        poll_interval: float = 1.0,
+        load: Optional[Callable[[str], Any]] = None,
+        dump: Optional[Callable[[str, Any], None]] = None,
+    ):
+        self.path = path
+        self.fallback = fallback or dict
+        self.poll_interval = max(0.0, poll_interval)
+        self.load = load or _load_json
+        self.dump = dump or write_json_atomic
+
+        self._lock = threading.Lock()
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._stamp = None
+        self._checked = 0.0
+        self._generation = 0
+        self.reloads = 0
+
+    def _file_stamp(self) -> Optional[tuple]:
+        try:
+            stat = os.stat(self.path)
+            return (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+
+    def snapshot(self) -> CatalogSnapshot:
+        snapshot = self._snapshot
+        if snapshot is not None and time.monotonic() - self._checked < self.poll_interval:
+            return snapshot
+
+        with self._lock:
+            self._checked = time.monotonic()
+            stamp = self._file_stamp()
+            if self._snapshot is not None and stamp == self._stamp:
+                return self._snapshot
+
+            if stamp is None:
+                data = self.fallback()
+            else:
+                try:
+                    data = self.load(self.path)
+                except Exception as e:
+                    logger.error(f"Error reading {self.path}: {str(e)}")
+                    if self._snapshot is not None:
+                        return self._snapshot
+                    data = self.fallback()
+
+            return self._install(data, stamp)
+
+    @property
+    def data(self) -> Any:
+        return self.snapshot().data
+
+    @property
+    def version(self) -> str:
+        return self.snapshot().version
+
+    def update(self, mutate: Callable[[Any], None]) -> CatalogSnapshot:
+        """Apply mutate() to a fresh copy of the file's contents and write it back atomically"""
+        with self._lock:
+            current = self._snapshot
+            unchanged = current is not None and self._file_stamp() == self._stamp
+            data = self.load(self.path) if os.path.exists(self.path) else self.fallback()
+            mutate(data)
+            self.dump(self.path, data)
+            self._checked = time.monotonic()
+            return self._install(data, self._file_stamp(), current.version if unchanged else None)
+
+    def _install(self, data: Any, stamp: Optional[tuple], base: Optional[str] = None) -> CatalogSnapshot:
+        # The generation moves on every load, so the version changes even
+        # when a rewrite keeps the file's mtime and size
+        self._generation += 1
+        self.reloads += 1
+        self._snapshot = CatalogSnapshot(f"{self._generation}-{stamp[0] if stamp else 0}", freeze(data), base)
+        self._stamp = stamp
+        return self._snapshot
@@ -0,0 +1,476 @@
+import asyncio
+import atexit
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class JobTimeout(TimeoutError):
+    """A job missed its deadline; if it had started, its worker was killed and replaced
+
+    `queued` is True when the deadline passed before any worker took the job.
+    """
+
+    def __init__(self, message: str, queued: bool = False):
+        super().__init__(message)
+        self.queued = queued
+
+
+class WorkerCrashed(RuntimeError):
+    """The worker process running a job died before replying"""
+
+
+def _rss_bytes() -> Optional[int]:
+    """Resident set size of this process, or its peak where that is all the OS offers"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _mb(size: Optional[int]) -> Optional[float]:
+    return None if size is None else round(size / (1024 * 1024), 1)
+
+
+# The worker's end of its pipe, for report_progress
+_progress_conn = None
+
+
+def report_progress(value: Any) -> None:
+    """From inside a job: send an interim result to the caller's on_progress.
+
+    A no-op outside an executor worker, so job functions can call it
+    unconditionally.
+    """
+    if _progress_conn is not None:
+        _progress_conn.send(("progress", value, None))
+
+
+def _worker_main(conn, initializer: Optional[Callable[..., None]], initargs: Tuple[Any, ...]) -> None:
+    """Worker loop: run (fn, args) requests from the pipe until told to stop"""
+    global _progress_conn
+    _progress_conn = conn
+
+    if initializer is not None:
+        try:
+            initializer(*initargs)
+        except BaseException as e:
+            logger.error(f"CPU worker initializer failed: {str(e)}")
+            return
+
+    # The parent hands out no jobs until it sees this
+    conn.send(("ready", None, _rss_bytes()))
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            return
+        if message is None:
+            return
+
+        fn, args = message
+        try:
+            status, value = "ok", fn(*args)
+        except BaseException as e:
+            status, value = "error", e
+
+        # Every reply carries the worker's RSS so the parent can recycle it
+        try:
+            conn.send((status, value, _rss_bytes()))
+        except Exception as e:
+            # Result or exception could not be pickled
+            conn.send(("error", RuntimeError(f"{type(e).__name__}: {str(e)}"), _rss_bytes()))
+
+
+class _Worker:
+    """One worker process and the parent's end of its pipe"""
+
+    def __init__(self, context, initializer: Optional[Callable[..., None]], initargs: Tuple[Any, ...]):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn, initializer, initargs))
+        self.process.start()
+        # Only the child holds its end now, so recv() sees EOF if it dies
+        child_conn.close()
+        self.ready = False
+        self.jobs = 0
+        self.rss: Optional[int] = None
+        self.peak_rss: Optional[int] = None
+
+    def record_rss(self, rss: Optional[int]) -> None:
+        if rss is None:
+            return
+        self.rss = rss
+        self.peak_rss = max(self.peak_rss or 0, rss)
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.process.pid
+
+    def alive(self) -> bool:
+        return self.process.is_alive()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=5)
+
+    def stop(self, timeout: float) -> None:
+        """Ask the worker to exit after its current job, killing it past the timeout"""
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=timeout)
+        self.kill()
+        self.conn.close()
+
+
+class CPUExecutor:
+    """Process pool for CPU-bound work that must stay off the event loop.
+
+    Each worker is a spawned process with its own pipe, so a job that
+    overruns its timeout can be stopped by killing exactly the worker running
+    it; a fresh worker takes its place.
+
+    A new worker joins the idle pool only once its initializer has finished
+    and it has said so over its pipe, so a job never waits out a model load
+    against its own deadline.
+
+    Workers report their RSS with every result. A worker that has run
+    max_jobs_per_worker jobs or grown past max_worker_rss bytes is retired
+    once its current job is done and replaced (0 disables either limit).
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_in_flight: int,
+        initializer: Optional[Callable[..., None]] = None,
+        initargs: Tuple[Any, ...] = (),
+        max_jobs_per_worker: int = 0,
+        max_worker_rss: int = 0,
+    ):
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight
+        self.initializer = initializer
+        self.initargs = initargs
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.max_worker_rss = max_worker_rss
+
+        # Spawn rather than fork: the parent runs an event loop and threads,
+        # and workers only need to import the parsing modules.
+        self._context = multiprocessing.get_context("spawn")
+        self._workers: List[_Worker] = []
+        self._idle: Optional[asyncio.Queue] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._reclaiming: Set[asyncio.Future] = set()
+        self._starting: Set[asyncio.Future] = set()
+        self._atexit_registered = False
+
+        self._in_flight = 0
+        self._waiting = 0
+        self._completed = 0
+        self._failed = 0
+        self._timeouts = 0
+        self._queue_timeouts = 0
+        self._crashes = 0
+        self._init_failures = 0
+        self._replaced = 0
+        self._recycled = {"jobs": 0, "memory": 0}
+        self._recycle_events: Deque[Dict[str, Any]] = deque(maxlen=20)
+        self._peak_rss: Optional[int] = None
+        self._retiring: Set[asyncio.Future] = set()
+
+    def start(self) -> None:
+        """Spawn every worker up front so initializers (and warm-up) run before real traffic"""
+        if self._idle is not None:
+            return
+
+        self._idle = asyncio.Queue()
+        self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        # One thread per worker waits on its pipe
+        self._threads = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="cpu-executor")
+        for _ in range(self.max_workers):
+            self._spawn()
+
+        if not self._atexit_registered:
+            atexit.register(self.shutdown, False)
+            self._atexit_registered = True
+
+        logger.info(f"CPU executor started with {self.max_workers} workers")
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers"""
+        if self._idle is None:
+            return
+
+        self._idle = None
+        for task in self._starting:
+            task.cancel()
+        for worker in self._workers:
+            worker.stop(timeout=5 if wait else 0)
+        self._workers = []
+        self._threads.shutdown(wait=False)
+        self._threads = None
+        logger.info("CPU executor stopped")
+
+    def _spawn(self) -> _Worker:
+        """Start a worker; it is queued as idle once it reports ready"""
+        worker = _Worker(self._context, self.initializer, self.initargs)
+        self._workers.append(worker)
+        task = asyncio.ensure_future(self._admit(worker))
+        self._starting.add(task)
+        task.add_done_callback(self._starting.discard)
+        return worker
+
+    async def _admit(self, worker: _Worker) -> None:
+        """Wait for a new worker's ready message, then make it available"""
+        try:
+            status, _, rss = await asyncio.get_running_loop().run_in_executor(self._threads, worker.conn.recv)
+        except (EOFError, OSError):
+            status, rss = None, None
+
+        if self._idle is None or worker not in self._workers:
+            return
+        if status != "ready":
+            # The initializer failed; back off so a broken setup does not spin
+            self._init_failures += 1
+            logger.error(f"Worker {worker.pid} exited during initialization; respawning")
+            await asyncio.sleep(1.0)
+            await self._discard(worker)
+            return
+
+        worker.ready = True
+        worker.record_rss(rss)
+        self._idle.put_nowait(worker)
+
+    async def _discard(self, worker: _Worker, reply: Optional[asyncio.Future] = None) -> None:
+        """Kill a worker, wait for its pipe reader to notice, and spawn a replacement"""
+        await asyncio.to_thread(worker.kill)
+        if reply is not None:
+            await asyncio.gather(reply, return_exceptions=True)
+        worker.conn.close()
+
+        if worker in self._workers:
+            self._workers.remove(worker)
+        self._replaced += 1
+        if self._idle is not None:
+            self._spawn()
+
+    async def _reclaim(self, worker: _Worker, reply: asyncio.Future) -> None:
+        """Return a worker to the pool once the job its caller abandoned finishes"""
+        try:
+            status, _, rss = await reply
+            while status == "progress":
+                reply = asyncio.get_running_loop().run_in_executor(self._threads, worker.conn.recv)
+                status, _, rss = await reply
+        except Exception:
+            await self._discard(worker)
+            return
+        self._release(worker, rss)
+
+    def _release(self, worker: _Worker, rss: Optional[int]) -> None:
+        """Return a worker that finished a job to the pool, or retire it"""
+        worker.jobs += 1
+        worker.record_rss(rss)
+        if rss is not None:
+            self._peak_rss = max(self._peak_rss or 0, rss)
+
+        if self._idle is None:
+            return
+
+        reason = self._recycle_reason(worker)
+        if reason is None:
+            self._idle.put_nowait(worker)
+            return
+
+        # The worker is between jobs, so nothing is in flight on it: start
+        # its replacement, then let it exit
+        self._recycled[reason] += 1
+        self._recycle_events.append({
+            "pid": worker.pid,
+            "reason": reason,
+            "jobs": worker.jobs,
+            "rss_mb": _mb(worker.rss),
+            "at": time.time(),
+        })
+        logger.info(f"Recycling worker {worker.pid} ({reason}: {worker.jobs} jobs, {_mb(worker.rss)}MB RSS)")
+
+        self._workers.remove(worker)
+        self._spawn()
+        task = asyncio.ensure_future(asyncio.to_thread(worker.stop, 5))
+        self._retiring.add(task)
+        task.add_done_callback(self._retiring.discard)
+
+    def _recycle_reason(self, worker: _Worker) -> Optional[str]:
+        if self.max_worker_rss and worker.rss is not None and worker.rss > self.max_worker_rss:
+            return "memory"
+        if self.max_jobs_per_worker and worker.jobs >= self.max_jobs_per_worker:
+            return "jobs"
+        return None
+
+    async def _acquire_worker(self, timeout: Optional[float]) -> _Worker:
+        worker = await asyncio.wait_for(self._idle.get(), timeout)
+        if not worker.alive():
+            # Died while idle (e.g. killed by the OOM killer)
+            self._crashes += 1
+            await self._discard(worker)
+            return await asyncio.wait_for(self._idle.get(), timeout)
+        return worker
+
+    async def run(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = None,
+        on_progress: Optional[Callable[[Any], None]] = None,
+    ) -> Any:
+        """Run fn(*args) in a worker process, bounded by max_in_flight.
+
+        With a timeout, raises JobTimeout once it expires; time spent queued
+        counts against it, and a job already running is stopped by killing
+        its worker. Expiry while still queued is counted apart, under
+        queue_timeouts. Values the job passes to report_progress() are handed
+        to on_progress on the event loop as they arrive, so a caller can keep
+        partial output from a job that is later killed.
+        """
+        if self._idle is None:
+            self.start()
+
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        def remaining() -> Optional[float]:
+            return None if deadline is None else max(0.0, deadline - loop.time())
+
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), remaining())
+        except asyncio.TimeoutError:
+            self._queue_timeouts += 1
+            raise JobTimeout(f"{fn.__name__} timed out after {timeout:.1f}s waiting for a worker", queued=True)
+        finally:
+            self._waiting -= 1
+
+        self._in_flight += 1
+        try:
+            try:
+                worker = await self._acquire_worker(remaining())
+            except asyncio.TimeoutError:
+                self._queue_timeouts += 1
+                raise JobTimeout(f"{fn.__name__} timed out after {timeout:.1f}s waiting for a worker", queued=True)
+            return await self._call(worker, fn, args, remaining(), timeout, on_progress)
+        finally:
+            self._in_flight -= 1
+            self._semaphore.release()
+
+    async def _call(
+        self,
+        worker: _Worker,
+        fn: Callable[..., Any],
+        args: Tuple[Any, ...],
+        remaining: Optional[float],
+        timeout: Optional[float],
+        on_progress: Optional[Callable[[Any], None]] = None,
+    ) -> Any:
+        try:
+            worker.conn.send((fn, args))
+        except (OSError, EOFError) as e:
+            self._crashes += 1
+            self._failed += 1
+            await self._discard(worker)
+            raise WorkerCrashed(f"Worker {worker.pid} is gone: {str(e)}")
+        except Exception:
+            # Arguments could not be pickled; the worker never saw the job
+            self._idle.put_nowait(worker)
+            self._failed += 1
+            raise
+
+        loop = asyncio.get_running_loop()
+        deadline = None if remaining is None else loop.time() + remaining
+        try:
+            while True:
+                reply = loop.run_in_executor(self._threads, worker.conn.recv)
+                left = None if deadline is None else max(0.0, deadline - loop.time())
+                status, value, rss = await asyncio.wait_for(asyncio.shield(reply), left)
+                if status != "progress":
+                    break
+                if on_progress is not None:
+                    on_progress(value)
+        except asyncio.TimeoutError:
+            self._timeouts += 1
+            self._failed += 1
+            logger.warning(f"{fn.__name__} exceeded {timeout:.1f}s; replacing worker {worker.pid}")
+            await self._discard(worker, reply)
+            raise JobTimeout(f"{fn.__name__} timed out after {timeout:.1f}s")
+        except asyncio.CancelledError:
+            # The caller went away mid-job: keep the worker once it is done
+            task = asyncio.ensure_future(self._reclaim(worker, reply))
+            self._reclaiming.add(task)
+            task.add_done_callback(self._reclaiming.discard)
+            raise
+        except (EOFError, OSError) as e:
+            self._crashes += 1
+            self._failed += 1
+            await self._discard(worker)
+            raise WorkerCrashed(f"Worker {worker.pid} died running {fn.__name__}: {str(e) or type(e).__name__}")
+
+        self._release(worker, rss)
+
+        if status == "error":
+            self._failed += 1
+            raise value
+        self._completed += 1
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        """Current pool occupancy and counters"""
+        return {
+            "running": self._idle is not None,
+            "workers": self.max_workers,
+            "workers_alive": sum(1 for worker in self._workers if worker.alive()),
+            "workers_starting": sum(1 for worker in self._workers if not worker.ready),
+            "max_in_flight": self.max_in_flight,
+            "in_flight": self._in_flight,
+            "waiting": self._waiting,
+            "completed": self._completed,
+            "failed": self._failed,
+            "timeouts": self._timeouts,
+            "queue_timeouts": self._queue_timeouts,
+            "crashes": self._crashes,
+            "init_failures": self._init_failures,
+            "workers_replaced": self._replaced,
+            "recycled": dict(self._recycled),
+            "recycle_events": list(self._recycle_events),
+            "memory": {
+                "max_worker_rss_mb": _mb(self.max_worker_rss) if self.max_worker_rss else None,
+                "peak_rss_mb": _mb(self._peak_rss),
+                "workers": [
+                    {
+                        "pid": worker.pid,
+                        "jobs": worker.jobs,
+                        "rss_mb": _mb(worker.rss),
+                        "peak_rss_mb": _mb(worker.peak_rss),
+                    }
+                    for worker in self._workers
+                ],
+            },
+        }
@@ -0,0 +1,225 @@
+import heapq
+import logging
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .skill_matcher import normalize_keyword
+from .taxonomy import SkillTaxonomy, shared_taxonomy
+
+logger = logging.getLogger(__name__)
+
+
+class FuzzyCandidate(NamedTuple):
+    skill: str
+    score: float
+
+
+class _TrigramIndex(NamedTuple):
+    display: Dict[str, str]
+    terms: List[str]
+    postings: Dict[str, List[Tuple[int, float]]]
+    idf: Dict[str, float]
+    unseen_idf: float
+
+
+def char_ngrams(text: str, n: int = 3) -> Dict[str, int]:
+    """Counts of character n-grams of a normalized term, padded so word edges count"""
+    padded = f" {text} "
+    counts: Dict[str, int] = {}
+    for start in range(max(1, len(padded) - n + 1)):
+        gram = padded[start:start + n]
+        counts[gram] = counts.get(gram, 0) + 1
+    return counts
+
+
+class FuzzyResolver:
+    """Resolve near-miss skill names to the nearest known skill.
+
+    Every catalog skill and taxonomy alias is indexed once as a sparse
+    TF-IDF vector of character trigrams, stored as an inverted index from
+    trigram to (term, weight) postings. A lookup walks only the postings of
+    the query's own trigrams to accumulate cosine similarities, scores each
+    skill by its best-matching name or alias, keeps the top k and accepts
+    the best one above the threshold. Resolutions, including misses, are
+    cached until the catalog changes. A changed catalog is indexed on a
+    background thread while lookups keep using the previous index.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.6,
+        top_k: int = 3,
+        max_cached: int = 4096,
+        n: int = 3,
+        taxonomy: Optional[SkillTaxonomy] = None,
+    ):
+        self.threshold = threshold
+        self.top_k = max(1, top_k)
+        self.max_cached = max(1, max_cached)
+        self.n = n
+        self.taxonomy = taxonomy or shared_taxonomy()
+
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._stamp = None
+        self._built = False
+        self._building = False
+        # Swapped as a whole on refresh, so lookups never see a half-built index
+        self._index = _TrigramIndex({}, [], {}, {}, 0.0)
+        self._resolved: "OrderedDict[str, Optional[FuzzyCandidate]]" = OrderedDict()
+
+        self._hits = 0
+        self._misses = 0
+        self._fuzzy_matches = 0
+
+    def refresh(self, stamp, load: Callable[[], Iterable[str]]) -> None:
+        """Bring the index up to this stamp.
+
+        The first call builds it in place. After that, a new stamp is built
+        on a background thread while lookups keep using the previous index,
+        which is swapped out (and the resolution cache cleared) once ready.
+        """
+        if self._built:
+            if stamp != self._stamp:
+                self._rebuild(stamp, load)
+            return
+
+        with self._build_lock:
+            if not self._built:
+                self._swap(stamp, self._build(load))
+
+    def ready(self) -> bool:
+        """Whether an index exists, so refresh will not block on a build"""
+        return self._built
+
+    def _rebuild(self, stamp, load: Callable[[], Iterable[str]]) -> None:
+        with self._lock:
+            if self._building:
+                return
+            self._building = True
+
+        def build():
+            try:
+                self._swap(stamp, self._build(load))
+            except Exception as e:
+                logger.error(f"Error building fuzzy skill index: {str(e)}")
+            finally:
+                self._building = False
+
+        threading.Thread(target=build, name="fuzzy-skill-index", daemon=True).start()
+
+    def _swap(self, stamp, index: _TrigramIndex) -> None:
+        with self._lock:
+            self._index = index
+            self._resolved.clear()
+            self._stamp = stamp
+            self._built = True
+
+    def _build(self, load: Callable[[], Iterable[str]]) -> _TrigramIndex:
+        """Trigram index over load() and the taxonomy"""
+        display: Dict[str, str] = {}
+        for term in self.taxonomy.terms():
+            display[term] = self.taxonomy.canonical(term)
+        for skill in load():
+            display.setdefault(normalize_keyword(skill), skill)
+
+        terms = list(display)
+        grams = [char_ngrams(term, self.n) for term in terms]
+        df: Dict[str, int] = {}
+        for counts in grams:
+            for gram in counts:
+                df[gram] = df.get(gram, 0) + 1
+        idf = {gram: math.log(1 + len(terms) / count) for gram, count in df.items()}
+
+        postings: Dict[str, List[Tuple[int, float]]] = {}
+        for index, counts in enumerate(grams):
+            vector = self._normalize(counts, idf)
+            for gram, weight in vector.items():
+                postings.setdefault(gram, []).append((index, weight))
+
+        # Trigrams no known skill has still count against a query's norm,
+        # so "docker compose" is not a perfect match for "docker"
+        return _TrigramIndex(display, terms, postings, idf, math.log(1 + len(terms)))
+
+    @staticmethod
+    def _normalize(counts: Dict[str, int], idf: Dict[str, float], unseen_idf: float = 0.0) -> Dict[str, float]:
+        vector = {gram: count * idf.get(gram, unseen_idf) for gram, count in counts.items()}
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        return {gram: weight / norm for gram, weight in vector.items()} if norm else {}
+
+    def candidates(self, skill: str, k: Optional[int] = None) -> List[FuzzyCandidate]:
+        """The k known skills most similar to a name, best first"""
+        return self._candidates(self._index, skill, k)
+
+    def _candidates(self, index: _TrigramIndex, skill: str, k: Optional[int]) -> List[FuzzyCandidate]:
+        query = self._normalize(char_ngrams(normalize_keyword(skill), self.n), index.idf, index.unseen_idf)
+        scores: Dict[int, float] = {}
+        for gram, weight in query.items():
+            for term, term_weight in index.postings.get(gram, ()):
+                scores[term] = scores.get(term, 0.0) + weight * term_weight
+
+        # Aliases of one skill are separate terms; a skill scores as its best-matching name
+        by_skill: Dict[str, float] = {}
+        for term, score in scores.items():
+            name = index.display[index.terms[term]]
+            if score > by_skill.get(name, 0.0):
+                by_skill[name] = score
+
+        best = heapq.nlargest(k or self.top_k, by_skill.items(), key=lambda item: item[1])
+        return [FuzzyCandidate(name, round(score, 3)) for name, score in best]
+
+    def resolve(self, skill: str) -> Tuple[str, Optional[FuzzyCandidate]]:
+        """A skill as the catalog names it, plus the fuzzy match when one was needed"""
+        key = normalize_keyword(skill)
+        index = self._index
+        display = index.display.get(key)
+        if display is not None:
+            return display, None
+
+        with self._lock:
+            if key in self._resolved:
+                self._resolved.move_to_end(key)
+                self._hits += 1
+                match = self._resolved[key]
+                return (match.skill if match else skill), match
+            self._misses += 1
+
+        found = self._candidates(index, skill, None)
+        match = found[0] if found and found[0].score >= self.threshold else None
+
+        with self._lock:
+            # A refresh since the lookup started cleared the cache; don't refill it from the old index
+            if self._index is index:
+                self._resolved[key] = match
+                if len(self._resolved) > self.max_cached:
+                    self._resolved.popitem(last=False)
+            if match is not None:
+                self._fuzzy_matches += 1
+        return (match.skill if match else skill), match
+
+    def resolve_all(self, skills: Iterable[str]) -> Tuple[List[str], Dict[str, str]]:
+        """Resolved skills, and which input names were matched fuzzily to what"""
+        resolved: List[str] = []
+        matches: Dict[str, str] = {}
+        for skill in skills:
+            name, match = self.resolve(skill)
+            resolved.append(name)
+            if match is not None:
+                matches[skill] = match.skill
+        return resolved, matches
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "threshold": self.threshold,
+                "terms": len(self._index.terms),
+                "trigrams": len(self._index.postings),
+                "cached": len(self._resolved),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+                "fuzzy_matches": self._fuzzy_matches,
+            }
@@ -0,0 +1,205 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from .skill_matcher import normalize_keyword
+from .taxonomy import SkillTaxonomy, shared_taxonomy
+
+
+class SkillVocabulary:
+    """Interns skills into dense integer IDs by canonical taxonomy ID, so aliases share a bit"""
+
+    def __init__(self, taxonomy: Optional[SkillTaxonomy] = None):
+        self.taxonomy = taxonomy or SkillTaxonomy()
+        self._lock = threading.Lock()
+        self._ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def intern(self, skill: str) -> int:
+        key = self.taxonomy.key(skill)
+        skill_id = self._ids.get(key)
+        if skill_id is None:
+            with self._lock:
+                skill_id = self._ids.setdefault(key, len(self._ids))
+        return skill_id
+
+    def get(self, skill: str) -> Optional[int]:
+        return self._ids.get(self.taxonomy.key(skill))
+
+    def mask(self, skills: Iterable[str]) -> int:
+        """Bitset of already-interned skills; unknown skills cannot match anything and are skipped"""
+        return self.mask_keys(self.taxonomy.key(skill) for skill in skills)
+
+    def mask_keys(self, keys: Iterable[str]) -> int:
+        """Bitset of already-interned canonical IDs"""
+        bits = 0
+        for key in keys:
+            skill_id = self._ids.get(key)
+            if skill_id is not None:
+                bits |= 1 << skill_id
+        return bits
+
+
+class RoleProfile(NamedTuple):
+    skills: Tuple[str, ...]
+    bits: Tuple[int, ...]
+    mask: int
+
+
+class GapResult(NamedTuple):
+    matched: List[str]
+    missing: List[str]
+    match_percentage: float
+
+
+class GapEngine:
+    """Skill gap analysis over bitsets of interned skill IDs.
+
+    A role's required skills are interned once into a bitset (cached per
+    skill list); a user's skills, expanded through the taxonomy with every
+    skill they imply, become a bitset by dictionary lookups.
+    Matched and missing skills are then `role & user` and `role & ~user`,
+    and the match percentage is a popcount ratio, so the cost of a check no
+    longer grows with the product of the two list sizes.
+    """
+
+    def __init__(self, vocabulary: Optional[SkillVocabulary] = None, max_roles: int = 1024):
+        self.vocabulary = vocabulary or SkillVocabulary(shared_taxonomy())
+        self.taxonomy = self.vocabulary.taxonomy
+        self.max_roles = max_roles
+        self._roles: "OrderedDict[Tuple[str, ...], RoleProfile]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def role_profile(self, required_skills: Sequence[str]) -> RoleProfile:
+        """Interned bitset for a role's skill list; duplicates by case or alias are dropped"""
+        key = tuple(required_skills)
+        with self._lock:
+            profile = self._roles.get(key)
+            if profile is not None:
+                self._roles.move_to_end(key)
+                return profile
+
+        skills: List[str] = []
+        bits: List[int] = []
+        mask = 0
+        for skill in key:
+            bit = 1 << self.vocabulary.intern(skill)
+            if mask & bit:
+                continue
+            mask |= bit
+            skills.append(skill)
+            bits.append(bit)
+        profile = RoleProfile(tuple(skills), tuple(bits), mask)
+
+        with self._lock:
+            self._roles[key] = profile
+            if len(self._roles) > self.max_roles:
+                self._roles.popitem(last=False)
+        return profile
+
+    def required(self, required_skills: Sequence[str]) -> List[str]:
+        """A role's skill list as analysis counts it, to report next to a match percentage.
+
+        Skills that repeat one another by case or alias count once, under the
+        first name listed.
+        """
+        return list(self.role_profile(required_skills).skills)
+
+    def user_mask(self, user_skills: Iterable[str]) -> int:
+        """Bitset of a user's skills and every skill they imply"""
+        return self.vocabulary.mask_keys(self.taxonomy.expand_keys(user_skills))
+
+    def analyze(self, user_skills: Iterable[str], required_skills: Sequence[str]) -> GapResult:
+        """Matched and missing required skills (in role order) and the match percentage"""
+        role = self.role_profile(required_skills)
+        return self.analyze_masks(self.user_mask(user_skills), role)
+
+    def analyze_masks(self, user: int, role: RoleProfile) -> GapResult:
+        if not role.skills:
+            return GapResult([], [], 0)
+
+        matched_mask = role.mask & user
+        missing_mask = role.mask & ~user
+        matched = [skill for skill, bit in zip(role.skills, role.bits) if matched_mask & bit]
+        missing = [skill for skill, bit in zip(role.skills, role.bits) if missing_mask & bit]
+        return GapResult(matched, missing, matched_mask.bit_count() / len(role.skills) * 100)
+
+
+def skills_key(skills: Iterable[str], key: Callable[[str], str] = normalize_keyword) -> str:
+    """Hash of a skill set, insensitive to order, case, whitespace and duplicates"""
+    normalized = sorted({key(skill) for skill in skills})
+    return hashlib.sha1("\n".join(normalized).encode("utf-8")).hexdigest()
+
+
+class GapCache:
+    """Bounded LRU of gap results keyed by (user skill set, role, catalog version).
+
+    A result only changes when the catalog does, so entries are valid until
+    the version moves on; the first lookup under a new version drops every
+    entry cached under the old one.
+    """
+
+    def __init__(self, engine: Optional[GapEngine] = None, max_entries: int = 4096):
+        self.engine = engine or shared_engine()
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[Tuple[str, str], GapResult]" = OrderedDict()
+        self._version: Optional[str] = None
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def analyze(
+        self, user_skills: Sequence[str], role: str, required_skills: Sequence[str], version: str
+    ) -> GapResult:
+        key = (skills_key(user_skills, self.engine.taxonomy.key), role)
+        with self._lock:
+            if version != self._version:
+                if self._entries:
+                    self._invalidations += 1
+                self._entries.clear()
+                self._version = version
+
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return result
+            self._misses += 1
+
+        result = self.engine.analyze(user_skills, required_skills)
+
+        with self._lock:
+            # The catalog may have moved on while this result was computed
+            if version == self._version:
+                self._entries[key] = result
+                if len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "catalog_version": self._version,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+            }
+
+
+@lru_cache(maxsize=None)
+def shared_engine() -> GapEngine:
+    """Process-wide gap engine, so every code path interns into one vocabulary"""
+    return GapEngine()
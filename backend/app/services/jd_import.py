@@ -0,0 +1,222 @@
+"""Derive role skill requirements from raw job descriptions.
+
+Job descriptions come from a directory of text files (the first non-empty
+line is the title) or a JSONL file of `{"title": ..., "description": ...}`
+records. Skills are extracted in a process pool with the same keyword
+matcher resumes go through, counted per normalized role title, and the
+skills that enough of a title's postings ask for become its requirements.
+The resulting catalog is written once, atomically, in whichever format the
+roles file's extension names.
+"""
+import json
+import logging
+import os
+import re
+from collections import Counter
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple
+
+from . import workers
+from .bulk_ingest import run_pool
+from .role_search import tokenize
+from .role_sources import load_roles, save_roles
+from .taxonomy import shared_taxonomy
+
+logger = logging.getLogger(__name__)
+
+JD_EXTENSIONS = (".txt", ".md")
+
+# Postings for "Senior Data Engineer" and "Data Engineer II" describe the same role
+_SENIORITY = re.compile(r"\b(?:senior|sr|junior|jr|entry[- ]level|mid[- ]level)\b\.?", re.IGNORECASE)
+# Roman numerals count as a level only at the very end ("Director of I.T." keeps its I)
+_LEVEL = re.compile(r"\s+(?:i{1,3}|iv)$", re.IGNORECASE)
+# Qualifiers: "Data Engineer - Remote", "Data Engineer | Berlin", "Data Engineer (Contract)";
+# a slash is part of the title ("CI / CD Engineer")
+_QUALIFIER = re.compile(r"\s+[-–|]\s+.*$|\s*\(.*?\)")
+
+
+class JobDescription(NamedTuple):
+    title: str
+    text: str
+
+
+def clean_title(title: str) -> str:
+    """A posting title without seniority markers or location/contract qualifiers"""
+    title = _QUALIFIER.sub("", title)
+    title = _LEVEL.sub("", title.strip())
+    title = _SENIORITY.sub(" ", title)
+    return " ".join(title.replace(",", " ").split())
+
+
+def title_key(title: str) -> str:
+    return " ".join(tokenize(title))
+
+
+def find_descriptions(directory: str, recursive: bool = True) -> List[str]:
+    """Job-description text files under a directory, in a stable order"""
+    paths = []
+    for root, _, files in os.walk(directory):
+        paths.extend(os.path.join(root, name) for name in files if name.lower().endswith(JD_EXTENSIONS))
+        if not recursive:
+            break
+    return sorted(paths)
+
+
+def read_descriptions(source: str, recursive: bool = True) -> Iterator[JobDescription]:
+    """Job descriptions from a directory of text files or a JSONL file, lazily.
+
+    Entries without a title or text are logged and skipped.
+    """
+    if os.path.isdir(source):
+        for path in find_descriptions(source, recursive):
+            try:
+                with open(path, "r", errors="replace") as f:
+                    text = f.read()
+            except OSError as e:
+                logger.error(f"Error reading {path}: {str(e)}")
+                continue
+            title = next((line.strip() for line in text.splitlines() if line.strip()), "")
+            if title:
+                yield JobDescription(title, text)
+        return
+
+    with open(source, "r") as f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                title = (record.get("title") or "").strip()
+                text = record.get("description") or record.get("text") or ""
+            except (ValueError, AttributeError) as e:
+                logger.error(f"{source}:{number}: invalid job description record ({str(e)})")
+                continue
+            if title and text:
+                yield JobDescription(title, text)
+            else:
+                logger.warning(f"{source}:{number}: job description without a title or text")
+
+
+def chunked(descriptions: Iterable[JobDescription], size: int) -> Iterator[List[Tuple[str, str]]]:
+    descriptions = iter(descriptions)
+    while True:
+        chunk = [tuple(description) for description in islice(descriptions, size)]
+        if not chunk:
+            return
+        yield chunk
+
+
+class RoleAggregate:
+    """Posting count and per-skill document frequency for one role title"""
+
+    __slots__ = ("postings", "titles", "skills", "names")
+
+    def __init__(self):
+        self.postings = 0
+        self.titles: Counter = Counter()
+        self.skills: Counter = Counter()
+        self.names: Dict[str, str] = {}
+
+    @property
+    def title(self) -> str:
+        """The most common spelling of the title, first seen on a tie"""
+        return self.titles.most_common(1)[0][0]
+
+    def requirements(self, min_share: float, max_skills: int) -> List[str]:
+        """Skills asked for by at least min_share of the postings, most frequent first"""
+        needed = min_share * self.postings
+        ranked = sorted(self.skills.items(), key=lambda item: (-item[1], item[0]))
+        return [self.names[key] for key, count in ranked[:max_skills] if count >= needed]
+
+
+def aggregate_roles(results: Iterable[List[Tuple[str, List[str]]]]) -> Dict[str, RoleAggregate]:
+    """Fold extracted (title, skills) batches into one aggregate per normalized title.
+
+    Skills are counted by canonical taxonomy ID, so aliases of one skill in
+    different postings add up.
+    """
+    taxonomy = shared_taxonomy()
+    roles: Dict[str, RoleAggregate] = {}
+    for batch in results:
+        for title, skills in batch:
+            cleaned = clean_title(title)
+            key = title_key(cleaned)
+            if not key:
+                continue
+            role = roles.get(key)
+            if role is None:
+                role = roles[key] = RoleAggregate()
+            role.postings += 1
+            role.titles[cleaned] += 1
+            # Counted once per posting, however many aliases it uses
+            for skill_id, skill in {taxonomy.key(skill): skill for skill in skills}.items():
+                role.skills[skill_id] += 1
+                role.names.setdefault(skill_id, taxonomy.canonical(skill))
+    return roles
+
+
+def import_job_descriptions(
+    source: str,
+    roles_path: str,
+    max_workers: int = 1,
+    chunk_size: int = 64,
+    min_share: float = 0.3,
+    max_skills: int = 15,
+    min_postings: int = 1,
+    merge: bool = True,
+    recursive: bool = True,
+) -> Dict[str, int]:
+    """Build role requirements from job descriptions and write them to the roles file.
+
+    Extraction runs in max_workers processes (in this one when max_workers
+    is 1), chunk_size descriptions per job. Roles with fewer than
+    min_postings postings, or with no skill reaching min_share, are left
+    out; if that leaves nothing, ValueError is raised and the catalog is not
+    touched. With merge, imported roles replace same-named roles (compared
+    case-insensitively) in the existing catalog and other roles are kept;
+    otherwise the catalog holds the imported roles alone.
+    """
+    chunks = chunked(read_descriptions(source, recursive), max(1, chunk_size))
+    if max_workers > 1:
+        results = run_pool(
+            chunks,
+            max_workers,
+            window=max_workers * 4,
+            job=workers.extract_job_skills,
+            initializer=workers.init_skill_worker,
+            initargs=(),
+        )
+    else:
+        results = map(workers.extract_job_skills, chunks)
+
+    aggregates = aggregate_roles(results)
+    imported: Dict[str, List[str]] = {}
+    for role in aggregates.values():
+        if role.postings < min_postings:
+            continue
+        skills = role.requirements(min_share, max_skills)
+        if skills:
+            imported[role.title] = skills
+
+    if not imported:
+        # Writing now would leave the live catalog without the imported roles, or empty
+        raise ValueError(
+            f"No roles derived from {sum(role.postings for role in aggregates.values())} job descriptions; "
+            f"{roles_path} was left unchanged"
+        )
+
+    catalog: Dict[str, List[str]] = {}
+    if merge and os.path.exists(roles_path):
+        catalog = load_roles(roles_path)
+    existing = {title_key(name): name for name in catalog}
+    for title, skills in sorted(imported.items()):
+        catalog[existing.get(title_key(title), title)] = skills
+
+    save_roles(roles_path, catalog)
+
+    return {
+        "descriptions": sum(role.postings for role in aggregates.values()),
+        "titles": len(aggregates),
+        "imported": len(imported),
+        "roles": len(catalog),
+    }
@@ -1,17 +1,37 @@
-import json
 import os
-from typing import List, Dict, Optional
+import threading
+from typing import List, Dict, Mapping, NamedTuple, Sequence
 import logging
 
+from .. import config
+from .catalog import JsonCatalog
+from .role_sources import load_roles, save_roles
+from .skill_index import SkillIndex
+
 logger = logging.getLogger(__name__)
 
+class RoleCatalog(NamedTuple):
+    """Roles and their required skills, with a version that changes whenever they do"""
+    version: str
+    roles: Mapping[str, Sequence[str]]
+
 class JobService:
     """Service for managing job roles and their required skills"""
     
     def __init__(self):
         self.data_dir = os.path.join(os.path.dirname(__file__), "..", "data")
-        self.roles_file = os.path.join(self.data_dir, "roles.json")
+        # JSON, JSONL or SQLite, by extension (see role_sources)
+        self.roles_file = config.ROLES_FILE or os.path.join(self.data_dir, "roles.json")
         self._ensure_roles_file()
+        self.skill_index = SkillIndex()
+        
+        # Served from memory; edits to the roles file are picked up without a restart
+        self._store = JsonCatalog(
+            self.roles_file, poll_interval=config.CATALOG_POLL_INTERVAL_S, load=load_roles, dump=save_roles
+        )
+        self._search_lock = threading.Lock()
+        self._search = None
+        self._search_building = False
     
     def _ensure_roles_file(self):
         """Ensure roles.json file exists with default data"""
@@ -51,42 +71,99 @@ class JobService:
                 ]
             }
             
-            os.makedirs(self.data_dir, exist_ok=True)
-            with open(self.roles_file, 'w') as f:
-                json.dump(default_roles, f, indent=2)
+            save_roles(self.roles_file, default_roles)
+    
+    def get_catalog(self) -> RoleCatalog:
+        """Current roles and their version, from the in-memory snapshot of roles.json"""
+        snapshot = self._store.snapshot()
+        return RoleCatalog(snapshot.version, snapshot.data)
+    
+    def catalog_version(self) -> str:
+        return self._store.version
     
     def get_available_roles(self) -> List[str]:
         """Get list of available job roles"""
-        try:
-            with open(self.roles_file, 'r') as f:
-                roles_data = json.load(f)
-            return list(roles_data.keys())
-        except Exception as e:
-            logger.error(f"Error reading roles file: {str(e)}")
-            return []
+        return list(self.get_catalog().roles.keys())
+    
+    def get_all_roles(self) -> Dict[str, List[str]]:
+        """Get every role with its required skills"""
+        return dict(self.get_catalog().roles)
     
     def get_role_skills(self, role: str) -> List[str]:
         """Get required skills for a specific role"""
-        try:
-            with open(self.roles_file, 'r') as f:
-                roles_data = json.load(f)
-            return roles_data.get(role, [])
-        except Exception as e:
-            logger.error(f"Error getting skills for role {role}: {str(e)}")
-            return []
+        return list(self.get_catalog().roles.get(role, []))
     
     def add_role(self, role: str, skills: List[str]) -> bool:
         """Add a new role with skills"""
         try:
-            with open(self.roles_file, 'r') as f:
-                roles_data = json.load(f)
+            snapshot = self._store.update(lambda roles_data: roles_data.__setitem__(role, list(skills)))
             
-            roles_data[role] = skills
-            
-            with open(self.roles_file, 'w') as f:
-                json.dump(roles_data, f, indent=2)
+            # Rebuilt from the new snapshot instead if the file had changed under us
+            self.skill_index.update(
+                snapshot.base, snapshot.version, {role: skills}, lambda: snapshot.data.items()
+            )
             
             return True
         except Exception as e:
             logger.error(f"Error adding role {role}: {str(e)}")
-            return False
\ No newline at end of file
+            return False
+    
+    def get_roles_by_skills(self, skills: List[str], match: str = "and") -> List[str]:
+        """Roles requiring all (match="and") or any (match="or") of the skills"""
+        self.warm_skill_index()
+        return self.skill_index.query(skills, match)
+    
+    def warm_skill_index(self) -> None:
+        """Build the skill index, or rebuild it if the catalog file changed under us"""
+        catalog = self.get_catalog()
+        self.skill_index.refresh(catalog.version, lambda: catalog.roles.items())
+    
+    def search_roles(self, query: str, offset: int = 0, limit: int = 20):
+        """Roles whose title has a word starting with each word of the query, as a RolePage
+        
+        Served from the last index built. When the catalog has moved on, a
+        new index is built on a background thread and swapped in once ready;
+        only the very first search (see search_ready) waits for a build.
+        """
+        catalog = self.get_catalog()
+        current = self._search
+        if current is None:
+            with self._search_lock:
+                if self._search is None:
+                    self._search = (catalog.version, self._build_search(catalog))
+                current = self._search
+        elif current[0] != catalog.version:
+            self._rebuild_search(catalog)
+        return current[1].search(query, offset, limit)
+    
+    def search_ready(self) -> bool:
+        """Whether a search index exists, so search_roles will not block on a build"""
+        return self._search is not None
+    
+    def warm_search(self) -> None:
+        """Build the search index ahead of the first search"""
+        self.search_roles("", 0, 1)
+    
+    @staticmethod
+    def _build_search(catalog: RoleCatalog):
+        # Imported here so that numpy stays off the startup path
+        from .role_search import RoleSearchIndex
+        return RoleSearchIndex(catalog.roles)
+    
+    def _rebuild_search(self, catalog: RoleCatalog) -> None:
+        with self._search_lock:
+            if self._search_building:
+                return
+            self._search_building = True
+        
+        def build():
+            try:
+                index = self._build_search(catalog)
+                with self._search_lock:
+                    self._search = (catalog.version, index)
+            except Exception as e:
+                logger.error(f"Error building role search index: {str(e)}")
+            finally:
+                self._search_building = False
+        
+        threading.Thread(target=build, name="role-search-index", daemon=True).start()
@@ -1,179 +1,357 @@
-import spacy
 import re
-from typing import Dict, List, Any, Optional
+import threading
+import time
+from typing import Dict, List, Any, Optional, Tuple
 import logging
 
+from .. import config
+from .sections import ResumeSections, segment
+from .skill_matcher import shared_matcher
+from .taxonomy import shared_taxonomy
+
 logger = logging.getLogger(__name__)
 
+# Common technical skills (expandable)
+SKILL_KEYWORDS = frozenset({
+    "python", "java", "javascript", "typescript", "react", "angular", "vue",
+    "node.js", "express", "django", "flask", "fastapi", "spring", "laravel",
+    "sql", "mysql", "postgresql", "mongodb", "redis", "elasticsearch",
+    "aws", "azure", "gcp", "docker", "kubernetes", "jenkins", "gitlab",
+    "machine learning", "deep learning", "tensorflow", "pytorch", "scikit-learn",
+    "data analysis", "pandas", "numpy", "matplotlib", "seaborn", "plotly",
+    "html", "css", "sass", "bootstrap", "tailwind", "jquery",
+    "git", "github", "bitbucket", "agile", "scrum", "kanban",
+    "linux", "bash", "shell scripting", "powershell", "ci/cd",
+    "rest api", "graphql", "microservices", "oauth", "jwt"
+})
+
+def capitalize_skill(skill: str) -> str:
+    """Properly capitalize skill names"""
+    skill_map = {
+        "javascript": "JavaScript",
+        "typescript": "TypeScript",
+        "node.js": "Node.js",
+        "mysql": "MySQL",
+        "postgresql": "PostgreSQL",
+        "mongodb": "MongoDB",
+        "aws": "AWS",
+        "gcp": "GCP",
+        "html": "HTML",
+        "css": "CSS",
+        "sql": "SQL",
+        "api": "API",
+        "rest api": "REST API",
+        "graphql": "GraphQL",
+        "ci/cd": "CI/CD",
+        "oauth": "OAuth",
+        "jwt": "JWT"
+    }
+    
+    return skill_map.get(skill.lower(), skill.title())
+
+def display_skill(skill: str) -> str:
+    """Canonical taxonomy name for a skill ("vue" -> "Vue.js"), else its capitalized form"""
+    taxonomy = shared_taxonomy()
+    return taxonomy.canonical(skill) if taxonomy.knows(skill) else capitalize_skill(skill)
+
+# Taxonomy aliases that are everyday words: matched case-insensitively in
+# free text they would tag most resumes, so they only resolve at analysis time
+_AMBIGUOUS_ALIASES = frozenset({"go", "node", "rest"})
+
+def extraction_keywords() -> List[str]:
+    """What resumes are scanned for: the skill keywords plus the taxonomy's names and aliases"""
+    return sorted(SKILL_KEYWORDS | (set(shared_taxonomy().terms()) - _AMBIGUOUS_ALIASES))
+
+NLP_PROFILES = ("full", "ner", "windowed")
+
+# Contact patterns, compiled once
+_EMAIL = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_US = re.compile(r'\+?1?[-.\s]?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})')
+_PHONE_OTHER = (
+    re.compile(r'\+?91[-.\s]?([0-9]{10})'),  # India
+    re.compile(r'\+?([0-9]{1,4})[-.\s]?([0-9]{6,14})'),  # International
+)
+_LINKEDIN = re.compile(r'(?:linkedin\.com/in/|linkedin\.com/profile/view\?id=)([A-Za-z0-9-]+)', re.IGNORECASE)
+
+# Fallback name patterns, tried on the first header lines
+_NAME_PATTERNS = (
+    re.compile(r'^([A-Z][a-z]+ [A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)'),  # Title case names
+    re.compile(r'^([A-Z\s]{2,50})\s*$'),  # All caps names
+)
+
+def name_from_header(header: str) -> str:
+    """Name from the first header lines by pattern alone, or Unknown"""
+    for line in header.split('\n', 5)[:5]:
+        line = line.strip()
+        for pattern in _NAME_PATTERNS:
+            match = pattern.search(line)
+            if match:
+                return match.group(1).title()
+    
+    return "Unknown"
+
+def extract_contact_info(text: str) -> Dict[str, str]:
+    """Email, phone and LinkedIn profile found in a text"""
+    contact = {}
+    
+    # Email
+    email = _EMAIL.search(text)
+    if email:
+        contact["email"] = email.group(0)
+    
+    # Phone: US format first, then India and international
+    us_phone = _PHONE_US.search(text)
+    if us_phone:
+        contact["phone"] = f"({us_phone.group(1)}) {us_phone.group(2)}-{us_phone.group(3)}"
+    else:
+        for pattern in _PHONE_OTHER:
+            phone = pattern.search(text)
+            if phone:
+                contact["phone"] = ''.join(phone.groups())
+                break
+    
+    # LinkedIn
+    linkedin = _LINKEDIN.search(text)
+    if linkedin:
+        contact["linkedin"] = f"linkedin.com/in/{linkedin.group(1).lower()}"
+    
+    return contact
+
+def contact_from_sections(sections: ResumeSections) -> Dict[str, str]:
+    """Contact details from the header and contact sections.
+    
+    Only scans the whole text when neither holds any, since contact details
+    almost always sit at the top.
+    """
+    return extract_contact_info(sections.contact_text()) or extract_contact_info(sections.text)
+
+class NLPStats:
+    """Aggregate per-profile NLP timings reported back from workers"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._profiles: Dict[str, Dict[str, float]] = {}
+    
+    def record(self, timings: Dict[str, Any]) -> None:
+        if not timings:
+            return
+        with self._lock:
+            entry = self._profiles.setdefault(
+                timings["profile"], {"docs": 0, "ner_ms": 0.0, "rules_ms": 0.0, "total_ms": 0.0}
+            )
+            entry["docs"] += 1
+            for stage in ("ner_ms", "rules_ms", "total_ms"):
+                entry[stage] += timings.get(stage, 0.0)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                profile: {
+                    "docs": int(entry["docs"]),
+                    **{
+                        f"avg_{stage}": round(entry[stage] / entry["docs"], 2)
+                        for stage in ("ner_ms", "rules_ms", "total_ms")
+                    }
+                }
+                for profile, entry in self._profiles.items()
+            }
+
 class NLPProcessor:
     """Service for processing resume text using NLP techniques"""
     
-    def __init__(self):
+    def __init__(self, profile: Optional[str] = None):
+        self.profile = profile or config.NLP_PROFILE
+        if self.profile not in NLP_PROFILES:
+            logger.warning(f"Unknown NLP profile {self.profile!r}, using 'full'")
+            self.profile = "full"
+        
+        # Imported here so that importing this module stays cheap
+        import spacy
+        
         try:
             self.nlp = spacy.load("en_core_web_sm")
         except OSError:
             logger.error("spaCy model 'en_core_web_sm' not found. Please install it with: python -m spacy download en_core_web_sm")
             raise
         
-        # Common technical skills (expandable)
-        self.skill_keywords = {
-            "python", "java", "javascript", "typescript", "react", "angular", "vue",
-            "node.js", "express", "django", "flask", "fastapi", "spring", "laravel",
-            "sql", "mysql", "postgresql", "mongodb", "redis", "elasticsearch",
-            "aws", "azure", "gcp", "docker", "kubernetes", "jenkins", "gitlab",
-            "machine learning", "deep learning", "tensorflow", "pytorch", "scikit-learn",
-            "data analysis", "pandas", "numpy", "matplotlib", "seaborn", "plotly",
-            "html", "css", "sass", "bootstrap", "tailwind", "jquery",
-            "git", "github", "bitbucket", "agile", "scrum", "kanban",
-            "linux", "bash", "shell scripting", "powershell", "ci/cd",
-            "rest api", "graphql", "microservices", "oauth", "jwt"
-        }
+        if self.profile != "full":
+            # We only read PERSON and ORG entities; skip tagger, parser, lemmatizer...
+            for name in self._unused_components():
+                self.nlp.disable_pipe(name)
+        
+        self.header_chars = config.NLP_HEADER_CHARS
+        self.section_max_chars = config.NLP_SECTION_MAX_CHARS
+        self.pipe_batch_size = config.NLP_PIPE_BATCH_SIZE
+        self.pipe_n_process = config.NLP_PIPE_N_PROCESS
+        
+        self.skill_keywords = extraction_keywords()
+        self.skill_matcher = shared_matcher(self.skill_keywords, display_skill)
     
-    def extract_resume_data(self, text: str) -> Dict[str, Any]:
-        """Extract structured data from resume text"""
-        try:
+    def _unused_components(self) -> List[str]:
+        """Pipeline components NER does not need"""
+        needed = {"ner"}
+        for name, component in self.nlp.pipeline:
+            # Shared tok2vec layers feeding the NER must stay enabled
+            if "ner" in getattr(component, "listening_components", []):
+                needed.add(name)
+        return [name for name in self.nlp.pipe_names if name not in needed]
+    
+    def _ner_windows(self, sections: ResumeSections) -> Tuple[str, str]:
+        """Header slice for the name and experience slice for organisations"""
+        header = sections.header[:self.header_chars]
+        
+        if not sections.has("experience"):
+            return header, sections.text[:self.section_max_chars]
+        return header, sections.get("experience", self.section_max_chars)
+    
+    def _run_ner(self, text: str, sections: ResumeSections):
+        """Run the pipeline per profile; returns (header doc, experience doc)"""
+        if self.profile != "windowed":
             doc = self.nlp(text)
+            return doc, doc
+        
+        header_doc, experience_doc = self.nlp.pipe(self._ner_windows(sections))
+        return header_doc, experience_doc
+    
+    def extract_resume_data(self, text: str, timings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Extract structured data from resume text
+        
+        If a timings dict is passed it is filled with per-stage durations.
+        """
+        try:
+            started = time.perf_counter()
+            sections = segment(text, self.header_chars)
+            header_doc, experience_doc = self._run_ner(text, sections)
+            ner_done = time.perf_counter()
             
-            # Extract name (first person name found)
-            name = self._extract_name(doc, text)
-            
-            # Extract contact information
-            contact = self._extract_contact_info(text)
-            
-            # Extract skills
-            skills = self._extract_skills(text)
+            result = self._extract_fields(sections, header_doc, experience_doc)
             
-            # Extract experience
-            experience = self._extract_experience(doc, text)
+            if timings is not None:
+                finished = time.perf_counter()
+                timings.update({
+                    "profile": self.profile,
+                    "ner_ms": (ner_done - started) * 1000,
+                    "rules_ms": (finished - ner_done) * 1000,
+                    "total_ms": (finished - started) * 1000
+                })
             
-            return {
-                "name": name,
-                "contact": contact,
-                "skills": skills,
-                "experience": experience
-            }
+            return result
             
         except Exception as e:
             logger.error(f"Error processing resume text: {str(e)}")
-            return {
-                "name": "Unknown",
-                "contact": {},
-                "skills": [],
-                "experience": []
-            }
+            return self._empty_result()
+    
+    def extract_resume_data_batch(
+        self,
+        texts: List[str],
+        timings: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """Extract structured data from many resumes with one batched nlp.pipe call
+        
+        If a timings list is passed it gets one dict per text; the NER time of
+        the batch is split evenly across its documents.
+        """
+        if timings is not None:
+            timings.extend({} for _ in texts)
+        if not texts:
+            return []
+        
+        try:
+            started = time.perf_counter()
+            segmented = [segment(text, self.header_chars) for text in texts]
+            inputs = [self._ner_inputs(sections) for sections in segmented]
+            docs = iter(self.nlp.pipe(
+                [chunk for chunks in inputs for chunk in chunks],
+                batch_size=self.pipe_batch_size,
+                n_process=self.pipe_n_process
+            ))
+            per_text = [[next(docs) for _ in chunks] for chunks in inputs]
+            ner_ms = (time.perf_counter() - started) * 1000 / len(texts)
+        except Exception as e:
+            logger.error(f"Error in batched NLP pass, processing {len(texts)} resumes one by one: {str(e)}")
+            return [
+                self.extract_resume_data(text, timings[i] if timings is not None else None)
+                for i, text in enumerate(texts)
+            ]
+        
+        results = []
+        for i, (sections, text_docs) in enumerate(zip(segmented, per_text)):
+            rules_started = time.perf_counter()
+            try:
+                results.append(self._extract_fields(sections, text_docs[0], text_docs[-1]))
+            except Exception as e:
+                logger.error(f"Error processing resume text: {str(e)}")
+                results.append(self._empty_result())
+            
+            if timings is not None:
+                rules_ms = (time.perf_counter() - rules_started) * 1000
+                timings[i].update({
+                    "profile": self.profile,
+                    "ner_ms": ner_ms,
+                    "rules_ms": rules_ms,
+                    "total_ms": ner_ms + rules_ms
+                })
+        
+        return results
+    
+    def _ner_inputs(self, sections: ResumeSections) -> List[str]:
+        """Texts the pipeline runs on for one resume: the whole text, or its windows"""
+        if self.profile != "windowed":
+            return [sections.text]
+        return list(self._ner_windows(sections))
+    
+    def _extract_fields(self, sections: ResumeSections, header_doc, experience_doc) -> Dict[str, Any]:
+        """Structured fields from the segmented text and its NER docs"""
+        return {
+            # Extract name (first person name found)
+            "name": self._extract_name(header_doc, sections.header),
+            # Extract contact information
+            "contact": contact_from_sections(sections),
+            # Skills are mentioned throughout, and the matcher is a single pass
+            "skills": self._extract_skills(sections.text),
+            # Extract experience
+            "experience": self._extract_experience(experience_doc)
+        }
     
-    def _extract_name(self, doc, text: str) -> str:
+    def _empty_result(self) -> Dict[str, Any]:
+        return {
+            "name": "Unknown",
+            "contact": {},
+            "skills": [],
+            "experience": []
+        }
+    
+    def _extract_name(self, doc, header: str) -> str:
         """Extract person's name from resume"""
         # Look for person entities first
         for ent in doc.ents:
             if ent.label_ == "PERSON" and len(ent.text.split()) >= 2:
                 return ent.text
         
-        # Fallback: look for name patterns in first few lines
-        lines = text.split('\n')[:5]
-        name_patterns = [
-            r'^([A-Z][a-z]+ [A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)',  # Title case names
-            r'^([A-Z\s]{2,50})\s*$'  # All caps names
-        ]
-        
-        for line in lines:
-            line = line.strip()
-            for pattern in name_patterns:
-                match = re.search(pattern, line)
-                if match:
-                    return match.group(1).title()
-        
-        return "Unknown"
+        # Fallback: look for name patterns in first few header lines
+        return name_from_header(header)
     
     def _extract_contact_info(self, text: str) -> Dict[str, str]:
         """Extract contact information"""
-        contact = {}
-        
-        # Email pattern
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        if emails:
-            contact["email"] = emails[0]
-        
-        # Phone patterns
-        phone_patterns = [
-            r'\+?1?[-.\s]?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})',  # US
-            r'\+?91[-.\s]?([0-9]{10})',  # India
-            r'\+?([0-9]{1,4})[-.\s]?([0-9]{6,14})'  # International
-        ]
-        
-        for pattern in phone_patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                # Format the first match found
-                if pattern == phone_patterns[0]:  # US format
-                    contact["phone"] = f"({matches[0][0]}) {matches[0][1]}-{matches[0][2]}"
-                else:
-                    contact["phone"] = matches[0] if isinstance(matches[0], str) else ''.join(matches[0])
-                break
-        
-        # LinkedIn
-        linkedin_pattern = r'(?:linkedin\.com/in/|linkedin\.com/profile/view\?id=)([A-Za-z0-9-]+)'
-        linkedin_matches = re.findall(linkedin_pattern, text.lower())
-        if linkedin_matches:
-            contact["linkedin"] = f"linkedin.com/in/{linkedin_matches[0]}"
-        
-        return contact
+        return extract_contact_info(text)
     
     def _extract_skills(self, text: str) -> List[str]:
         """Extract technical skills from resume text"""
-        text_lower = text.lower()
-        found_skills = []
-        
-        # Look for skills in the predefined list
-        for skill in self.skill_keywords:
-            if skill.lower() in text_lower:
-                # Add proper capitalization
-                found_skills.append(self._capitalize_skill(skill))
-        
-        # Remove duplicates and sort
-        found_skills = list(set(found_skills))
-        found_skills.sort()
-        
-        return found_skills
+        # One pass over the text; names come back canonical, so two aliases
+        # of one skill collapse into a single entry
+        return sorted(set(self.skill_matcher.skills(text)))
     
     def _capitalize_skill(self, skill: str) -> str:
         """Properly capitalize skill names"""
-        skill_map = {
-            "javascript": "JavaScript",
-            "typescript": "TypeScript",
-            "node.js": "Node.js",
-            "mysql": "MySQL",
-            "postgresql": "PostgreSQL",
-            "mongodb": "MongoDB",
-            "aws": "AWS",
-            "gcp": "GCP",
-            "html": "HTML",
-            "css": "CSS",
-            "sql": "SQL",
-            "api": "API",
-            "rest api": "REST API",
-            "graphql": "GraphQL",
-            "ci/cd": "CI/CD",
-            "oauth": "OAuth",
-            "jwt": "JWT"
-        }
-        
-        return skill_map.get(skill.lower(), skill.title())
+        return capitalize_skill(skill)
     
-    def _extract_experience(self, doc, text: str) -> List[Dict[str, Any]]:
+    def _extract_experience(self, doc) -> List[Dict[str, Any]]:
         """Extract work experience information"""
         experience = []
         
         # Look for organization entities
         organizations = [ent.text for ent in doc.ents if ent.label_ == "ORG"]
         
-        # Simple pattern matching for experience sections
-        exp_patterns = [
-            r'(?:experience|work|employment)[\s\S]*?(?=education|skills|projects|$)',
-            r'(?:^|\n)(.+?)(?:\n|$)(?:.*?)(\d{4})\s*[-–]\s*(\d{4}|present)',
-        ]
-        
         # This is a simplified extraction - in a real app, you'd want more sophisticated parsing
         if organizations:
             for i, org in enumerate(organizations[:3]):  # Limit to first 3 organizations
@@ -185,4 +363,40 @@ class NLPProcessor:
                     "end_date": "2023-01-01"
                 })
         
-        return experience
\ No newline at end of file
+        return experience
+
+class LiteExtractor:
+    """Regex-only extraction for latency-sensitive clients
+    
+    Skips spaCy entirely: skills come from the keyword matcher, contact
+    details from the contact patterns and the name from header patterns.
+    Experience is not extracted.
+    """
+    
+    profile = "lite"
+    
+    def __init__(self):
+        self.header_chars = config.NLP_HEADER_CHARS
+        self.skill_matcher = shared_matcher(extraction_keywords(), display_skill)
+    
+    def extract_resume_data(self, text: str, timings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Extract skills, contact details and a pattern-based name"""
+        started = time.perf_counter()
+        sections = segment(text, self.header_chars)
+        result = {
+            "name": name_from_header(sections.header),
+            "contact": contact_from_sections(sections),
+            "skills": sorted(set(self.skill_matcher.skills(text))),
+            "experience": []
+        }
+        
+        if timings is not None:
+            elapsed = (time.perf_counter() - started) * 1000
+            timings.update({
+                "profile": self.profile,
+                "ner_ms": 0.0,
+                "rules_ms": elapsed,
+                "total_ms": elapsed
+            })
+        
+        return result
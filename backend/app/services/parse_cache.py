@@ -0,0 +1,229 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CachedParse = Tuple[str, Dict[str, Any]]
+
+
+class ParseCache:
+    """Content-addressed cache of parsed resumes.
+
+    Entries are keyed by the SHA-256 of the uploaded PDF bytes and hold the
+    extracted text plus the NLP output. A bounded in-memory LRU sits in front
+    of a size-bounded on-disk tier. The disk tier lives in a directory named
+    after the extractor fingerprint, so changing the skill keywords, the
+    skill taxonomy, the PDF and NLP settings or the extractor version starts
+    a fresh namespace and purges the old one.
+
+    Building a cache touches no files. The disk tier is indexed (and stale
+    namespaces purged) by the first get() or put(); both do file I/O and
+    belong off the event loop, while get_memory() never touches the disk.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        fingerprint: str,
+        max_memory_entries: int = 256,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+    ):
+        self.fingerprint = fingerprint
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.root_dir = cache_dir
+        self.cache_dir = os.path.join(cache_dir, fingerprint[:16])
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, CachedParse]" = OrderedDict()
+        # key -> size in bytes, oldest access first
+        self._disk_index: "OrderedDict[str, int]" = OrderedDict()
+        self._disk_bytes = 0
+        self._disk_lock = threading.Lock()
+        self._disk_ready = False
+
+        self._hits_memory = 0
+        self._hits_disk = 0
+        self._misses = 0
+        self._evictions_memory = 0
+        self._evictions_disk = 0
+
+    @staticmethod
+    def key_for(content: bytes) -> str:
+        """Cache key for a PDF's raw bytes"""
+        return hashlib.sha256(content).hexdigest()
+
+    def _ensure_disk_tier(self) -> None:
+        if self._disk_ready:
+            return
+        with self._disk_lock:
+            if not self._disk_ready:
+                self._init_disk_tier()
+                self._disk_ready = True
+
+    def _init_disk_tier(self) -> None:
+        """Drop stale namespaces and index the current one by access time"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+            current = os.path.basename(self.cache_dir)
+            for name in os.listdir(self.root_dir):
+                path = os.path.join(self.root_dir, name)
+                if name != current and os.path.isdir(path):
+                    logger.info(f"Purging stale parse cache namespace {name}")
+                    shutil.rmtree(path, ignore_errors=True)
+
+            entries = []
+            for name in os.listdir(self.cache_dir):
+                if not name.endswith(".json"):
+                    continue
+                stat = os.stat(os.path.join(self.cache_dir, name))
+                entries.append((stat.st_mtime, name[:-5], stat.st_size))
+
+            with self._lock:
+                for _, key, size in sorted(entries):
+                    self._disk_index[key] = size
+                    self._disk_bytes += size
+                self._evict_disk()
+        except Exception as e:
+            logger.error(f"Error initializing parse cache at {self.cache_dir}: {str(e)}")
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + ".json")
+
+    def get_memory(self, key: str) -> Optional[CachedParse]:
+        """Look up a parse result in the memory tier only.
+
+        Never touches the disk, so it is safe to call from the event loop. A
+        miss here is not counted; follow it with get(), which does.
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self._hits_memory += 1
+            return entry
+
+    def get(self, key: str) -> Optional[CachedParse]:
+        """Look up a parse result, promoting disk hits into memory. May read from disk"""
+        self._ensure_disk_tier()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self._hits_memory += 1
+                return entry
+
+            if key not in self._disk_index:
+                self._misses += 1
+                return None
+
+        entry = self._read_disk(key)
+
+        with self._lock:
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._hits_disk += 1
+            if key in self._disk_index:
+                self._disk_index.move_to_end(key)
+            self._store_memory(key, entry)
+            return entry
+
+    def put(self, key: str, text: str, data: Dict[str, Any]) -> None:
+        """Store a parse result in both tiers. Writes to disk, so async callers run it in a thread"""
+        entry = (text, data)
+        payload = json.dumps({"fingerprint": self.fingerprint, "text": text, "data": data})
+
+        with self._lock:
+            self._store_memory(key, entry)
+
+        self._ensure_disk_tier()
+        tmp_path = None
+        try:
+            # A unique temp file per write: two threads may store the same key at once
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=f"{key}.", suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                f.write(payload)
+            os.replace(tmp_path, self._entry_path(key))
+        except Exception as e:
+            logger.error(f"Error writing parse cache entry {key}: {str(e)}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+
+        size = len(payload.encode("utf-8"))
+        with self._lock:
+            self._disk_bytes += size - self._disk_index.pop(key, 0)
+            self._disk_index[key] = size
+            self._evict_disk()
+
+    def clear(self) -> None:
+        """Drop every cached entry"""
+        self._ensure_disk_tier()
+        with self._lock:
+            self._memory.clear()
+            for key in list(self._disk_index):
+                self._remove_disk(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and tier sizes"""
+        with self._lock:
+            lookups = self._hits_memory + self._hits_disk + self._misses
+            return {
+                "fingerprint": self.fingerprint[:16],
+                "hits_memory": self._hits_memory,
+                "hits_disk": self._hits_disk,
+                "misses": self._misses,
+                "hit_rate": round((self._hits_memory + self._hits_disk) / lookups, 4) if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "disk_entries": len(self._disk_index),
+                "disk_bytes": self._disk_bytes,
+                "evictions_memory": self._evictions_memory,
+                "evictions_disk": self._evictions_disk,
+            }
+
+    def _read_disk(self, key: str) -> Optional[CachedParse]:
+        try:
+            with open(self._entry_path(key), "r") as f:
+                payload = json.load(f)
+            if payload.get("fingerprint") != self.fingerprint:
+                raise ValueError("fingerprint mismatch")
+            # Keep the on-disk access order meaningful across restarts
+            os.utime(self._entry_path(key))
+            return payload["text"], payload["data"]
+        except Exception as e:
+            logger.warning(f"Dropping unreadable parse cache entry {key}: {str(e)}")
+            with self._lock:
+                self._remove_disk(key)
+            return None
+
+    def _store_memory(self, key: str, entry: CachedParse) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self._evictions_memory += 1
+
+    def _evict_disk(self) -> None:
+        while self._disk_bytes > self.max_disk_bytes and self._disk_index:
+            oldest = next(iter(self._disk_index))
+            self._remove_disk(oldest)
+            self._evictions_disk += 1
+
+    def _remove_disk(self, key: str) -> None:
+        self._disk_bytes -= self._disk_index.pop(key, 0)
+        try:
+            os.remove(self._entry_path(key))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Error removing parse cache entry {key}: {str(e)}")
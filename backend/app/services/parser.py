@@ -1,7 +1,8 @@
-import pdfplumber
-import io
 import logging
-from typing import Optional
+from typing import Callable, Optional, Tuple, Union
+
+from .. import config
+from .pdf_engines import PDFDocument, PDFSource
 
 logger = logging.getLogger(__name__)
 
@@ -9,36 +10,53 @@ class ResumeParser:
     """Service for parsing PDF resumes and extracting text content"""
     
     def __init__(self):
-        pass
+        self.engine_order = config.PDF_ENGINE_ORDER
+        self.min_words_per_page = config.PDF_MIN_WORDS_PER_PAGE
+        self.max_bad_glyph_ratio = config.PDF_MAX_BAD_GLYPH_RATIO
+        self.max_pages = config.PDF_MAX_PAGES
+        self.max_chars = config.PDF_MAX_CHARS
+    
+    def open_document(
+        self,
+        pdf_content: PDFSource,
+        page_range: Optional[Tuple[int, int]] = None,
+        on_page: Optional[Callable[[int, str], None]] = None,
+        on_reset: Optional[Callable[[], None]] = None
+    ) -> PDFDocument:
+        """Open a PDF once so text and tables can share the parsed document"""
+        return PDFDocument(
+            pdf_content,
+            engine_order=self.engine_order,
+            min_words_per_page=self.min_words_per_page,
+            max_bad_glyph_ratio=self.max_bad_glyph_ratio,
+            page_range=page_range or (0, self.max_pages),
+            max_chars=self.max_chars or None,
+            on_page=on_page,
+            on_reset=on_reset
+        )
     
-    def extract_text(self, pdf_content: bytes) -> str:
-        """Extract text content from PDF bytes"""
+    def extract_text(self, pdf_content: Union[PDFSource, PDFDocument]) -> str:
+        """Extract text content from PDF bytes, a PDF path or an open document"""
         try:
-            text = ""
-            with pdfplumber.open(io.BytesIO(pdf_content)) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
+            if isinstance(pdf_content, PDFDocument):
+                return pdf_content.text().strip()
             
-            return text.strip()
+            with self.open_document(pdf_content) as document:
+                return document.text().strip()
             
         except Exception as e:
             logger.error(f"Error extracting text from PDF: {str(e)}")
             raise Exception("Failed to extract text from PDF")
     
-    def extract_tables(self, pdf_content: bytes) -> list:
+    def extract_tables(self, pdf_content: Union[PDFSource, PDFDocument]) -> list:
         """Extract tables from PDF (if any)"""
         try:
-            tables = []
-            with pdfplumber.open(io.BytesIO(pdf_content)) as pdf:
-                for page in pdf.pages:
-                    page_tables = page.extract_tables()
-                    if page_tables:
-                        tables.extend(page_tables)
+            if isinstance(pdf_content, PDFDocument):
+                return pdf_content.tables()
             
-            return tables
+            with self.open_document(pdf_content) as document:
+                return document.tables()
             
         except Exception as e:
             logger.error(f"Error extracting tables from PDF: {str(e)}")
-            return []
\ No newline at end of file
+            return []
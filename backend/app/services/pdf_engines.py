@@ -0,0 +1,369 @@
+import io
+import logging
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Raw PDF bytes or a path to a PDF on disk
+PDFSource = Union[bytes, str]
+
+# pdfminer emits "(cid:NN)" for glyphs it cannot map to unicode
+_CID_PATTERN = re.compile(r"\(cid:\d+\)")
+
+
+class PDFEngine(ABC):
+    """Base class for a text extraction backend"""
+
+    name = "base"
+
+    @abstractmethod
+    def available(self) -> bool:
+        """Whether the backing library can be imported"""
+
+    @abstractmethod
+    def open(self, source: PDFSource) -> Any:
+        """Open a document and return the engine's handle for it"""
+
+    @abstractmethod
+    def close(self, handle: Any) -> None:
+        ...
+
+    @abstractmethod
+    def page_count(self, handle: Any) -> int:
+        ...
+
+    @abstractmethod
+    def page_text(self, handle: Any, index: int) -> str:
+        ...
+
+    @abstractmethod
+    def page_tables(self, handle: Any, index: int) -> Optional[List[list]]:
+        """Tables on a page, or None when this engine cannot extract tables"""
+
+
+class PyMuPDFEngine(PDFEngine):
+    """PyMuPDF (fitz) backend: fast text-layer extraction"""
+
+    name = "pymupdf"
+
+    def available(self) -> bool:
+        try:
+            import fitz  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    def open(self, source: PDFSource) -> Any:
+        import fitz
+        if isinstance(source, str):
+            return fitz.open(source)
+        return fitz.open(stream=source, filetype="pdf")
+
+    def close(self, handle: Any) -> None:
+        handle.close()
+
+    def page_count(self, handle: Any) -> int:
+        return handle.page_count
+
+    def page_text(self, handle: Any, index: int) -> str:
+        return handle[index].get_text() or ""
+
+    def page_tables(self, handle: Any, index: int) -> Optional[List[list]]:
+        page = handle[index]
+        if not hasattr(page, "find_tables"):
+            # find_tables arrived in PyMuPDF 1.23
+            return None
+        return [table.extract() for table in page.find_tables().tables]
+
+
+class PdfPlumberEngine(PDFEngine):
+    """pdfplumber backend: slower, more tolerant of odd layouts"""
+
+    name = "pdfplumber"
+
+    def available(self) -> bool:
+        try:
+            import pdfplumber  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    def open(self, source: PDFSource) -> Any:
+        import pdfplumber
+        if isinstance(source, str):
+            return pdfplumber.open(source)
+        return pdfplumber.open(io.BytesIO(source))
+
+    def close(self, handle: Any) -> None:
+        handle.close()
+
+    def page_count(self, handle: Any) -> int:
+        return len(handle.pages)
+
+    def page_text(self, handle: Any, index: int) -> str:
+        return handle.pages[index].extract_text() or ""
+
+    def page_tables(self, handle: Any, index: int) -> Optional[List[list]]:
+        return handle.pages[index].extract_tables() or []
+
+
+ENGINES: Dict[str, PDFEngine] = {
+    PyMuPDFEngine.name: PyMuPDFEngine(),
+    PdfPlumberEngine.name: PdfPlumberEngine(),
+}
+
+DEFAULT_ENGINE_ORDER = ("pymupdf", "pdfplumber")
+
+
+def register_engine(engine: PDFEngine) -> None:
+    """Make an additional extraction backend selectable by name"""
+    ENGINES[engine.name] = engine
+
+
+def check_text_quality(
+    text: str,
+    page_count: int,
+    min_words_per_page: int = 25,
+    max_bad_glyph_ratio: float = 0.02,
+) -> Optional[str]:
+    """Cheap sanity check on extracted text.
+
+    Returns None when the text looks usable, otherwise a short reason.
+    """
+    words = len(text.split())
+    if words < min_words_per_page * max(page_count, 1):
+        return f"too few words ({words} for {page_count} pages)"
+
+    visible = sum(1 for ch in text if not ch.isspace())
+    if visible:
+        bad = text.count("\ufffd") + 6 * len(_CID_PATTERN.findall(text))
+        if bad / visible > max_bad_glyph_ratio:
+            return f"broken glyph ratio {bad / visible:.3f}"
+
+    return None
+
+
+class PDFDocument:
+    """A PDF opened once and shared by text and table extraction.
+
+    Engines are tried in order; the first one whose text passes the quality
+    check wins. Each engine opens the source at most once, so extracting
+    tables after text reuses the handle rather than re-parsing the bytes.
+
+    Text extraction can be limited to a page range and stops early once
+    max_chars characters have been gathered. on_page, if given, is called
+    with each page's index and text as it is read. When an engine's output is
+    rejected and the next engine takes over, on_reset is called first so the
+    caller can drop the pages it collected from the rejected attempt.
+    """
+
+    def __init__(
+        self,
+        source: PDFSource,
+        engine_order: Sequence[str] = DEFAULT_ENGINE_ORDER,
+        min_words_per_page: int = 25,
+        max_bad_glyph_ratio: float = 0.02,
+        page_range: Optional[Tuple[int, int]] = None,
+        max_chars: Optional[int] = None,
+        on_page: Optional[Callable[[int, str], None]] = None,
+        on_reset: Optional[Callable[[], None]] = None,
+    ):
+        self.source = source
+        self.engine_order = [name for name in engine_order if name in ENGINES]
+        self.min_words_per_page = min_words_per_page
+        self.max_bad_glyph_ratio = max_bad_glyph_ratio
+        self.page_range = page_range
+        self.max_chars = max_chars
+        self.on_page = on_page
+        self.on_reset = on_reset
+
+        self._handles: Dict[str, Any] = {}
+        self._text: Optional[str] = None
+        self.engine: Optional[str] = None
+        self.pages_read = 0
+        self.attempts: List[Dict[str, Any]] = []
+        self._reported = False
+
+    def __enter__(self) -> "PDFDocument":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release every engine handle opened for this document"""
+        for name, handle in self._handles.items():
+            try:
+                ENGINES[name].close(handle)
+            except Exception as e:
+                logger.warning(f"Error closing {name} document: {str(e)}")
+        self._handles.clear()
+
+    def _handle(self, name: str) -> Any:
+        if name not in self._handles:
+            self._handles[name] = ENGINES[name].open(self.source)
+        return self._handles[name]
+
+    def page_count(self) -> int:
+        """Number of pages, using whichever engine is already open"""
+        name = self.engine or next(iter(self._handles), None) or self._first_available()
+        return ENGINES[name].page_count(self._handle(name))
+
+    def _first_available(self) -> str:
+        for name in self.engine_order:
+            if ENGINES[name].available():
+                return name
+        raise RuntimeError("No PDF extraction engine available")
+
+    def _extract_with(self, name: str) -> Tuple[str, int]:
+        """Extract the configured page range; returns the text and pages read"""
+        engine = ENGINES[name]
+        handle = self._handle(name)
+
+        total = engine.page_count(handle)
+        start, stop = self.page_range or (0, total)
+        stop = min(stop, total)
+
+        pages: List[str] = []
+        chars = 0
+        read = 0
+        for index in range(start, stop):
+            page_text = engine.page_text(handle, index)
+            read += 1
+            if self.on_page is not None:
+                self.on_page(index, page_text)
+                self._reported = True
+            if page_text:
+                pages.append(page_text)
+                chars += len(page_text) + 1
+            if self.max_chars and chars >= self.max_chars:
+                break
+
+        return "\n".join(pages), read
+
+    def text(self) -> str:
+        """Extract text with the first engine that passes the quality check"""
+        if self._text is not None:
+            return self._text
+
+        best: Optional[tuple] = None
+        for name in self.engine_order:
+            engine = ENGINES[name]
+            if not engine.available():
+                continue
+
+            if self._reported:
+                # Pages from the rejected engine must not outlive its attempt
+                self._reported = False
+                if self.on_reset is not None:
+                    self.on_reset()
+
+            started = time.perf_counter()
+            try:
+                text, pages = self._extract_with(name)
+            except Exception as e:
+                self.attempts.append({
+                    "engine": name,
+                    "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+                    "error": str(e),
+                })
+                logger.warning(f"{name} failed to extract text: {str(e)}")
+                continue
+
+            problem = check_text_quality(text, pages, self.min_words_per_page, self.max_bad_glyph_ratio)
+            self.attempts.append({
+                "engine": name,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+                "quality": problem or "ok",
+            })
+
+            if problem is None:
+                best = (name, text, pages)
+                break
+
+            # Keep the most plausible result in case every engine falls short
+            if best is None or len(text.split()) > len(best[1].split()):
+                best = (name, text, pages)
+
+        if best is None:
+            raise RuntimeError("No PDF extraction engine could read the document")
+
+        self.engine, self._text, self.pages_read = best
+        return self._text
+
+    def tables(self) -> List[list]:
+        """Extract tables, preferring the engine that produced the text"""
+        order = list(self.engine_order)
+        if self.engine in order:
+            order.remove(self.engine)
+            order.insert(0, self.engine)
+
+        for name in order:
+            engine = ENGINES[name]
+            if not engine.available():
+                continue
+            handle = self._handle(name)
+            tables: Optional[List[list]] = []
+            for i in range(engine.page_count(handle)):
+                page_tables = engine.page_tables(handle, i)
+                if page_tables is None:
+                    # This engine has no table support; try the next one
+                    tables = None
+                    break
+                tables.extend(page_tables)
+            if tables is not None:
+                return tables
+
+        return []
+
+    def extraction_info(self) -> Dict[str, Any]:
+        """Which engine produced the text and how long each attempt took"""
+        return {
+            "engine": self.engine,
+            "elapsed_ms": round(sum(a["elapsed_ms"] for a in self.attempts), 2),
+            "pages_total": self.page_count() if self._handles else 0,
+            "pages_read": self.pages_read,
+            "attempts": self.attempts,
+        }
+
+
+class EngineStats:
+    """Aggregate engine usage and timing reported back from extractions"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._engines: Dict[str, Dict[str, float]] = {}
+        self._fallbacks = 0
+
+    def record(self, info: Dict[str, Any]) -> None:
+        with self._lock:
+            if len(info.get("attempts", [])) > 1:
+                self._fallbacks += 1
+            for attempt in info.get("attempts", []):
+                entry = self._engines.setdefault(
+                    attempt["engine"], {"attempts": 0, "selected": 0, "total_ms": 0.0}
+                )
+                entry["attempts"] += 1
+                entry["total_ms"] += attempt["elapsed_ms"]
+            if info.get("engine"):
+                self._engines.setdefault(
+                    info["engine"], {"attempts": 0, "selected": 0, "total_ms": 0.0}
+                )["selected"] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "fallbacks": self._fallbacks,
+                "engines": {
+                    name: {
+                        "attempts": int(entry["attempts"]),
+                        "selected": int(entry["selected"]),
+                        "avg_ms": round(entry["total_ms"] / entry["attempts"], 2) if entry["attempts"] else 0.0,
+                    }
+                    for name, entry in self._engines.items()
+                },
+            }
@@ -0,0 +1,328 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from ..models.resume import ResumeData
+from . import workers
+from .batcher import MicroBatcher
+from .executor import CPUExecutor, JobTimeout
+from .nlp import LiteExtractor, NLPStats
+from .parse_cache import ParseCache
+from .pdf_engines import EngineStats, PDFSource
+
+logger = logging.getLogger(__name__)
+
+# full: spaCy NER + rules; lite: keyword matcher and contact patterns only
+EXTRACTION_MODES = ("full", "lite")
+
+# Stages with their own time budget
+STAGES = ("extraction", "nlp", "storage")
+
+
+class StageTimeout(Exception):
+    """A stage ran out of time before producing anything usable"""
+
+    def __init__(self, stage: str, message: str):
+        super().__init__(message)
+        self.stage = stage
+
+
+class ParsedResume(NamedTuple):
+    text: str
+    data: Dict[str, Any]
+    # Stages that hit their deadline and returned partial output
+    truncated: Tuple[str, ...] = ()
+
+
+def build_resume_data(
+    user_id: str,
+    parsed_text: str,
+    structured_data: Dict[str, Any],
+    target_role: Optional[str],
+    truncated: Optional[List[str]] = None
+) -> ResumeData:
+    """Assemble the stored resume record from parse output"""
+    return ResumeData(
+        user_id=user_id,
+        name=structured_data.get("name", "Unknown"),
+        contact=structured_data.get("contact", {}),
+        skills=structured_data.get("skills", []),
+        #experience=structured_data.get("experience", []),
+        parsed_text_snippet=parsed_text[:200] + "..." if len(parsed_text) > 200 else parsed_text,
+        target_role=target_role,
+        upload_timestamp=datetime.now().isoformat(),
+        truncated=truncated or []
+    )
+
+
+class ResumePipeline:
+    """Async orchestration of the resume parse path.
+
+    Text is extracted in page ranges: the first range also reports the page
+    count, and any further ranges (up to max_pages) are extracted in parallel
+    across the CPU executor's workers and joined in page order. NLP then runs
+    as a separate job over the joined text; texts from concurrent requests are
+    micro-batched into a single nlp.pipe job. In lite mode the NLP stage is
+    a regex-only job that never touches spaCy.
+
+    Extraction and NLP each have a time budget. A job that overruns is
+    stopped by killing its worker, and the parse carries on with what it
+    has: the pages read before the deadline (workers report each page as
+    they go), or regex-only extraction when NLP timed out. That fallback
+    runs in a thread within whatever is left of the combined extraction and
+    NLP budgets. The NLP budget is per document, so a micro-batch of n texts
+    gets n budgets; if it still overruns, each text is retried on its own so
+    only the slow one falls back. Such results are flagged in `truncated`
+    and are not cached. Deadlines include time spent waiting for a worker;
+    timeouts that hit before a worker was free are also counted in
+    `queue_timeouts`.
+    """
+
+    def __init__(
+        self,
+        executor: CPUExecutor,
+        cache: Optional[ParseCache] = None,
+        pages_per_chunk: int = 4,
+        max_pages: int = 20,
+        max_chars: int = 30000,
+        nlp_batch_size: int = 8,
+        nlp_batch_wait_ms: float = 5.0,
+        mode: str = "full",
+        extraction_timeout: Optional[float] = None,
+        nlp_timeout: Optional[float] = None,
+        storage_timeout: Optional[float] = None,
+    ):
+        if mode not in EXTRACTION_MODES:
+            raise ValueError(f"Unknown extraction mode {mode!r}")
+        self.mode = mode
+        self.executor = executor
+        self.cache = cache
+        self.pages_per_chunk = pages_per_chunk
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self.engine_stats = EngineStats()
+        self.nlp_stats = NLPStats()
+        self.nlp_batcher = MicroBatcher(self._run_nlp_batch, nlp_batch_size, nlp_batch_wait_ms)
+        # 0 or None means no limit
+        self.extraction_timeout = extraction_timeout or None
+        self.nlp_timeout = nlp_timeout or None
+        self.storage_timeout = storage_timeout or None
+        self.timeouts = dict.fromkeys(STAGES, 0)
+        self.queue_timeouts = dict.fromkeys(STAGES, 0)
+        self._fallback: Optional[LiteExtractor] = None
+
+    async def parse(
+        self,
+        source: PDFSource,
+        cache_key: Optional[str] = None
+    ) -> Optional[ParsedResume]:
+        """Extract text and structured data, or None if the PDF has no text
+
+        Raises StageTimeout when extraction times out before any text is read.
+        """
+        if cache_key and self.mode != "full":
+            # Lite results are a subset of full ones; keep them apart in the cache
+            cache_key = f"{cache_key}-{self.mode}"
+
+        if self.cache and cache_key:
+            # The disk tier decodes JSON from a file; only memory hits stay on the event loop
+            cached = self.cache.get_memory(cache_key) or await asyncio.to_thread(self.cache.get, cache_key)
+            if cached:
+                return ParsedResume(*cached)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        truncated: List[str] = []
+        parsed_text, complete = await self.extract_text(source)
+        if not complete:
+            truncated.append("extraction")
+        if not parsed_text.strip():
+            return None
+
+        try:
+            structured_data, timings = await self._run_nlp(parsed_text)
+        except JobTimeout as e:
+            self._count_timeout("nlp", e)
+            logger.warning(f"NLP stage timed out, falling back to regex-only extraction: {str(e)}")
+            budget = None
+            if self.nlp_timeout:
+                budget = max(0.0, started + (self.extraction_timeout or 0.0) + self.nlp_timeout - loop.time())
+            structured_data, timings = await self._run_fallback(parsed_text, budget)
+            truncated.append("nlp")
+        self.nlp_stats.record(timings)
+
+        if self.cache and cache_key and not truncated:
+            await asyncio.to_thread(self.cache.put, cache_key, parsed_text, structured_data)
+
+        return ParsedResume(parsed_text, structured_data, tuple(truncated))
+
+    async def store(self, save: Callable[..., Any], *args: Any) -> bool:
+        """Run a blocking storage call off the event loop within the storage budget.
+
+        Returns False if the budget ran out. The write itself cannot be
+        cancelled and may still complete in the background.
+        """
+        try:
+            await asyncio.wait_for(asyncio.to_thread(save, *args), self.storage_timeout)
+            return True
+        except asyncio.TimeoutError:
+            self.timeouts["storage"] += 1
+            logger.warning(f"Storage stage exceeded {self.storage_timeout}s")
+            return False
+
+    def _fallback_extract(self, text: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        if self._fallback is None:
+            self._fallback = LiteExtractor()
+        timings: Dict[str, Any] = {}
+        return self._fallback.extract_resume_data(text, timings), timings
+
+    async def _run_fallback(self, text: str, budget: Optional[float]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Regex-only extraction in a thread, within what is left of the parse budget.
+
+        Once that runs out too, the resume is kept without extracted fields;
+        the thread cannot be cancelled and finishes in the background.
+        """
+        if budget is None or budget > 0:
+            try:
+                return await asyncio.wait_for(asyncio.to_thread(self._fallback_extract, text), budget)
+            except asyncio.TimeoutError:
+                pass
+        logger.warning("No parse budget left for regex-only extraction")
+        return {"name": "Unknown", "contact": {}, "skills": [], "experience": []}, {}
+
+    def _count_timeout(self, stage: str, error: JobTimeout) -> None:
+        self.timeouts[stage] += 1
+        if error.queued:
+            self.queue_timeouts[stage] += 1
+
+    async def _run_nlp(self, text: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        if self.mode == "lite":
+            return await self.executor.run(workers.extract_resume_data_lite, text, timeout=self.nlp_timeout)
+        result = await self.nlp_batcher.submit(text)
+        if isinstance(result, JobTimeout):
+            raise result
+        return result
+
+    async def _run_nlp_one(self, text: str) -> Any:
+        """NLP for one text, or the JobTimeout it ran into"""
+        try:
+            return await self.executor.run(workers.extract_resume_data, text, timeout=self.nlp_timeout)
+        except JobTimeout as e:
+            return e
+
+    async def _run_nlp_batch(self, texts: List[str]) -> List[Any]:
+        """One result per text: its (data, timings), or the JobTimeout it ran into"""
+        if len(texts) == 1:
+            return [await self._run_nlp_one(texts[0])]
+
+        budget = None if self.nlp_timeout is None else self.nlp_timeout * len(texts)
+        try:
+            return await self.executor.run(workers.extract_resume_data_batch, texts, timeout=budget)
+        except JobTimeout as e:
+            if e.queued:
+                return [e] * len(texts)
+            # One slow document must not send the whole batch to the fallback
+            logger.warning(f"NLP batch of {len(texts)} timed out; retrying its texts one by one")
+            return list(await asyncio.gather(*(self._run_nlp_one(text) for text in texts)))
+
+    async def extract_text(self, source: PDFSource) -> Tuple[str, bool]:
+        """Extract text from up to max_pages pages, fanning long PDFs out by page range.
+
+        Returns the text and whether every range finished within the
+        extraction budget; ranges that did not are left out.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if self.extraction_timeout is None else loop.time() + self.extraction_timeout
+
+        def remaining() -> Optional[float]:
+            return None if deadline is None else max(0.0, deadline - loop.time())
+
+        first_stop = min(self.pages_per_chunk, self.max_pages)
+        first_pages: Dict[int, str] = {}
+        try:
+            first_text, info = await self.executor.run(
+                workers.extract_page_range, source, 0, first_stop,
+                timeout=remaining(), on_progress=self._page_collector(first_pages)
+            )
+        except JobTimeout as e:
+            self._count_timeout("extraction", e)
+            partial = self._pages_text(first_pages)
+            if not partial.strip():
+                raise StageTimeout("extraction", "Timed out extracting text from PDF")
+            logger.warning(f"Extraction budget ran out; keeping {len(first_pages)} pages read so far")
+            return self._join([partial]), False
+        self.engine_stats.record(info)
+
+        texts = [first_text]
+        complete = True
+        last_page = min(info.get("pages_total", 0), self.max_pages)
+
+        if last_page > first_stop and not self._enough(len(first_text)):
+            ranges = [
+                (start, min(start + self.pages_per_chunk, last_page))
+                for start in range(first_stop, last_page, self.pages_per_chunk)
+            ]
+            logger.debug(f"Extracting {last_page} pages in {len(ranges) + 1} ranges")
+
+            range_pages: List[Dict[int, str]] = [{} for _ in ranges]
+            results = await asyncio.gather(*(
+                self.executor.run(
+                    workers.extract_page_range, source, start, stop,
+                    timeout=remaining(), on_progress=self._page_collector(pages)
+                )
+                for (start, stop), pages in zip(ranges, range_pages)
+            ), return_exceptions=True)
+            timed_out: Optional[JobTimeout] = None
+            for result, pages in zip(results, range_pages):
+                if isinstance(result, JobTimeout):
+                    # Keep whatever pages the killed worker had already read
+                    complete = False
+                    timed_out = result
+                    texts.append(self._pages_text(pages))
+                    continue
+                if isinstance(result, BaseException):
+                    raise result
+                text, range_info = result
+                self.engine_stats.record(range_info)
+                texts.append(text)
+
+            if timed_out is not None:
+                self._count_timeout("extraction", timed_out)
+                logger.warning(f"Extraction budget ran out before all {len(ranges) + 1} page ranges finished")
+
+        return self._join(texts), complete
+
+    @staticmethod
+    def _page_collector(pages: Dict[int, str]) -> Callable[[Optional[Tuple[int, str]]], None]:
+        """on_progress callback storing the (index, text) pages a worker reports.
+
+        None means the worker fell back to another PDF engine, so the pages
+        read by the rejected one are dropped.
+        """
+        def collect(page: Optional[Tuple[int, str]]) -> None:
+            if page is None:
+                pages.clear()
+                return
+            index, text = page
+            pages[index] = text
+        return collect
+
+    @staticmethod
+    def _pages_text(pages: Dict[int, str]) -> str:
+        return "\n".join(pages[index] for index in sorted(pages) if pages[index])
+
+    def _enough(self, chars: int) -> bool:
+        return bool(self.max_chars) and chars >= self.max_chars
+
+    def _join(self, texts: List[str]) -> str:
+        """Join page-range texts in order, dropping ranges past max_chars"""
+        kept: List[str] = []
+        chars = 0
+        for text in texts:
+            if self._enough(chars):
+                break
+            if text:
+                kept.append(text)
+                chars += len(text) + 1
+        return "\n".join(kept)
@@ -1,8 +1,10 @@
-import json
 import os
 from typing import List, Dict, Any
 import logging
 
+from .. import config
+from .catalog import JsonCatalog, write_json_atomic
+
 logger = logging.getLogger(__name__)
 
 class RecommendationService:
@@ -12,6 +14,7 @@ class RecommendationService:
         self.data_dir = os.path.join(os.path.dirname(__file__), "..", "data")
         self.resources_file = os.path.join(self.data_dir, "resources.json")
         self._ensure_resources_file()
+        self._store = JsonCatalog(self.resources_file, poll_interval=config.CATALOG_POLL_INTERVAL_S)
     
     def _ensure_resources_file(self):
         """Ensure resources.json file exists with default data"""
@@ -137,15 +140,12 @@ class RecommendationService:
                 ]
             }
             
-            os.makedirs(self.data_dir, exist_ok=True)
-            with open(self.resources_file, 'w') as f:
-                json.dump(default_resources, f, indent=2)
+            write_json_atomic(self.resources_file, default_resources)
     
     def get_recommendations(self, missing_skills: List[str]) -> List[Dict[str, Any]]:
         """Get learning recommendations for missing skills"""
         try:
-            with open(self.resources_file, 'r') as f:
-                resources_data = json.load(f)
+            resources_data = self._store.data
             
             recommendations = []
             
@@ -154,7 +154,7 @@ class RecommendationService:
                 if skill_resources:
                     # Add skill name to each resource
                     for resource in skill_resources:
-                        resource_with_skill = resource.copy()
+                        resource_with_skill = dict(resource)
                         resource_with_skill["skill"] = skill
                         recommendations.append(resource_with_skill)
                 else:
@@ -178,16 +178,13 @@ class RecommendationService:
     def add_resource(self, skill: str, resource: Dict[str, str]) -> bool:
         """Add a new learning resource for a skill"""
         try:
-            with open(self.resources_file, 'r') as f:
-                resources_data = json.load(f)
-            
-            if skill not in resources_data:
-                resources_data[skill] = []
-            
-            resources_data[skill].append(resource)
+            def append(resources_data):
+                if skill not in resources_data:
+                    resources_data[skill] = []
+                
+                resources_data[skill].append(resource)
             
-            with open(self.resources_file, 'w') as f:
-                json.dump(resources_data, f, indent=2)
+            self._store.update(append)
             
             return True
         except Exception as e:
@@ -1,95 +1,97 @@
-import json
 import os
 from typing import List, Dict, Any
 
+from .. import config
+from .catalog import JsonCatalog, thaw
+
 class RecommendationEngine:
     def __init__(self):
-        # Load learning resources data
-        self.learning_resources = self._load_learning_resources()
-    
-    def _load_learning_resources(self) -> Dict[str, Any]:
-        """Load learning resources for different skills."""
+        # Learning resources are served from memory and reloaded when the file changes
         resources_file = os.path.join(os.path.dirname(__file__), "..", "..", "data", "learning_resources.json")
-        
-        try:
-            with open(resources_file, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            # Fallback resources data
-            return {
-                "Python": {
-                    "skill": "Python",
-                    "description": "Learn Python programming fundamentals including data structures, functions, and object-oriented programming. Essential for data science, web development, and automation.",
-                    "difficulty": "Beginner",
-                    "estimatedHours": 40,
-                    "resources": [
-                        {
-                            "title": "Python for Everybody Specialization",
-                            "url": "https://www.coursera.org/specializations/python",
-                            "type": "Course",
-                            "provider": "Coursera",
-                            "duration": "8 months",
-                            "rating": 4.8
-                        },
-                        {
-                            "title": "Automate the Boring Stuff with Python",
-                            "url": "https://automatetheboringstuff.com/",
-                            "type": "Book",
-                            "provider": "Online Book",
-                            "duration": "Self-paced",
-                            "rating": 4.7
-                        }
-                    ]
-                },
-                "Machine Learning": {
-                    "skill": "Machine Learning",
-                    "description": "Master machine learning algorithms, model evaluation, and practical implementation using popular libraries like scikit-learn and TensorFlow.",
-                    "difficulty": "Intermediate", 
-                    "estimatedHours": 60,
-                    "resources": [
-                        {
-                            "title": "Machine Learning Course",
-                            "url": "https://www.coursera.org/learn/machine-learning",
-                            "type": "Course",
-                            "provider": "Coursera",
-                            "duration": "11 weeks",
-                            "rating": 4.9
-                        },
-                        {
-                            "title": "Hands-On Machine Learning",
-                            "url": "https://www.oreilly.com/library/view/hands-on-machine-learning/9781492032632/",
-                            "type": "Book",
-                            "provider": "O'Reilly",
-                            "duration": "Self-paced",
-                            "rating": 4.6
-                        }
-                    ]
-                },
-                "React": {
-                    "skill": "React",
-                    "description": "Learn React.js for building modern, interactive user interfaces with component-based architecture and state management.",
-                    "difficulty": "Intermediate",
-                    "estimatedHours": 35,
-                    "resources": [
-                        {
-                            "title": "React - The Complete Guide",
-                            "url": "https://www.udemy.com/course/react-the-complete-guide-incl-redux/",
-                            "type": "Course", 
-                            "provider": "Udemy",
-                            "duration": "48.5 hours",
-                            "rating": 4.6
-                        },
-                        {
-                            "title": "Official React Tutorial",
-                            "url": "https://reactjs.org/tutorial/tutorial.html",
-                            "type": "Tutorial",
-                            "provider": "React.js",
-                            "duration": "2-3 hours",
-                            "rating": 4.8
-                        }
-                    ]
-                }
+        self._store = JsonCatalog(resources_file, self._default_learning_resources, config.CATALOG_POLL_INTERVAL_S)
+    
+    @property
+    def learning_resources(self) -> Dict[str, Any]:
+        """Read-only snapshot of learning resources for different skills."""
+        return self._store.data
+    
+    @staticmethod
+    def _default_learning_resources() -> Dict[str, Any]:
+        """Fallback resources data, used while learning_resources.json is missing."""
+        return {
+            "Python": {
+                "skill": "Python",
+                "description": "Learn Python programming fundamentals including data structures, functions, and object-oriented programming. Essential for data science, web development, and automation.",
+                "difficulty": "Beginner",
+                "estimatedHours": 40,
+                "resources": [
+                    {
+                        "title": "Python for Everybody Specialization",
+                        "url": "https://www.coursera.org/specializations/python",
+                        "type": "Course",
+                        "provider": "Coursera",
+                        "duration": "8 months",
+                        "rating": 4.8
+                    },
+                    {
+                        "title": "Automate the Boring Stuff with Python",
+                        "url": "https://automatetheboringstuff.com/",
+                        "type": "Book",
+                        "provider": "Online Book",
+                        "duration": "Self-paced",
+                        "rating": 4.7
+                    }
+                ]
+            },
+            "Machine Learning": {
+                "skill": "Machine Learning",
+                "description": "Master machine learning algorithms, model evaluation, and practical implementation using popular libraries like scikit-learn and TensorFlow.",
+                "difficulty": "Intermediate", 
+                "estimatedHours": 60,
+                "resources": [
+                    {
+                        "title": "Machine Learning Course",
+                        "url": "https://www.coursera.org/learn/machine-learning",
+                        "type": "Course",
+                        "provider": "Coursera",
+                        "duration": "11 weeks",
+                        "rating": 4.9
+                    },
+                    {
+                        "title": "Hands-On Machine Learning",
+                        "url": "https://www.oreilly.com/library/view/hands-on-machine-learning/9781492032632/",
+                        "type": "Book",
+                        "provider": "O'Reilly",
+                        "duration": "Self-paced",
+                        "rating": 4.6
+                    }
+                ]
+            },
+            "React": {
+                "skill": "React",
+                "description": "Learn React.js for building modern, interactive user interfaces with component-based architecture and state management.",
+                "difficulty": "Intermediate",
+                "estimatedHours": 35,
+                "resources": [
+                    {
+                        "title": "React - The Complete Guide",
+                        "url": "https://www.udemy.com/course/react-the-complete-guide-incl-redux/",
+                        "type": "Course", 
+                        "provider": "Udemy",
+                        "duration": "48.5 hours",
+                        "rating": 4.6
+                    },
+                    {
+                        "title": "Official React Tutorial",
+                        "url": "https://reactjs.org/tutorial/tutorial.html",
+                        "type": "Tutorial",
+                        "provider": "React.js",
+                        "duration": "2-3 hours",
+                        "rating": 4.8
+                    }
+                ]
             }
+        }
     
     def generate_recommendations(self, missing_skills: List[str]) -> List[Dict[str, Any]]:
         """Generate learning recommendations for missing skills."""
@@ -100,7 +102,7 @@ class RecommendationEngine:
             skill_data = self.learning_resources.get(skill)
             
             if skill_data:
-                recommendations.append(skill_data)
+                recommendations.append(thaw(skill_data))
             else:
                 # Generate generic recommendation for unknown skills
                 recommendations.append(self._generate_generic_recommendation(skill))
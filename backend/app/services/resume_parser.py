@@ -1,14 +1,33 @@
-import pdfplumber
-import fitz  # PyMuPDF
 import re
 from typing import Dict, List, Any
 import json
 import os
+import logging
+
+from .. import config
+from .pdf_engines import PDFDocument, PDFSource
+from .sections import ResumeSections, segment
+from .skill_matcher import shared_matcher
+
+logger = logging.getLogger(__name__)
+
+_HEADER_LINES = ("resume", "cv", "curriculum vitae")
+
+# Contact patterns, compiled once
+_EMAIL = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_PATTERNS = (
+    re.compile(r'\+?\d{1,4}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}'),
+    re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'),
+    re.compile(r'\+\d{1,3}\s\d{4,14}'),
+)
+_NON_PHONE_CHARS = re.compile(r'[^\d+]')
+_YEARS = re.compile(r'(\d+)\s*(?:years?|yrs?)', re.IGNORECASE)
 
 class ResumeParser:
     def __init__(self):
         # Load skill keywords
         self.skill_keywords = self._load_skill_keywords()
+        self.skill_matcher = shared_matcher(self.skill_keywords)
     
     def _load_skill_keywords(self) -> List[str]:
         """Load predefined skill keywords for extraction."""
@@ -28,25 +47,39 @@ class ResumeParser:
                 "Agile", "Scrum", "Leadership", "Communication", "Problem Solving"
             ]
     
-    def parse_pdf(self, content: bytes, filename: str) -> Dict[str, Any]:
+    def parse_pdf(self, content: PDFSource, filename: str) -> Dict[str, Any]:
         """Parse PDF resume and extract structured information."""
         try:
-            # First try with pdfplumber
-            text = self._extract_text_pdfplumber(content)
-            
-            if not text.strip():
-                # Fallback to PyMuPDF
-                text = self._extract_text_pymupdf(content)
+            # PyMuPDF first, pdfplumber only when the text fails the quality check
+            with PDFDocument(
+                content,
+                engine_order=config.PDF_ENGINE_ORDER,
+                min_words_per_page=config.PDF_MIN_WORDS_PER_PAGE,
+                max_bad_glyph_ratio=config.PDF_MAX_BAD_GLYPH_RATIO,
+                page_range=(0, config.PDF_MAX_PAGES),
+                max_chars=config.PDF_MAX_CHARS or None
+            ) as document:
+                text = document.text()
+                logger.debug(f"Extracted {filename} with {document.extraction_info()}")
             
             if not text.strip():
                 raise Exception("Could not extract text from PDF")
             
+            # Segment once; each extractor reads only its own section
+            sections = segment(text, config.NLP_HEADER_CHARS)
+            
+            # Contact details usually sit in the header; only scan the whole
+            # text when neither the header nor a contact section has any
+            contact = self._extract_contact(sections.contact_text())
+            if not any(contact.values()):
+                contact = self._extract_contact(text)
+            
             # Extract structured information
             resume_data = {
-                "name": self._extract_name(text),
-                "contact": self._extract_contact(text),
+                "name": self._extract_name(sections),
+                "contact": contact,
                 "skills": self._extract_skills(text),
-                "experience": self._extract_experience(text)
+                "experience": self._extract_experience(sections.get("experience"))
             }
             
             return resume_data
@@ -54,41 +87,16 @@ class ResumeParser:
         except Exception as e:
             raise Exception(f"Error parsing PDF: {str(e)}")
     
-    def _extract_text_pdfplumber(self, content: bytes) -> str:
-        """Extract text using pdfplumber."""
-        import io
-        text = ""
-        
-        with pdfplumber.open(io.BytesIO(content)) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-        
-        return text
-    
-    def _extract_text_pymupdf(self, content: bytes) -> str:
-        """Extract text using PyMuPDF (fallback method)."""
-        import io
-        text = ""
-        
-        doc = fitz.open(stream=content, filetype="pdf")
-        for page in doc:
-            text += page.get_text() + "\n"
-        doc.close()
-        
-        return text
-    
-    def _extract_name(self, text: str) -> str:
-        """Extract name from resume text."""
-        lines = text.split('\n')
+    def _extract_name(self, sections: ResumeSections) -> str:
+        """Extract name from the resume header."""
+        lines = sections.header.split('\n')
         
         # Look for name in first few lines
-        for i, line in enumerate(lines[:5]):
+        for line in lines[:5]:
             line = line.strip()
             
             # Skip common headers
-            if any(header in line.lower() for header in ["resume", "cv", "curriculum vitae"]):
+            if any(header in line.lower() for header in _HEADER_LINES):
                 continue
             
             # Look for name pattern (2-4 words, mostly alphabetic)
@@ -110,102 +118,57 @@ class ResumeParser:
         contact = {"email": "", "phone": ""}
         
         # Extract email
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        email_matches = re.findall(email_pattern, text)
-        if email_matches:
-            contact["email"] = email_matches[0]
+        email = _EMAIL.search(text)
+        if email:
+            contact["email"] = email.group(0)
         
         # Extract phone
-        phone_patterns = [
-            r'\+?\d{1,4}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}',
-            r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
-            r'\+\d{1,3}\s\d{4,14}',
-        ]
-        
-        for pattern in phone_patterns:
-            phone_matches = re.findall(pattern, text)
-            if phone_matches:
+        for pattern in _PHONE_PATTERNS:
+            phone_match = pattern.search(text)
+            if phone_match:
                 # Clean up phone number
-                phone = re.sub(r'[^\d+]', '', phone_matches[0])
+                phone = _NON_PHONE_CHARS.sub('', phone_match.group(0))
                 if len(phone) >= 10:
-                    contact["phone"] = phone_matches[0]
+                    contact["phone"] = phone_match.group(0)
                     break
         
         return contact
     
     def _extract_skills(self, text: str) -> List[str]:
         """Extract skills from resume text."""
-        found_skills = []
-        text_lower = text.lower()
-        
-        # Look for each skill keyword
-        for skill in self.skill_keywords:
-            # Create pattern for skill matching
-            skill_pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            
-            if re.search(skill_pattern, text_lower):
-                found_skills.append(skill)
-        
-        # Remove duplicates and maintain order
-        return list(dict.fromkeys(found_skills))
+        # Single pass with the shared matcher; results keep catalog order
+        return self.skill_matcher.skills(text)
     
-    def _extract_experience(self, text: str) -> List[Dict[str, Any]]:
-        """Extract work experience from resume text."""
+    def _extract_experience(self, section: str) -> List[Dict[str, Any]]:
+        """Extract work experience from the experience section."""
         experience = []
-        
-        # Look for common experience section headers
-        experience_markers = [
-            "experience", "work history", "employment", "professional experience",
-            "work experience", "career history", "employment history"
-        ]
-        
-        lines = text.split('\n')
-        in_experience_section = False
         current_entry = {}
         
-        for line in lines:
+        for line in section.split('\n'):
             line = line.strip()
             if not line:
                 continue
             
-            line_lower = line.lower()
-            
-            # Check if we're entering experience section
-            if any(marker in line_lower for marker in experience_markers):
-                in_experience_section = True
+            # Try to parse job entries
+            # Look for company-role pattern or role-company pattern
+            if "•" in line or "-" in line or any(char.isdigit() for char in line):
+                # This might be a job description bullet point
                 continue
             
-            # Check if we're leaving experience section
-            if in_experience_section and any(
-                section in line_lower for section in 
-                ["education", "skills", "projects", "certifications", "achievements"]
-            ):
-                in_experience_section = False
+            # Simple heuristic for job entries
+            if len(line.split()) >= 2 and not line.startswith(("•", "-", "◦")):
                 if current_entry:
                     experience.append(current_entry)
-                break
-            
-            if in_experience_section:
-                # Try to parse job entries
-                # Look for company-role pattern or role-company pattern
-                if "•" in line or "-" in line or any(char.isdigit() for char in line):
-                    # This might be a job description bullet point
-                    continue
                 
-                # Simple heuristic for job entries
-                if len(line.split()) >= 2 and not line.startswith(("•", "-", "◦")):
-                    if current_entry:
-                        experience.append(current_entry)
-                    
-                    # Extract years (simple pattern)
-                    years_match = re.search(r'(\d+)\s*(?:years?|yrs?)', line.lower())
-                    years = int(years_match.group(1)) if years_match else 1
-                    
-                    current_entry = {
-                        "company": "Company Name",
-                        "role": line,
-                        "years": years
-                    }
+                # Extract years (simple pattern)
+                years_match = _YEARS.search(line)
+                years = int(years_match.group(1)) if years_match else 1
+                
+                current_entry = {
+                    "company": "Company Name",
+                    "role": line,
+                    "years": years
+                }
         
         # Add last entry if exists
         if current_entry:
@@ -0,0 +1,185 @@
+import threading
+from itertools import chain
+from typing import Dict, List, Mapping, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from .gap_engine import GapEngine, shared_engine
+from .skill_matcher import normalize_keyword
+
+
+class RoleScore(NamedTuple):
+    role: str
+    score: float
+    matched: List[str]
+    missing: List[str]
+
+
+def parse_weights(spec: Optional[str]) -> Dict[str, float]:
+    """Parse "skill:weight,skill:weight" into normalized skill -> weight"""
+    weights: Dict[str, float] = {}
+    if not spec:
+        return weights
+
+    for item in spec.split(","):
+        if not item.strip():
+            continue
+        skill, sep, value = item.rpartition(":")
+        if not sep or not skill.strip():
+            raise ValueError(f"weight '{item.strip()}' must look like skill:weight")
+        try:
+            weight = float(value)
+        except ValueError:
+            raise ValueError(f"weight for '{skill.strip()}' is not a number")
+        if weight < 0 or not np.isfinite(weight):
+            raise ValueError(f"weight for '{skill.strip()}' must be a non-negative number")
+        weights[normalize_keyword(skill)] = weight
+    return weights
+
+
+class RoleMatrix:
+    """Every role of a catalog as one row of a sparse 0/1 role x skill matrix.
+
+    The matrix is held in CSR form (indptr/indices per role) and, for
+    scoring, transposed into per-skill postings of the roles that require
+    the skill, so memory grows with the number of (role, skill) pairs rather
+    than roles x distinct skills. A user's coverage of every role is then
+    accumulated over the postings of the user's own skills only, weighted
+    per skill, and divided by each role's total required weight. top_k
+    expands only the best roles into matched and missing skill lists;
+    gaps() splits every row at once, for batch analysis.
+    """
+
+    def __init__(self, roles: Mapping[str, Sequence[str]], engine: Optional[GapEngine] = None):
+        self.engine = engine or shared_engine()
+        self.taxonomy = self.engine.taxonomy
+        self.roles = list(roles)
+        self.role_skills = [list(roles[role]) for role in self.roles]
+
+        self.columns: Dict[str, int] = {}
+        rows: List[List[int]] = []
+        # Each entry's skill as the role names it, so rows read back in role order
+        self._entry_skills: List[str] = []
+        for skills in self.role_skills:
+            row: Dict[int, None] = {}
+            for skill in skills:
+                column = self.columns.setdefault(self.taxonomy.key(skill), len(self.columns))
+                # Aliases of one skill in the same role count once, as the first name listed
+                if column not in row:
+                    row[column] = None
+                    self._entry_skills.append(skill)
+            rows.append(list(row))
+
+        lengths = np.fromiter((len(row) for row in rows), dtype=np.int64, count=len(rows))
+        self.indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self.indptr[1:])
+        self.indices = np.fromiter(chain.from_iterable(rows), dtype=np.int32, count=int(self.indptr[-1]))
+        self._entry_rows = np.repeat(np.arange(len(rows), dtype=np.int32), lengths)
+
+        # Column-major copy: the roles requiring each skill, as one slice per column
+        order = np.argsort(self.indices, kind="stable")
+        self._posting_rows = self._entry_rows[order]
+        self._posting_ptr = np.zeros(len(self.columns) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.indices, minlength=len(self.columns)), out=self._posting_ptr[1:])
+
+        self.required = lengths.astype(np.float32)
+
+    def __len__(self) -> int:
+        return len(self.roles)
+
+    def scores(self, user_skills: Sequence[str], weights: Optional[Mapping[str, float]] = None) -> np.ndarray:
+        """Weighted share (0-100) of each role's required skills the user has"""
+        return self.batch_scores([user_skills], weights)[0]
+
+    def batch_scores(
+        self, users: Sequence[Sequence[str]], weights: Optional[Mapping[str, float]] = None
+    ) -> np.ndarray:
+        """Scores of several users at once, as a users x roles array"""
+        required = self.required
+        skill_weights: Dict[int, float] = {}
+        if weights:
+            for skill, weight in weights.items():
+                column = self.columns.get(self.taxonomy.key(skill))
+                if column is not None:
+                    skill_weights[column] = weight
+            column_weights = np.ones(len(self.columns), dtype=np.float32)
+            for column, weight in skill_weights.items():
+                column_weights[column] = weight
+            required = np.bincount(
+                self._entry_rows, weights=column_weights[self.indices], minlength=len(self.roles)
+            ).astype(np.float32)
+
+        covered = np.zeros((len(users), len(self.roles)), dtype=np.float32)
+        for row, user_skills in enumerate(users):
+            for skill in self.taxonomy.expand_keys(user_skills):
+                column = self.columns.get(skill)
+                if column is None:
+                    continue
+                # A role lists a skill at most once, so the posting has no repeated rows
+                posting = self._posting_rows[self._posting_ptr[column]:self._posting_ptr[column + 1]]
+                covered[row, posting] += skill_weights.get(column, 1.0)
+
+        return np.divide(covered * 100, required, out=np.zeros_like(covered), where=required > 0)
+
+    def gaps(self, user_skills: Sequence[str]) -> List[RoleScore]:
+        """The user against every role, in catalog order, with matched and missing skills"""
+        has = np.zeros(len(self.columns), dtype=bool)
+        columns = [self.columns[key] for key in self.taxonomy.expand_keys(user_skills) if key in self.columns]
+        has[columns] = True
+
+        entry_has = has[self.indices]
+        covered = np.bincount(self._entry_rows, weights=entry_has, minlength=len(self.roles))
+        scores = np.divide(covered * 100, self.required, out=np.zeros(len(self.roles)), where=self.required > 0)
+
+        flags = entry_has.tolist()
+        indptr = self.indptr.tolist()
+        gaps = []
+        for row, role in enumerate(self.roles):
+            start, end = indptr[row], indptr[row + 1]
+            matched: List[str] = []
+            missing: List[str] = []
+            for skill, found in zip(self._entry_skills[start:end], flags[start:end]):
+                (matched if found else missing).append(skill)
+            gaps.append(RoleScore(role, round(float(scores[row]), 1), matched, missing))
+        return gaps
+
+    def top_k(
+        self, user_skills: Sequence[str], k: int, weights: Optional[Mapping[str, float]] = None
+    ) -> List[RoleScore]:
+        """The k best-covered roles, best first, with matched and missing skills"""
+        if not self.roles or k <= 0:
+            return []
+
+        scores = self.scores(user_skills, weights)
+        k = min(k, len(self.roles))
+        best = np.argpartition(-scores, k - 1)[:k] if k < len(self.roles) else np.arange(len(self.roles))
+        best = best[np.argsort(-scores[best], kind="stable")]
+
+        ranked = []
+        for row in best:
+            gap = self.engine.analyze(user_skills, self.role_skills[row])
+            ranked.append(RoleScore(self.roles[row], round(float(scores[row]), 1), gap.matched, gap.missing))
+        return ranked
+
+
+class RoleRanker:
+    """Keeps a RoleMatrix over the job service's catalog, rebuilt when the catalog version changes"""
+
+    def __init__(self, job_service):
+        self.job_service = job_service
+        self._lock = threading.Lock()
+        self._version = None
+        self._matrix: Optional[RoleMatrix] = None
+
+    def matrix(self) -> RoleMatrix:
+        catalog = self.job_service.get_catalog()
+        with self._lock:
+            if self._matrix is None or catalog.version != self._version:
+                self._matrix = RoleMatrix(catalog.roles)
+                self._version = catalog.version
+            return self._matrix
+
+    def best_roles(
+        self, user_skills: Sequence[str], k: int, weights: Optional[Mapping[str, float]] = None
+    ) -> List[RoleScore]:
+        return self.matrix().top_k(user_skills, k, weights)
@@ -0,0 +1,62 @@
+import re
+from bisect import bisect_left
+from typing import Iterable, List, NamedTuple, Tuple
+
+import numpy as np
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens of a role title or query ("C++ Developer" -> ["c++", "developer"])"""
+    return [token.rstrip(".") or token for token in _TOKEN.findall(text.lower())]
+
+
+class RolePage(NamedTuple):
+    roles: List[str]
+    total: int
+
+
+class RoleSearchIndex:
+    """Case-insensitive token-prefix search over role titles.
+
+    Roles are numbered in alphabetical order and every (token, role number)
+    pair sits in one list sorted by token, so the roles having a token with
+    a given prefix are one contiguous slice found by two bisections. Each
+    query prefix marks its slice in a boolean mask over all roles; ANDing
+    the masks and reading off the set positions yields the matches already
+    in alphabetical order, with an exact total for pagination.
+    """
+
+    def __init__(self, roles: Iterable[str]):
+        self.names = sorted(roles, key=lambda name: (name.lower(), name))
+        pairs = sorted(
+            (token, rank) for rank, name in enumerate(self.names) for token in set(tokenize(name))
+        )
+        self._keys = [token for token, _ in pairs]
+        self._ranks = np.fromiter((rank for _, rank in pairs), dtype=np.int64, count=len(pairs))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _prefix_range(self, prefix: str) -> Tuple[int, int]:
+        start = bisect_left(self._keys, prefix)
+        # Every string with this prefix sorts before prefix + U+10FFFF
+        return start, bisect_left(self._keys, prefix + "\U0010ffff", start)
+
+    def search(self, query: str, offset: int = 0, limit: int = 20) -> RolePage:
+        """A page of roles with a title word starting with each query word, alphabetically"""
+        prefixes = tokenize(query)
+        if not prefixes:
+            return RolePage(self.names[offset:offset + limit], len(self.names))
+
+        matches = None
+        for start, stop in sorted(map(self._prefix_range, set(prefixes)), key=lambda span: span[1] - span[0]):
+            if start == stop:
+                return RolePage([], 0)
+            mask = np.zeros(len(self.names), dtype=bool)
+            mask[self._ranks[start:stop]] = True
+            matches = mask if matches is None else matches & mask
+
+        ranks = np.flatnonzero(matches)
+        return RolePage([self.names[rank] for rank in ranks[offset:offset + limit]], len(ranks))
@@ -0,0 +1,113 @@
+"""Role catalog storage formats, chosen by file extension.
+
+- `.json`: one object mapping role name to its list of required skills
+- `.jsonl`: one `{"role": ..., "skills": [...]}` object per line
+- `.sqlite` / `.db`: a `roles(name TEXT PRIMARY KEY, skills TEXT)` table,
+  skills stored as a JSON array
+
+JSON and JSONL catalogs are written whole to a temp file and renamed into
+place. A SQLite catalog is updated in place in a single transaction, so
+other tables and columns kept in the same database survive. Either way
+readers never see a partial catalog.
+"""
+import json
+import os
+import sqlite3
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Mapping, Sequence
+
+from .catalog import write_json_atomic
+
+
+def role_format(path: str) -> str:
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".jsonl":
+        return "jsonl"
+    if extension in (".sqlite", ".sqlite3", ".db"):
+        return "sqlite"
+    return "json"
+
+
+def load_roles(path: str) -> Dict[str, List[str]]:
+    """Read a role catalog in whichever format its extension names"""
+    kind = role_format(path)
+    if kind == "jsonl":
+        roles: Dict[str, List[str]] = {}
+        with open(path, "r") as f:
+            for number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    roles[record["role"]] = list(record.get("skills", []))
+                except (ValueError, KeyError, TypeError) as e:
+                    raise ValueError(f"{path}:{number}: invalid role record ({str(e)})")
+        return roles
+
+    if kind == "sqlite":
+        # Opened read-only, so a missing file is an error rather than a new database
+        connection = sqlite3.connect(Path(path).absolute().as_uri() + "?mode=ro", uri=True)
+        try:
+            rows = connection.execute("SELECT name, skills FROM roles ORDER BY rowid").fetchall()
+        finally:
+            connection.close()
+        return {name: json.loads(skills) for name, skills in rows}
+
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def save_roles(path: str, roles: Mapping[str, Sequence[str]]) -> None:
+    """Replace a role catalog atomically, in whichever format its extension names"""
+    kind = role_format(path)
+    if kind == "json":
+        write_json_atomic(path, {role: list(skills) for role, skills in roles.items()})
+        return
+    if kind == "sqlite":
+        _save_sqlite(path, roles)
+        return
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            for role, skills in roles.items():
+                f.write(json.dumps({"role": role, "skills": list(skills)}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _save_sqlite(path: str, roles: Mapping[str, Sequence[str]]) -> None:
+    """Bring the roles table in line with roles, touching only the rows that differ"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    connection = sqlite3.connect(path, isolation_level=None)
+    try:
+        # Take the write lock before reading, so a concurrent writer cannot slip in between
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute("CREATE TABLE IF NOT EXISTS roles (name TEXT PRIMARY KEY, skills TEXT NOT NULL)")
+            current = dict(connection.execute("SELECT name, skills FROM roles"))
+            encoded = {role: json.dumps(list(skills)) for role, skills in roles.items()}
+            connection.executemany(
+                "INSERT INTO roles (name, skills) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET skills = excluded.skills",
+                ((role, skills) for role, skills in encoded.items() if current.get(role) != skills),
+            )
+            connection.executemany(
+                "DELETE FROM roles WHERE name = ?", ((role,) for role in current if role not in encoded)
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+    finally:
+        connection.close()
@@ -0,0 +1,100 @@
+import re
+from typing import Dict, List, NamedTuple, Optional
+
+SECTION_KINDS = ("header", "contact", "experience", "education", "skills", "projects", "other")
+
+# Heading vocabulary per section kind. A heading is a line holding nothing
+# but one of these (optionally followed by a colon); "other" covers headings
+# that only matter because they end the previous section.
+_HEADING_PATTERNS = {
+    "contact": r"contact(?:[ \t]+(?:information|info|details))?",
+    "experience": (
+        r"(?:professional[ \t]+|work[ \t]+|relevant[ \t]+)?"
+        r"(?:experience|employment(?:[ \t]+history)?|work[ \t]+history|career[ \t]+history)"
+    ),
+    "education": r"education(?:al[ \t]+background)?|academic[ \t]+background|academics",
+    "skills": (
+        r"(?:technical[ \t]+|core[ \t]+|key[ \t]+)?(?:skills|competencies)"
+        r"(?:[ \t]*(?:&|and)[ \t]*(?:tools|technologies))?|technologies"
+    ),
+    "projects": r"(?:personal[ \t]+|academic[ \t]+|key[ \t]+|selected[ \t]+)?projects",
+    "other": (
+        r"certifications?|achievements|awards|publications|(?:professional[ \t]+)?summary"
+        r"|objective|profile|interests|languages|references|volunteer(?:ing)?"
+    ),
+}
+
+_HEADING = re.compile(
+    r"^[ \t]*(?:"
+    + "|".join(f"(?P<{kind}>{pattern})" for kind, pattern in _HEADING_PATTERNS.items())
+    + r")[ \t]*:?[ \t]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+class Section(NamedTuple):
+    kind: str
+    heading: str
+    start: int
+    end: int
+
+
+class ResumeSections:
+    """A resume text split into typed sections by segment()"""
+
+    def __init__(self, text: str, sections: List[Section]):
+        self.text = text
+        self.sections = sections
+
+    def slices(self, kind: str) -> List[str]:
+        """Bodies of every section of a kind, in document order"""
+        return [self.text[section.start:section.end] for section in self.sections if section.kind == kind]
+
+    def get(self, kind: str, max_chars: Optional[int] = None) -> str:
+        """Text of all sections of a kind joined together, optionally capped"""
+        text = "\n".join(self.slices(kind))
+        return text[:max_chars] if max_chars else text
+
+    def has(self, kind: str) -> bool:
+        return any(section.kind == kind for section in self.sections)
+
+    @property
+    def header(self) -> str:
+        return self.get("header")
+
+    def contact_text(self) -> str:
+        """Where contact details live: the header plus any contact section"""
+        return "\n".join(self.slices("header") + self.slices("contact"))
+
+    def kinds(self) -> Dict[str, int]:
+        """Characters per section kind, for debugging segmentation"""
+        sizes: Dict[str, int] = {}
+        for section in self.sections:
+            sizes[section.kind] = sizes.get(section.kind, 0) + section.end - section.start
+        return sizes
+
+
+def segment(text: str, header_chars: int = 400) -> ResumeSections:
+    """Split resume text into typed sections in a single scan.
+
+    Everything before the first heading is the header, capped at about
+    header_chars (cut at a line break) so a resume without recognisable
+    headings does not hand its whole text to the header extractors; the
+    remainder becomes an "other" section.
+    """
+    sections: List[Section] = []
+    kind, heading, start = "header", "", 0
+
+    for match in _HEADING.finditer(text):
+        sections.append(Section(kind, heading, start, match.start()))
+        kind, heading, start = match.lastgroup, match.group(0).strip(), match.end()
+    sections.append(Section(kind, heading, start, len(text)))
+
+    header = sections[0]
+    if header.end > header_chars:
+        cut = text.rfind("\n", 0, header_chars)
+        cut = cut if cut > 0 else header_chars
+        sections[0] = header._replace(end=cut)
+        sections.insert(1, Section("other", "", cut, header.end))
+
+    return ResumeSections(text, [section for section in sections if section.end > section.start])
@@ -0,0 +1,114 @@
+import threading
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from .taxonomy import shared_taxonomy
+
+MATCH_MODES = ("and", "or")
+
+
+class SkillIndex:
+    """Inverted index from canonical skill ID to the keys (roles, users) that list it.
+
+    Built from its source by the first refresh (owners do that at startup)
+    and rebuilt when the source's stamp changes behind our back. The owner
+    reports each of its own writes with update(), which patches just the
+    changed keys when nothing else wrote since the index was last current,
+    and rebuilds otherwise. A query touches only the posting sets of the
+    skills asked about, so it costs about the size of the result rather
+    than the size of the catalog.
+    """
+
+    def __init__(self):
+        self._key = shared_taxonomy().key
+        self._lock = threading.RLock()
+        self._postings: Dict[str, Set[str]] = {}
+        self._keys: Dict[str, Set[str]] = {}
+        self._stamp = None
+        self._built = False
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def refresh(self, stamp, load: Callable[[], Iterable[Tuple[str, Iterable[str]]]]) -> None:
+        """Rebuild from load() unless the index was built from this stamp"""
+        with self._lock:
+            if self._built and stamp == self._stamp:
+                return
+            self._rebuild(stamp, load)
+
+    def update(
+        self,
+        before,
+        after,
+        changes: Mapping[str, Optional[Iterable[str]]],
+        load: Callable[[], Iterable[Tuple[str, Iterable[str]]]],
+    ) -> None:
+        """Account for a write that took the source from stamp before to stamp after.
+
+        changes maps each written key to its new skills, or None when it was
+        removed. They are applied in place only if the index was current as
+        of before; otherwise someone else wrote in between, and the index is
+        rebuilt from load(), the source's contents after the write.
+        """
+        with self._lock:
+            if not self._built:
+                return
+            if before is None or before != self._stamp:
+                self._rebuild(after, load)
+                return
+            for key, skills in changes.items():
+                if skills is None:
+                    self._remove(key)
+                else:
+                    self._add(key, skills)
+            self._stamp = after
+
+    def query(self, skills: Iterable[str], match: str = "and") -> List[str]:
+        """Keys listing all (match="and") or any (match="or") of the skills, sorted"""
+        if match not in MATCH_MODES:
+            raise ValueError(f"match must be one of: {', '.join(MATCH_MODES)}")
+
+        wanted = {self._key(skill) for skill in skills if skill.strip()}
+        if not wanted:
+            return []
+
+        with self._lock:
+            postings = [self._postings.get(skill, set()) for skill in wanted]
+            if match == "or":
+                found = set().union(*postings)
+            else:
+                postings.sort(key=len)
+                found = set(postings[0])
+                for posting in postings[1:]:
+                    if not found:
+                        break
+                    found &= posting
+        return sorted(found)
+
+    def skills_of(self, key: str) -> Optional[Set[str]]:
+        with self._lock:
+            skills = self._keys.get(key)
+            return set(skills) if skills is not None else None
+
+    def _rebuild(self, stamp, load: Callable[[], Iterable[Tuple[str, Iterable[str]]]]) -> None:
+        self._postings = {}
+        self._keys = {}
+        for key, skills in load():
+            self._add(key, skills)
+        self._stamp = stamp
+        self._built = True
+
+    def _add(self, key: str, skills: Iterable[str]) -> None:
+        self._remove(key)
+        normalized = {self._key(skill) for skill in skills or () if isinstance(skill, str) and skill.strip()}
+        self._keys[key] = normalized
+        for skill in normalized:
+            self._postings.setdefault(skill, set()).add(key)
+
+    def _remove(self, key: str) -> None:
+        for skill in self._keys.pop(key, ()):
+            posting = self._postings.get(skill)
+            if posting is not None:
+                posting.discard(key)
+                if not posting:
+                    del self._postings[skill]
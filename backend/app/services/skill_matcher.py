@@ -0,0 +1,110 @@
+import re
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+# A skill must not be glued to surrounding word characters: "r" must not match
+# inside "docker", and "c" must not match the start of "c++" or "c#".
+_LEFT_BOUNDARY = r"(?<![A-Za-z0-9_])"
+_RIGHT_BOUNDARY = r"(?![A-Za-z0-9_+#])"
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class SkillMatch(NamedTuple):
+    skill: str
+    start: int
+    end: int
+
+
+def normalize_keyword(keyword: str) -> str:
+    """Lowercase and collapse internal whitespace"""
+    return _WHITESPACE.sub(" ", keyword.strip().lower())
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """Compile keywords into a regex alternation factored by common prefix.
+
+    A flat alternation makes the regex engine retry every keyword at every
+    position; factoring by prefix means each position walks a single trie
+    path, so one scan costs about the same for 50 or 10k keywords. Optional
+    suffix groups are greedy, so the longest keyword wins ("react native"
+    over "react").
+    """
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        terminal = "" in node
+        branches = []
+        for char in sorted(key for key in node if key):
+            atom = r"\s+" if char == " " else re.escape(char)
+            branches.append(atom + build(node[char]))
+
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if terminal:
+            return "(?:" + body + ")?"
+        return body
+
+    return build(trie)
+
+
+class SkillMatcher:
+    """Find every catalog skill in a text in one linear pass.
+
+    Built once from a keyword catalog into a single compiled, prefix-factored
+    regex with word boundaries. Matching is case-insensitive and tolerant of
+    line breaks inside multi-word skills.
+    """
+
+    def __init__(self, keywords: Iterable[str], display: Optional[Callable[[str], str]] = None):
+        self._names: Dict[str, str] = {}
+        self._rank: Dict[str, int] = {}
+        for keyword in keywords:
+            key = normalize_keyword(keyword)
+            if not key or key in self._names:
+                continue
+            self._names[key] = display(keyword) if display else keyword
+            self._rank[key] = len(self._rank)
+
+        if self._names:
+            pattern = _LEFT_BOUNDARY + "(?:" + _trie_pattern(self._names) + ")" + _RIGHT_BOUNDARY
+        else:
+            pattern = r"(?!x)x"
+        self._pattern = re.compile(pattern, re.IGNORECASE)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def finditer(self, text: str) -> Iterator[SkillMatch]:
+        """Yield every skill occurrence with its character offsets"""
+        for match in self._pattern.finditer(text):
+            name = self._names.get(normalize_keyword(match.group(0)))
+            if name is not None:
+                yield SkillMatch(name, match.start(), match.end())
+
+    def find_all(self, text: str) -> List[SkillMatch]:
+        return list(self.finditer(text))
+
+    def skills(self, text: str) -> List[str]:
+        """Distinct skills found in the text, in catalog order"""
+        found = {normalize_keyword(match.group(0)) for match in self._pattern.finditer(text)}
+        found &= self._rank.keys()
+        # Aliases display as one name ("golang" and "go" are both "Go"); list it once
+        names = (self._names[key] for key in sorted(found, key=self._rank.__getitem__))
+        return list(dict.fromkeys(names))
+
+
+@lru_cache(maxsize=16)
+def _cached_matcher(keywords: Tuple[str, ...], display: Optional[Callable[[str], str]]) -> SkillMatcher:
+    return SkillMatcher(keywords, display)
+
+
+def shared_matcher(keywords: Iterable[str], display: Optional[Callable[[str], str]] = None) -> SkillMatcher:
+    """Process-wide matcher for a keyword catalog, compiled on first use"""
+    return _cached_matcher(tuple(keywords), display)
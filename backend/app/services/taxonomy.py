@@ -0,0 +1,124 @@
+import hashlib
+import json
+import logging
+import os
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Set
+
+from .skill_matcher import normalize_keyword
+
+logger = logging.getLogger(__name__)
+
+TAXONOMY_FILE = os.path.join(os.path.dirname(__file__), "..", "data", "skill_taxonomy.json")
+
+
+class SkillTaxonomy:
+    """Skill aliases and implications compiled into lookup tables.
+
+    Every alias resolves to one canonical skill ID (the normalized canonical
+    name), and each ID maps to the transitive closure of the skills it
+    implies, computed once here. Canonicalizing or expanding a skill is then
+    a single dictionary lookup. Skills the taxonomy does not know are their
+    own canonical ID and imply nothing, so an empty taxonomy is plain
+    case-insensitive matching.
+    """
+
+    def __init__(self, skills: Optional[Mapping[str, Mapping[str, List[str]]]] = None):
+        self._canonical: Dict[str, str] = {}
+        self._names: Dict[str, str] = {}
+        skills = skills or {}
+
+        for name in skills:
+            skill_id = normalize_keyword(name)
+            self._names[skill_id] = name
+            self._canonical[skill_id] = skill_id
+        for name, entry in skills.items():
+            skill_id = normalize_keyword(name)
+            for alias in (entry or {}).get("aliases", []):
+                alias_id = normalize_keyword(alias)
+                if self._canonical.get(alias_id, skill_id) != skill_id:
+                    logger.warning(f"Skill alias '{alias}' of {name} already names {self._canonical[alias_id]}")
+                    continue
+                self._canonical[alias_id] = skill_id
+
+        edges: Dict[str, Set[str]] = {}
+        for name, entry in skills.items():
+            implied = {self.key(skill) for skill in (entry or {}).get("implies", [])}
+            implied.discard(normalize_keyword(name))
+            edges[normalize_keyword(name)] = implied
+
+        self._closure: Dict[str, FrozenSet[str]] = {}
+        for skill_id in edges:
+            self._closure[skill_id] = self._close(skill_id, edges)
+
+    @staticmethod
+    def _close(skill_id: str, edges: Mapping[str, Set[str]]) -> FrozenSet[str]:
+        """Every skill reachable from skill_id over implies edges, itself excluded"""
+        seen: Set[str] = set()
+        stack = list(edges.get(skill_id, ()))
+        while stack:
+            current = stack.pop()
+            if current in seen or current == skill_id:
+                continue
+            seen.add(current)
+            stack.extend(edges.get(current, ()))
+        return frozenset(seen)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def fingerprint(self) -> str:
+        """Hash of the compiled tables, for caches of output that went through them"""
+        digest = hashlib.sha256()
+        for table in (self._names, self._canonical):
+            for key, value in sorted(table.items()):
+                digest.update(f"{key}\0{value}\n".encode("utf-8"))
+        for skill_id, implied in sorted(self._closure.items()):
+            digest.update(f"{skill_id}\0{','.join(sorted(implied))}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    def key(self, skill: str) -> str:
+        """Canonical ID of a skill or any of its aliases"""
+        normalized = normalize_keyword(skill)
+        return self._canonical.get(normalized, normalized)
+
+    def canonical(self, skill: str) -> str:
+        """Canonical display name, or the skill as given when the taxonomy does not know it"""
+        return self._names.get(self.key(skill), skill)
+
+    def terms(self) -> List[str]:
+        """Every normalized name and alias the taxonomy resolves"""
+        return list(self._canonical)
+
+    def knows(self, skill: str) -> bool:
+        return self.key(skill) in self._names
+
+    def implied(self, skill: str) -> FrozenSet[str]:
+        """Canonical IDs a skill implies, transitively"""
+        return self._closure.get(self.key(skill), frozenset())
+
+    def expand_keys(self, skills: Iterable[str]) -> Set[str]:
+        """Canonical IDs of the skills plus everything they imply"""
+        keys: Set[str] = set()
+        for skill in skills:
+            skill_id = self.key(skill)
+            keys.add(skill_id)
+            keys |= self._closure.get(skill_id, frozenset())
+        return keys
+
+    @classmethod
+    def load(cls, path: str = TAXONOMY_FILE) -> "SkillTaxonomy":
+        try:
+            with open(path, "r") as f:
+                return cls(json.load(f).get("skills", {}))
+        except FileNotFoundError:
+            return cls()
+        except Exception as e:
+            logger.error(f"Error loading skill taxonomy: {str(e)}")
+            return cls()
+
+
+@lru_cache(maxsize=None)
+def shared_taxonomy() -> SkillTaxonomy:
+    """Process-wide taxonomy, compiled from skill_taxonomy.json on first use"""
+    return SkillTaxonomy.load()
@@ -0,0 +1,187 @@
+import hashlib
+import logging
+import os
+import tempfile
+import zipfile
+import zlib
+from typing import List, Optional
+
+import aiofiles
+
+from .pdf_engines import PDFSource
+
+logger = logging.getLogger(__name__)
+
+# A PDF header must appear within the first 1024 bytes of the file
+PDF_MAGIC = b"%PDF-"
+PDF_HEADER_WINDOW = 1024
+
+
+class UploadRejected(ValueError):
+    """Raised when an upload fails validation while it is being read"""
+
+
+def size_limit_message(max_bytes: int) -> str:
+    """User-facing message for an upload over the size limit"""
+    if max_bytes >= 1024 * 1024:
+        return f"File size must be less than {max_bytes // (1024 * 1024)}MB"
+    return f"File size must be less than {max(1, max_bytes // 1024)}KB"
+
+
+class SpooledUpload:
+    """An uploaded PDF held in memory or, past a threshold, in a temp file.
+
+    `source` is what the PDF engines should open: bytes for small uploads,
+    a file path for large ones so workers can open the file directly instead
+    of receiving a pickled copy of the body.
+    """
+
+    def __init__(self, data: Optional[bytes], path: Optional[str], size: int, sha256: str):
+        self.data = data
+        self.path = path
+        self.size = size
+        self.sha256 = sha256
+
+    @property
+    def source(self) -> PDFSource:
+        return self.path if self.path is not None else self.data
+
+    def close(self) -> None:
+        """Delete the spill file, if any"""
+        if self.path is not None:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Error removing upload spill file {self.path}: {str(e)}")
+            self.path = None
+
+    def __enter__(self) -> "SpooledUpload":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+async def read_pdf_upload(
+    file,
+    max_bytes: int,
+    spill_bytes: int,
+    chunk_size: int = 64 * 1024,
+) -> SpooledUpload:
+    """Copy an UploadFile in chunks, validating it on the way.
+
+    The PDF header is checked on the first chunk and the size limit per
+    chunk, so a bad file is rejected before it is hashed or copied in full.
+    By now the multipart body has already been received and spooled by the
+    form parser; what bounds that is RequestSizeLimit (api/limits.py),
+    which refuses oversized requests before the form is parsed. The SHA-256
+    is computed on the fly for the parse cache.
+    """
+    digest = hashlib.sha256()
+    chunks: List[bytes] = []
+    buffered = 0
+    size = 0
+    path: Optional[str] = None
+    spill = None
+
+    try:
+        while True:
+            chunk = await file.read(chunk_size)
+            if not chunk:
+                break
+
+            if size == 0 and PDF_MAGIC not in chunk[:PDF_HEADER_WINDOW]:
+                raise UploadRejected("File is not a valid PDF")
+
+            size += len(chunk)
+            if size > max_bytes:
+                raise UploadRejected(size_limit_message(max_bytes))
+
+            digest.update(chunk)
+
+            if spill is None and buffered + len(chunk) > spill_bytes:
+                fd, path = tempfile.mkstemp(prefix="skillgap-upload-", suffix=".pdf")
+                os.close(fd)
+                spill = await aiofiles.open(path, "wb")
+                for buffered_chunk in chunks:
+                    await spill.write(buffered_chunk)
+                chunks = []
+
+            if spill is not None:
+                await spill.write(chunk)
+            else:
+                chunks.append(chunk)
+                buffered += len(chunk)
+
+        if size == 0:
+            raise UploadRejected("Uploaded file is empty")
+
+    except BaseException:
+        if spill is not None:
+            await spill.close()
+        if path is not None:
+            os.remove(path)
+        raise
+
+    if spill is not None:
+        await spill.close()
+        return SpooledUpload(None, path, size, digest.hexdigest())
+
+    return SpooledUpload(b"".join(chunks), None, size, digest.hexdigest())
+
+
+def zip_pdf_members(archive: zipfile.ZipFile) -> List[zipfile.ZipInfo]:
+    """PDF members of a zip archive in archive order, skipping folders and OS metadata"""
+    return [
+        info for info in archive.infolist()
+        if not info.is_dir()
+        and info.filename.lower().endswith(".pdf")
+        and not info.filename.startswith("__MACOSX/")
+    ]
+
+
+def read_zip_member(
+    archive: zipfile.ZipFile,
+    info: zipfile.ZipInfo,
+    max_bytes: int,
+    chunk_size: int = 64 * 1024,
+) -> SpooledUpload:
+    """Decompress one zip member into memory, validating it as it is read.
+
+    The size limit is enforced on the decompressed stream rather than trusting
+    the size declared in the archive, so a zip bomb is cut off early. Corrupt
+    members surface as UploadRejected.
+    """
+    if info.file_size > max_bytes:
+        raise UploadRejected(size_limit_message(max_bytes))
+
+    digest = hashlib.sha256()
+    chunks: List[bytes] = []
+    size = 0
+
+    try:
+        with archive.open(info) as member:
+            while True:
+                chunk = member.read(chunk_size)
+                if not chunk:
+                    break
+
+                if size == 0 and PDF_MAGIC not in chunk[:PDF_HEADER_WINDOW]:
+                    raise UploadRejected("File is not a valid PDF")
+
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadRejected(size_limit_message(max_bytes))
+
+                digest.update(chunk)
+                chunks.append(chunk)
+    except (zipfile.BadZipFile, zlib.error, EOFError, NotImplementedError, RuntimeError) as e:
+        # CRC mismatches, truncated data, unsupported compression, encryption
+        raise UploadRejected(f"Corrupt archive member: {str(e)}")
+
+    if size == 0:
+        raise UploadRejected("Uploaded file is empty")
+
+    return SpooledUpload(b"".join(chunks), None, size, digest.hexdigest())
@@ -0,0 +1,289 @@
+import hashlib
+import importlib
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .. import config
+from .executor import report_progress
+from .parser import ResumeParser
+from .nlp import LiteExtractor, NLPProcessor, extraction_keywords
+from .pdf_engines import PDFSource
+from .taxonomy import shared_taxonomy
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever a change to text extraction or NLP alters parse output;
+# cached parses from older versions are then discarded.
+EXTRACTOR_VERSION = "6"
+
+# Per-process service instances, built once by init_worker
+_resume_parser: Optional[ResumeParser] = None
+_nlp_processor: Optional[NLPProcessor] = None
+_lite_extractor: Optional[LiteExtractor] = None
+
+# How long this worker took to import heavy modules and load models
+_init_report: Dict[str, Any] = {}
+
+# Imported up front by init_worker so the first real job does not pay for them
+HEAVY_MODULES = ("spacy", "fitz", "pdfplumber")
+
+WARMUP_TEXT = (
+    "Jane Doe\n"
+    "jane.doe@example.com | +1 555 123 4567\n"
+    "Experience\n"
+    "Software Engineer at Example Corp 2019 - 2023\n"
+    "Skills\n"
+    "Python, SQL, Docker, React, AWS\n"
+)
+
+
+def extractor_fingerprint() -> str:
+    """Identify the extractor version, settings, skill catalog and taxonomy that parse output depends on"""
+    digest = hashlib.sha256(EXTRACTOR_VERSION.encode("utf-8"))
+    # Engine choice, the text quality check and the read limits all change the extracted text
+    settings = (
+        config.NLP_PROFILE,
+        config.NLP_HEADER_CHARS,
+        config.NLP_SECTION_MAX_CHARS,
+        ",".join(config.PDF_ENGINE_ORDER),
+        config.PDF_MIN_WORDS_PER_PAGE,
+        config.PDF_MAX_BAD_GLYPH_RATIO,
+        config.PDF_MAX_PAGES,
+        config.PDF_MAX_CHARS,
+    )
+    for setting in settings:
+        digest.update(b"\0" + str(setting).encode("utf-8"))
+    for keyword in extraction_keywords():
+        digest.update(b"\0" + keyword.encode("utf-8"))
+    # Skill names in parse output are canonicalized through the taxonomy
+    digest.update(b"\0" + shared_taxonomy().fingerprint().encode("utf-8"))
+    return digest.hexdigest()
+
+
+def synthetic_resume_pdf(text: str = WARMUP_TEXT) -> bytes:
+    """A minimal one-page PDF with the given text, used to exercise extraction at startup"""
+    lines = [
+        line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+        for line in text.splitlines()
+    ]
+    content = "BT /F1 11 Tf 14 TL 72 720 Td " + " ".join(f"({line}) Tj T*" for line in lines) + " ET"
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R "
+        "/Resources << /Font << /F1 5 0 R >> >> >>",
+        f"<< /Length {len(content)} >>\nstream\n{content}\nendstream",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+
+    pdf = "%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += f"{number} 0 obj\n{body}\nendobj\n"
+
+    xref = len(pdf)
+    pdf += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n"
+    pdf += "".join(f"{offset:010d} 00000 n \n" for offset in offsets)
+    pdf += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n"
+    return pdf.encode("latin-1")
+
+
+def _timed_import(name: str) -> Optional[float]:
+    """Import a module, returning the time it took in ms, or None if it is not installed"""
+    started = time.perf_counter()
+    try:
+        importlib.import_module(name)
+    except ImportError:
+        return None
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+def init_worker(warmup: bool = True) -> None:
+    """Pool initializer: import the PDF engines and load the spaCy model once per worker"""
+    global _resume_parser, _nlp_processor, _init_report
+
+    started = time.perf_counter()
+    imports_ms = {name: _timed_import(name) for name in HEAVY_MODULES}
+
+    model_started = time.perf_counter()
+    _resume_parser = ResumeParser()
+    _nlp_processor = NLPProcessor()
+    model_load_ms = (time.perf_counter() - model_started) * 1000
+
+    warmup_ms = None
+    if warmup:
+        # First call into a spaCy pipeline allocates its buffers; pay for it here
+        warmup_started = time.perf_counter()
+        _nlp_processor.extract_resume_data(WARMUP_TEXT)
+        warmup_ms = round((time.perf_counter() - warmup_started) * 1000, 1)
+
+    _init_report = {
+        "pid": os.getpid(),
+        "imports_ms": imports_ms,
+        "model_load_ms": round(model_load_ms, 1),
+        "warmup_ms": warmup_ms,
+        "total_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+    logger.info(f"CPU worker initialized in {_init_report['total_ms']}ms")
+
+
+def init_lite_worker() -> None:
+    """Pool initializer for lite mode: PDF engines and regex extraction only, no spaCy"""
+    global _resume_parser, _lite_extractor, _init_report
+
+    started = time.perf_counter()
+    imports_ms = {name: _timed_import(name) for name in HEAVY_MODULES if name != "spacy"}
+
+    _resume_parser = ResumeParser()
+    _lite_extractor = LiteExtractor()
+
+    _init_report = {
+        "pid": os.getpid(),
+        "imports_ms": imports_ms,
+        "total_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+    logger.info(f"Lite CPU worker initialized in {_init_report['total_ms']}ms")
+
+
+def init_skill_worker() -> None:
+    """Pool initializer for job-description import: the skill keyword matcher alone"""
+    global _init_report
+
+    started = time.perf_counter()
+    _lite()
+    _init_report = {"pid": os.getpid(), "total_ms": round((time.perf_counter() - started) * 1000, 1)}
+
+
+def worker_report() -> Dict[str, Any]:
+    """Initialization timings of the worker that runs this job"""
+    return dict(_init_report)
+
+
+def _services() -> Tuple[ResumeParser, NLPProcessor]:
+    if _resume_parser is None or _nlp_processor is None:
+        init_worker(warmup=False)
+    return _resume_parser, _nlp_processor
+
+
+def _parser() -> ResumeParser:
+    """The PDF parser alone, without loading spaCy in lite workers"""
+    global _resume_parser
+    if _resume_parser is None:
+        _resume_parser = ResumeParser()
+    return _resume_parser
+
+
+def _lite() -> LiteExtractor:
+    global _lite_extractor
+    if _lite_extractor is None:
+        _lite_extractor = LiteExtractor()
+    return _lite_extractor
+
+
+def extract_page_range(pdf_content: PDFSource, start: int, stop: int) -> Tuple[str, Dict[str, Any]]:
+    """Extract text from pages [start, stop) of a PDF.
+
+    Returns the text and the extraction engine report, which includes the
+    document's total page count so the caller can plan the remaining ranges.
+    Each page is also reported as (index, text) progress as soon as it is
+    read, so the caller keeps those pages if this job is killed mid-range.
+    A None progress value means the engine that read them was rejected and
+    the pages reported so far should be discarded.
+    """
+    resume_parser = _parser()
+
+    with resume_parser.open_document(
+        pdf_content,
+        page_range=(start, stop),
+        on_page=lambda index, text: report_progress((index, text)),
+        on_reset=lambda: report_progress(None),
+    ) as document:
+        text = resume_parser.extract_text(document)
+        return text, document.extraction_info()
+
+
+def extract_resume_data(text: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Run NLP extraction over already-extracted resume text.
+
+    Returns the structured data and the per-stage timings of the NLP profile.
+    """
+    _, nlp_processor = _services()
+    timings: Dict[str, Any] = {}
+    return nlp_processor.extract_resume_data(text, timings), timings
+
+
+def extract_resume_data_lite(text: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Regex-only extraction (skills, contact, pattern-based name); never loads spaCy"""
+    timings: Dict[str, Any] = {}
+    return _lite().extract_resume_data(text, timings), timings
+
+
+def extract_resume_data_batch(texts: List[str]) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """Run NLP extraction over several resume texts in one nlp.pipe pass.
+
+    Returns (structured data, timings) per text, in input order.
+    """
+    _, nlp_processor = _services()
+    timings: List[Dict[str, Any]] = []
+    results = nlp_processor.extract_resume_data_batch(texts, timings)
+    return list(zip(results, timings))
+
+
+def parse_resume(pdf_content: PDFSource) -> Tuple[str, Optional[Dict[str, Any]], Dict[str, Any]]:
+    """Extract text and structured resume data from a PDF.
+
+    Returns the extracted text, the NLP output (None when the PDF has no
+    extractable text) and the extraction engine report.
+    """
+    resume_parser, nlp_processor = _services()
+
+    with resume_parser.open_document(pdf_content) as document:
+        parsed_text = resume_parser.extract_text(document)
+        extraction_info = document.extraction_info()
+
+    if not parsed_text.strip():
+        return parsed_text, None, extraction_info
+
+    return parsed_text, nlp_processor.extract_resume_data(parsed_text), extraction_info
+
+
+def ingest_resume(path: str) -> Dict[str, Any]:
+    """Parse one resume file for bulk ingestion.
+
+    Never raises: failures come back as a record with status "error" so one
+    bad file does not abort the batch.
+    """
+    try:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+
+        parsed_text, structured_data, extraction_info = parse_resume(path)
+        if structured_data is None:
+            return {"source": path, "status": "error", "error": "Could not extract text from PDF"}
+
+        return {
+            "source": path,
+            "status": "ok",
+            "sha256": digest.hexdigest(),
+            "parsed_text": parsed_text,
+            "structured_data": structured_data,
+            "extraction": extraction_info,
+        }
+    except Exception as e:
+        logger.error(f"Error ingesting {path}: {str(e)}")
+        return {"source": path, "status": "error", "error": str(e)}
+
+
+def extract_job_skills(batch: List[Tuple[str, str]]) -> List[Tuple[str, List[str]]]:
+    """Skills named in each (title, description) pair of a batch of job descriptions.
+
+    Descriptions travel in batches so one pool round trip covers many of
+    them; the matcher is the same one resumes go through.
+    """
+    matcher = _lite().skill_matcher
+    return [(title, matcher.skills(text)) for title, text in batch]
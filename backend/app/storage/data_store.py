@@ -1,9 +1,11 @@
 import json
 import os
 from filelock import FileLock
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import logging
 
+from ..services.skill_index import SkillIndex
+
 logger = logging.getLogger(__name__)
 
 class DataStore:
@@ -19,11 +21,16 @@ class DataStore:
         if not os.path.exists(self.users_file):
             with open(self.users_file, 'w') as f:
                 json.dump({}, f)
+        
+        # Skill -> users, built on first query; our own writes patch it in place
+        self.skill_index = SkillIndex()
     
     def save_user_data(self, user_id: str, data: Dict[str, Any]) -> bool:
         """Save user data with file locking"""
         try:
             with FileLock(self.lock_file):
+                before = self._users_stamp()
+                
                 # Read existing data
                 users_data = {}
                 if os.path.exists(self.users_file):
@@ -40,12 +47,45 @@ class DataStore:
                 with open(self.users_file, 'w') as f:
                     json.dump(users_data, f, indent=2)
                 
+                self._index_write(before, users_data, {user_id: data.get("skills", [])})
+                
                 return True
                 
         except Exception as e:
             logger.error(f"Error saving user data for {user_id}: {str(e)}")
             return False
     
+    def save_users_batch(self, users: Dict[str, Dict[str, Any]]) -> bool:
+        """Save many users with a single read-modify-write of users.json"""
+        if not users:
+            return True
+
+        try:
+            with FileLock(self.lock_file):
+                before = self._users_stamp()
+                users_data = {}
+                if os.path.exists(self.users_file):
+                    with open(self.users_file, 'r') as f:
+                        try:
+                            users_data = json.load(f)
+                        except json.JSONDecodeError:
+                            users_data = {}
+
+                users_data.update(users)
+
+                with open(self.users_file, 'w') as f:
+                    json.dump(users_data, f, indent=2)
+
+                self._index_write(
+                    before, users_data, {user_id: data.get("skills", []) for user_id, data in users.items()}
+                )
+
+                return True
+
+        except Exception as e:
+            logger.error(f"Error saving batch of {len(users)} users: {str(e)}")
+            return False
+
     def get_user_data(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get user data with file locking"""
         try:
@@ -88,6 +128,7 @@ class DataStore:
                 if not os.path.exists(self.users_file):
                     return False
                 
+                before = self._users_stamp()
                 with open(self.users_file, 'r') as f:
                     try:
                         users_data = json.load(f)
@@ -100,10 +141,51 @@ class DataStore:
                     with open(self.users_file, 'w') as f:
                         json.dump(users_data, f, indent=2)
                     
+                    self._index_write(before, users_data, {user_id: None})
+                    
                     return True
                 
                 return False
                 
         except Exception as e:
             logger.error(f"Error deleting user data for {user_id}: {str(e)}")
-            return False
\ No newline at end of file
+            return False
+    
+    def get_users_by_skills(self, skills: List[str], match: str = "and") -> List[str]:
+        """IDs of users with all (match="and") or any (match="or") of the skills"""
+        self.warm_skill_index()
+        return self.skill_index.query(skills, match)
+    
+    def warm_skill_index(self) -> None:
+        """Build the skill index, or rebuild it if users.json changed under us"""
+        with FileLock(self.lock_file):
+            self.skill_index.refresh(self._users_stamp(), self._user_skills)
+    
+    def _index_write(
+        self, before: Optional[tuple], users_data: Dict[str, Any], changes: Dict[str, Optional[List[str]]]
+    ) -> None:
+        """Tell the skill index about a write we made (under the lock) to users_data"""
+        self.skill_index.update(
+            before,
+            self._users_stamp(),
+            changes,
+            lambda: [(user_id, data.get("skills", [])) for user_id, data in users_data.items()],
+        )
+    
+    def _user_skills(self):
+        users_data = {}
+        if os.path.exists(self.users_file):
+            with open(self.users_file, 'r') as f:
+                try:
+                    users_data = json.load(f)
+                except json.JSONDecodeError:
+                    users_data = {}
+        return [(user_id, data.get("skills", [])) for user_id, data in users_data.items()]
+    
+    def _users_stamp(self) -> Optional[tuple]:
+        """Modification stamp of users.json, to tell when the skill index is stale"""
+        try:
+            stat = os.stat(self.users_file)
+            return (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
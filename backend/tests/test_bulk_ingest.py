@@ -0,0 +1,35 @@
+import asyncio
+import os
+import time
+
+from app.services.bulk_ingest import ingest_results
+
+
+def _parse(path):
+    if path == "crash.pdf":
+        os._exit(1)
+    if path == "slow.pdf":
+        time.sleep(60)
+    return {"source": path, "status": "ok"}
+
+
+def _collect(paths, timeout):
+    async def collect():
+        return {
+            result["source"]: result
+            async for result in ingest_results(paths, 2, timeout, job=_parse, initializer=None, initargs=())
+        }
+
+    return asyncio.run(collect())
+
+
+def test_crashed_and_overdue_files_become_error_records():
+    started = time.monotonic()
+    results = _collect(["a.pdf", "crash.pdf", "slow.pdf", "b.pdf", "c.pdf"], timeout=3)
+
+    assert time.monotonic() - started < 30
+    assert {source: result["status"] for source, result in results.items()} == {
+        "a.pdf": "ok", "crash.pdf": "error", "slow.pdf": "error", "b.pdf": "ok", "c.pdf": "ok",
+    }
+    assert "died" in results["crash.pdf"]["error"]
+    assert "timed out" in results["slow.pdf"]["error"]
@@ -0,0 +1,39 @@
+import pytest
+
+from app.storage.data_store import DataStore
+
+
+def _store(path):
+    store = DataStore()
+    store.users_file = str(path / "users.json")
+    store.lock_file = store.users_file + ".lock"
+    return store
+
+
+@pytest.fixture
+def stores(tmp_path):
+    (tmp_path / "users.json").write_text("{}")
+    return _store(tmp_path), _store(tmp_path)
+
+
+def test_skill_index_sees_writes_from_another_store(stores):
+    a, b = stores
+    a.save_user_data("u1", {"skills": ["Terraform"]})
+    assert a.get_users_by_skills(["Terraform"]) == ["u1"]
+
+    b.save_user_data("u2", {"skills": ["Terraform"]})
+    a.save_user_data("u3", {"skills": ["Terraform"]})
+
+    assert a.get_users_by_skills(["Terraform"]) == ["u1", "u2", "u3"]
+
+
+def test_skill_index_follows_own_writes_incrementally(stores):
+    a, _ = stores
+    a.save_users_batch({"u1": {"skills": ["Python"]}, "u2": {"skills": ["Python", "SQL"]}})
+    assert a.get_users_by_skills(["Python"]) == ["u1", "u2"]
+
+    a.delete_user_data("u1")
+    a.save_user_data("u3", {"skills": ["SQL"]})
+
+    assert a.get_users_by_skills(["Python"]) == ["u2"]
+    assert a.get_users_by_skills(["SQL"]) == ["u2", "u3"]
@@ -0,0 +1,167 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from app.services.executor import CPUExecutor, JobTimeout, WorkerCrashed, report_progress
+
+
+_initialized = False
+
+
+def _slow_init(seconds):
+    global _initialized
+    time.sleep(seconds)
+    _initialized = True
+
+
+def _failing_init():
+    raise RuntimeError("no model")
+
+
+def _pid():
+    return os.getpid()
+
+
+def _was_initialized():
+    return _initialized
+
+
+def _sleep(seconds):
+    time.sleep(seconds)
+    return os.getpid()
+
+
+def _crash():
+    os._exit(1)
+
+
+def _report_then_hang(count):
+    for value in range(count):
+        report_progress(value)
+    time.sleep(60)
+
+
+def _run(scenario, **options):
+    """Run scenario(executor) on a fresh executor with spawned workers, then stop them"""
+    async def main():
+        executor = CPUExecutor(**{"max_workers": 1, "max_in_flight": 1, **options})
+        executor.start()
+        try:
+            return await scenario(executor)
+        finally:
+            executor.shutdown()
+
+    return asyncio.run(main())
+
+
+def test_overrunning_job_is_killed_and_its_worker_replaced():
+    async def scenario(executor):
+        first = await executor.run(_pid)
+        with pytest.raises(JobTimeout) as timeout:
+            await executor.run(_sleep, 60, timeout=1.0)
+        return first, timeout.value, await executor.run(_pid), executor.stats()
+
+    first, timeout, second, stats = _run(scenario)
+
+    assert not timeout.queued
+    assert first != second
+    assert stats["timeouts"] == 1
+    assert stats["queue_timeouts"] == 0
+    assert stats["workers_replaced"] == 1
+
+
+def test_deadline_passing_in_the_queue_is_a_queued_timeout():
+    async def scenario(executor):
+        await executor.run(_pid)
+        busy = asyncio.ensure_future(executor.run(_sleep, 1.0))
+        await asyncio.sleep(0.1)
+        with pytest.raises(JobTimeout) as timeout:
+            await executor.run(_pid, timeout=0.2)
+        await busy
+        return timeout.value, executor.stats()
+
+    timeout, stats = _run(scenario)
+
+    assert timeout.queued
+    assert stats["queue_timeouts"] == 1
+    assert stats["workers_replaced"] == 0
+
+
+def test_crashed_worker_fails_only_its_job():
+    async def scenario(executor):
+        first = await executor.run(_pid)
+        with pytest.raises(WorkerCrashed):
+            await executor.run(_crash)
+        return first, await executor.run(_pid), executor.stats()
+
+    first, second, stats = _run(scenario)
+
+    assert first != second
+    assert stats["crashes"] == 1
+    assert stats["completed"] == 2
+
+
+def test_progress_reported_before_a_kill_is_kept():
+    progress = []
+
+    async def scenario(executor):
+        with pytest.raises(JobTimeout):
+            await executor.run(_report_then_hang, 3, timeout=1.0, on_progress=progress.append)
+
+    _run(scenario)
+
+    assert progress == [0, 1, 2]
+
+
+def test_worker_takes_jobs_only_after_its_initializer_finishes():
+    async def scenario(executor):
+        starting = executor.stats()["workers_starting"]
+        # The deadline is shorter than the initializer: waiting for it is queue time
+        with pytest.raises(JobTimeout) as timeout:
+            await executor.run(_was_initialized, timeout=0.2)
+        return starting, timeout.value, await executor.run(_was_initialized), executor.stats()
+
+    starting, timeout, initialized, stats = _run(scenario, initializer=_slow_init, initargs=(1.0,))
+
+    assert starting == 1
+    assert timeout.queued
+    assert initialized
+    assert stats["workers_starting"] == 0
+    assert stats["workers_replaced"] == 0
+
+
+def test_failed_initializer_is_counted_and_respawned():
+    async def scenario(executor):
+        await asyncio.sleep(2.0)
+        return executor.stats()
+
+    stats = _run(scenario, initializer=_failing_init)
+
+    assert stats["init_failures"] >= 1
+    assert stats["workers_replaced"] >= 1
+
+
+def test_worker_is_recycled_after_max_jobs():
+    async def scenario(executor):
+        pids = [await executor.run(_pid) for _ in range(5)]
+        return pids, executor.stats()
+
+    pids, stats = _run(scenario, max_jobs_per_worker=2)
+
+    assert pids[0] == pids[1] != pids[2] == pids[3] != pids[4]
+    assert stats["recycled"] == {"jobs": 2, "memory": 0}
+    assert stats["timeouts"] == stats["crashes"] == 0
+
+
+def test_worker_is_recycled_past_max_rss():
+    async def scenario(executor):
+        pids = [await executor.run(_pid) for _ in range(2)]
+        return pids, executor.stats()
+
+    pids, stats = _run(scenario, max_worker_rss=1)
+
+    assert pids[0] != pids[1]
+    assert stats["recycled"]["memory"] == 2
+    assert stats["recycle_events"][0]["reason"] == "memory"
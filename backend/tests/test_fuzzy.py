@@ -0,0 +1,58 @@
+import threading
+import time
+
+from app.services.fuzzy import FuzzyResolver
+
+
+def _resolver(skills):
+    resolver = FuzzyResolver()
+    resolver.refresh(1, lambda: skills)
+    return resolver
+
+
+def test_candidates_list_each_skill_once():
+    resolver = _resolver(["PostgreSQL", "MySQL", "SQL"])
+
+    names = [candidate.skill for candidate in resolver.candidates("PostgreSQL 14")]
+
+    assert names[0] == "PostgreSQL"
+    assert len(names) == len(set(names))
+
+
+def test_resolution_from_a_replaced_index_is_not_cached():
+    resolver = _resolver(["Kubernetes"])
+    stale = resolver._index
+    resolver._swap(2, resolver._build(lambda: ["Kubernetes", "Kubeflow"]))
+
+    # A lookup that started before the refresh finishes after it
+    resolver._index, current = stale, resolver._index
+    original = resolver._candidates
+
+    def finish_after_refresh(index, skill, k):
+        resolver._index = current
+        return original(index, skill, k)
+
+    resolver._candidates = finish_after_refresh
+    resolver.resolve("Kubernets")
+
+    assert resolver.stats()["cached"] == 0
+
+
+def test_new_catalog_is_indexed_in_the_background():
+    resolver = _resolver(["Kubernetes"])
+    release = threading.Event()
+
+    def slow_catalog():
+        release.wait(5)
+        return ["Kubernetes", "Kubeflow"]
+
+    resolver.refresh(2, slow_catalog)
+    # Still served from the previous index while the new one builds
+    assert resolver.resolve("Kubeflw") == ("Kubeflw", None)
+
+    release.set()
+    for _ in range(100):
+        if resolver._stamp == 2:
+            break
+        time.sleep(0.05)
+    assert resolver.resolve("Kubeflw")[0] == "Kubeflow"
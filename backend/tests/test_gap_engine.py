@@ -0,0 +1,15 @@
+import pytest
+
+from app.services.gap_engine import GapEngine
+
+
+def test_required_list_matches_the_percentage_denominator():
+    engine = GapEngine()
+    role = ["Python", "python", "Kubernetes", "K8s", "SQL"]
+
+    gap = engine.analyze(["Python"], role)
+    required = engine.required(role)
+
+    assert required == ["Python", "Kubernetes", "SQL"]
+    assert sorted(gap.matched + gap.missing) == sorted(required)
+    assert gap.match_percentage == pytest.approx(100 / len(required))
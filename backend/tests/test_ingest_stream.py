@@ -0,0 +1,63 @@
+import asyncio
+import json
+import threading
+
+from app import config
+from app.api import routes
+
+
+class _Store:
+    def __init__(self, fail: bool):
+        self.fail = fail
+        self.saved = {}
+        self.threads = set()
+
+    def save_users_batch(self, users):
+        self.threads.add(threading.current_thread() is threading.main_thread())
+        if self.fail:
+            return False
+        self.saved.update(users)
+        return True
+
+
+def _result(n):
+    return {
+        "source": f"r{n}.pdf", "status": "ok", "sha256": f"{n:012x}" + "0" * 52,
+        "parsed_text": "Python", "structured_data": {"skills": ["Python"]},
+    }
+
+
+def _stream(store, monkeypatch, count=3):
+    monkeypatch.setattr(routes, "get_data_store", lambda: store)
+    monkeypatch.setattr(config, "INGEST_BATCH_SIZE", 2)
+    cleaned = []
+
+    async def jobs():
+        for n in range(count):
+            yield routes._resolved(_result(n))
+
+    async def cleanup():
+        cleaned.append(True)
+
+    async def collect():
+        return [json.loads(line) async for line in routes._ingest_stream(jobs(), None, cleanup)]
+
+    return asyncio.run(collect()), cleaned
+
+
+def test_users_are_saved_off_the_event_loop(monkeypatch):
+    store = _Store(fail=False)
+    lines, cleaned = _stream(store, monkeypatch)
+
+    assert [line["status"] for line in lines] == ["ok", "ok", "ok"]
+    assert len(store.saved) == 3
+    assert store.threads == {False}
+    assert cleaned
+
+
+def test_failed_save_becomes_an_error_line(monkeypatch):
+    lines, cleaned = _stream(_Store(fail=True), monkeypatch)
+
+    assert [line["status"] for line in lines][-1] == "error"
+    assert lines[-1]["error"] == "Failed to save parsed users"
+    assert cleaned
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from app.services.jd_import import clean_title, import_job_descriptions
+
+
+@pytest.mark.parametrize("title, expected", [
+    ("Data Engineer", "Data Engineer"),
+    ("Senior Data Engineer", "Data Engineer"),
+    ("Sr. Data Engineer", "Data Engineer"),
+    ("Junior Frontend Developer", "Frontend Developer"),
+    ("Entry-Level Data Analyst", "Data Analyst"),
+    ("Data Engineer II", "Data Engineer"),
+    ("Data Engineer IV", "Data Engineer"),
+    ("Data Engineer II - Remote", "Data Engineer"),
+    ("Data Engineer - Remote", "Data Engineer"),
+    ("Data Engineer | Berlin", "Data Engineer"),
+    ("Data Engineer (Contract)", "Data Engineer"),
+    ("CI / CD Engineer", "CI / CD Engineer"),
+    ("Director of I.T.", "Director of I.T."),
+    ("I.T. Support Specialist", "I.T. Support Specialist"),
+    ("Tier I Support Analyst", "Tier I Support Analyst"),
+    ("Full-Stack Developer", "Full-Stack Developer"),
+])
+def test_clean_title(title, expected):
+    assert clean_title(title) == expected
+
+
+def _write_jsonl(path, records):
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+
+
+def test_import_derives_roles_and_keeps_others(tmp_path):
+    source = tmp_path / "jds.jsonl"
+    _write_jsonl(source, [
+        {"title": "Senior Data Engineer", "description": "We use Python, SQL and Docker."},
+        {"title": "Data Engineer - Remote", "description": "Python and SQL every day."},
+        {"title": "Data Engineer II", "description": "Python, SQL, Excel."},
+    ])
+    roles_path = tmp_path / "roles.json"
+    roles_path.write_text(json.dumps({"Data Analyst": ["SQL"]}))
+
+    counts = import_job_descriptions(str(source), str(roles_path), min_share=0.5)
+
+    assert counts["descriptions"] == 3
+    assert json.loads(roles_path.read_text()) == {"Data Analyst": ["SQL"], "Data Engineer": ["Python", "SQL"]}
+
+
+def test_import_refuses_to_write_when_nothing_was_derived(tmp_path):
+    source = tmp_path / "jds"
+    source.mkdir()
+    roles_path = tmp_path / "roles.json"
+    roles_path.write_text(json.dumps({"Data Analyst": ["SQL"]}))
+
+    with pytest.raises(ValueError):
+        import_job_descriptions(str(source), str(roles_path), merge=False)
+
+    assert json.loads(roles_path.read_text()) == {"Data Analyst": ["SQL"]}
@@ -0,0 +1,56 @@
+from fastapi import FastAPI, File, UploadFile
+from fastapi.testclient import TestClient
+
+from app.api.limits import RequestSizeLimit
+
+LIMIT = 64 * 1024
+
+
+def _client():
+    app = FastAPI()
+    app.add_middleware(RequestSizeLimit, limits={"/upload": LIMIT})
+
+    @app.post("/upload")
+    async def upload(file: UploadFile = File(...)):
+        return {"size": len(await file.read())}
+
+    return TestClient(app)
+
+
+def test_declared_length_over_limit_is_refused():
+    response = _client().post("/upload", files={"file": ("a.pdf", b"x" * (LIMIT * 4))})
+    assert response.status_code == 413
+
+
+def test_streamed_body_is_cut_off_at_the_limit():
+    boundary = "limit-test"
+
+    def body():
+        yield f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="a.pdf"\r\n\r\n'.encode()
+        for _ in range(8):
+            yield b"y" * LIMIT
+        yield f"\r\n--{boundary}--\r\n".encode()
+
+    response = _client().post(
+        "/upload", content=body(), headers={"content-type": f"multipart/form-data; boundary={boundary}"}
+    )
+    assert response.status_code == 413
+
+
+def test_small_upload_passes():
+    response = _client().post("/upload", files={"file": ("a.pdf", b"%PDF-1.4")})
+    assert response.json() == {"size": 8}
+
+
+def test_refusal_carries_cors_headers_in_the_app():
+    from app import config
+    from app.main import app
+
+    response = TestClient(app).post(
+        "/api/upload_resume",
+        files={"file": ("a.pdf", b"x" * (config.UPLOAD_MAX_REQUEST_BYTES + 1))},
+        headers={"Origin": "http://localhost:5173"},
+    )
+
+    assert response.status_code == 413
+    assert response.headers["access-control-allow-origin"] == "http://localhost:5173"
@@ -0,0 +1,55 @@
+import os
+import threading
+
+import pytest
+
+from app import config
+from app.services import workers
+from app.services.parse_cache import ParseCache
+
+
+@pytest.mark.parametrize("setting, value", [
+    ("PDF_MAX_PAGES", 3),
+    ("PDF_MAX_CHARS", 500),
+    ("PDF_ENGINE_ORDER", ("pdfplumber", "pymupdf")),
+    ("PDF_MAX_BAD_GLYPH_RATIO", 0.5),
+    ("PDF_MIN_WORDS_PER_PAGE", 1),
+])
+def test_fingerprint_follows_extraction_settings(monkeypatch, setting, value):
+    before = workers.extractor_fingerprint()
+    monkeypatch.setattr(config, setting, value)
+
+    assert workers.extractor_fingerprint() != before
+
+
+def test_concurrent_puts_of_one_key_all_land(tmp_path, caplog):
+    cache = ParseCache(str(tmp_path), "f" * 64)
+
+    def put(n, barrier):
+        barrier.wait()
+        cache.put("same", f"text {n}", {"n": n})
+
+    for _ in range(20):
+        barrier = threading.Barrier(8)
+        threads = [threading.Thread(target=put, args=(n, barrier)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert "Error writing parse cache entry" not in caplog.text
+    assert os.listdir(cache.cache_dir) == ["same.json"]
+    assert ParseCache(str(tmp_path), "f" * 64).get("same")[0].startswith("text ")
+
+
+def test_disk_tier_is_indexed_on_first_use_not_on_construction(tmp_path):
+    ParseCache(str(tmp_path), "a" * 64).put("old", "text", {})
+    stale = os.path.join(str(tmp_path), "a" * 16)
+
+    cache = ParseCache(str(tmp_path), "b" * 64)
+    assert os.path.isdir(stale)
+    assert not os.path.exists(cache.cache_dir)
+
+    assert cache.get("old") is None
+    assert not os.path.exists(stale)
+    assert os.path.isdir(cache.cache_dir)
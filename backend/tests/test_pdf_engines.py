@@ -0,0 +1,62 @@
+from app.services import pdf_engines
+from app.services.pdf_engines import PDFDocument, PDFEngine
+
+GOOD_PAGE = " ".join(["skill"] * 30)
+
+
+class _FakeEngine(PDFEngine):
+    def __init__(self, name, pages):
+        self.name = name
+        self.pages = pages
+
+    def available(self):
+        return True
+
+    def open(self, source):
+        return self.pages
+
+    def close(self, handle):
+        pass
+
+    def page_count(self, handle):
+        return len(handle)
+
+    def page_text(self, handle, index):
+        return handle[index]
+
+    def page_tables(self, handle, index):
+        return []
+
+
+def _document(monkeypatch, engines, **kwargs):
+    for engine in engines:
+        monkeypatch.setitem(pdf_engines.ENGINES, engine.name, engine)
+    return PDFDocument(b"", engine_order=[engine.name for engine in engines], **kwargs)
+
+
+def test_reported_pages_are_reset_when_an_engine_is_rejected(monkeypatch):
+    collected = {}
+    document = _document(
+        monkeypatch,
+        [_FakeEngine("garbled", ["�" * 40, "�" * 40, "x"]), _FakeEngine("clean", [GOOD_PAGE, GOOD_PAGE])],
+        on_page=collected.__setitem__,
+        on_reset=collected.clear,
+    )
+
+    assert document.text() == f"{GOOD_PAGE}\n{GOOD_PAGE}"
+    assert document.engine == "clean"
+    # Page 2 was only read by the rejected engine and must not linger
+    assert collected == {0: GOOD_PAGE, 1: GOOD_PAGE}
+
+
+def test_no_reset_when_the_first_engine_is_accepted(monkeypatch):
+    resets = []
+    document = _document(
+        monkeypatch,
+        [_FakeEngine("clean", [GOOD_PAGE]), _FakeEngine("other", [GOOD_PAGE])],
+        on_page=lambda index, text: None,
+        on_reset=lambda: resets.append(True),
+    )
+
+    document.text()
+    assert resets == []
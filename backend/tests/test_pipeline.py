@@ -0,0 +1,63 @@
+import asyncio
+import threading
+
+from app.services.executor import JobTimeout
+from app.services.pipeline import ResumePipeline
+
+TEXT = "Jane Doe\njane@example.com\nPython, SQL and Docker"
+
+
+class _TimingOutExecutor:
+    async def run(self, fn, *args, timeout=None, on_progress=None):
+        await asyncio.sleep(timeout or 0)
+        raise JobTimeout(f"{fn.__name__} timed out", queued=True)
+
+
+def _pipeline(extraction_s, extraction_timeout, nlp_timeout):
+    pipeline = ResumePipeline(
+        _TimingOutExecutor(), mode="lite", extraction_timeout=extraction_timeout, nlp_timeout=nlp_timeout
+    )
+
+    async def extract_text(source):
+        await asyncio.sleep(extraction_s)
+        return TEXT, True
+
+    pipeline.extract_text = extract_text
+    return pipeline
+
+
+def test_nlp_fallback_runs_off_the_event_loop():
+    pipeline = _pipeline(0.0, extraction_timeout=1.0, nlp_timeout=0.1)
+    threads = []
+    extract = pipeline._fallback_extract
+
+    def fallback(text):
+        threads.append(threading.current_thread() is threading.main_thread())
+        return extract(text)
+
+    pipeline._fallback_extract = fallback
+    parsed = asyncio.run(pipeline.parse(None))
+
+    assert parsed.data["skills"] == ["Docker", "Python", "SQL"]
+    assert parsed.truncated == ("nlp",)
+    assert threads == [False]
+
+
+def test_nlp_fallback_is_skipped_once_the_budget_is_spent():
+    pipeline = _pipeline(0.3, extraction_timeout=0.0, nlp_timeout=0.1)
+
+    parsed = asyncio.run(pipeline.parse(None))
+
+    assert parsed.data["skills"] == []
+    assert parsed.truncated == ("nlp",)
+
+
+def test_page_collector_drops_pages_on_engine_fallback():
+    pages = {}
+    collect = ResumePipeline._page_collector(pages)
+    collect((0, "garbled"))
+    collect((1, "garbled"))
+    collect(None)
+    collect((0, "clean"))
+
+    assert pages == {0: "clean"}
@@ -0,0 +1,28 @@
+from app.services.gap_engine import shared_engine
+from app.services.role_matrix import RoleMatrix
+
+ROLES = {
+    "Backend Developer": ["Python", "SQL", "Docker", "python"],
+    "Platform Engineer": ["Go", "Golang", "Kubernetes", "Terraform"],
+    "Empty": [],
+}
+
+
+def test_gaps_match_the_gap_engine_for_every_role():
+    matrix = RoleMatrix(ROLES)
+    engine = shared_engine()
+
+    for user in (["Python", "Docker"], ["golang", "K8s"], [], ["SQL", "Terraform", "Python"]):
+        for gap in matrix.gaps(user):
+            expected = engine.analyze(user, ROLES[gap.role])
+            assert (gap.matched, gap.missing) == (expected.matched, expected.missing)
+            assert gap.score == round(expected.match_percentage, 1)
+
+
+def test_gaps_keep_role_order_and_first_alias():
+    gaps = {gap.role: gap for gap in RoleMatrix(ROLES).gaps(["golang"])}
+
+    assert gaps["Platform Engineer"].matched == ["Go"]
+    assert gaps["Platform Engineer"].missing == ["Kubernetes", "Terraform"]
+    assert gaps["Platform Engineer"].score == 33.3
+    assert gaps["Backend Developer"].missing == ["Python", "SQL", "Docker"]
@@ -0,0 +1,59 @@
+import json
+import sqlite3
+
+from app import config
+from app.services.jobs import JobService
+from app.services.role_sources import load_roles, save_roles
+
+
+def _sqlite_catalog(path):
+    connection = sqlite3.connect(path)
+    with connection:
+        connection.execute("CREATE TABLE roles (name TEXT PRIMARY KEY, skills TEXT NOT NULL, category TEXT)")
+        connection.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+        connection.executemany(
+            "INSERT INTO roles (name, skills, category) VALUES (?, ?, ?)",
+            [
+                ("Data Analyst", json.dumps(["Python", "SQL"]), "data"),
+                ("Frontend Developer", json.dumps(["React", "CSS"]), "web"),
+            ],
+        )
+        connection.execute("INSERT INTO meta (key, value) VALUES ('source', 'hr-export')")
+    connection.close()
+
+
+def test_add_role_keeps_other_sqlite_tables_and_columns(tmp_path, monkeypatch):
+    path = str(tmp_path / "roles.sqlite")
+    _sqlite_catalog(path)
+    monkeypatch.setattr(config, "ROLES_FILE", path)
+
+    assert JobService().add_role("DevOps Engineer", ["Docker", "Linux"])
+
+    connection = sqlite3.connect(path)
+    try:
+        categories = dict(connection.execute("SELECT name, category FROM roles"))
+        meta = connection.execute("SELECT value FROM meta WHERE key = 'source'").fetchone()
+    finally:
+        connection.close()
+
+    assert categories == {"Data Analyst": "data", "Frontend Developer": "web", "DevOps Engineer": None}
+    assert meta == ("hr-export",)
+    assert load_roles(path)["DevOps Engineer"] == ["Docker", "Linux"]
+
+
+def test_sqlite_save_updates_and_deletes_in_place(tmp_path):
+    path = str(tmp_path / "roles.db")
+    _sqlite_catalog(path)
+
+    save_roles(path, {"Data Analyst": ["Python", "SQL", "Excel"]})
+
+    assert load_roles(path) == {"Data Analyst": ["Python", "SQL", "Excel"]}
+
+
+def test_jsonl_round_trip(tmp_path):
+    path = str(tmp_path / "roles.jsonl")
+    roles = {"Data Analyst": ["Python", "SQL"], "C++ Developer": ["C++"]}
+
+    save_roles(path, roles)
+
+    assert load_roles(path) == roles
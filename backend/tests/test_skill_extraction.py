@@ -0,0 +1,19 @@
+from app.services.nlp import LiteExtractor
+
+
+def _skills(text):
+    return LiteExtractor().extract_resume_data(text)["skills"]
+
+
+def test_taxonomy_aliases_are_extracted_under_their_canonical_name():
+    assert _skills("Built services in Golang and ReactJS, deployed on K8s with Postgres") == [
+        "Go", "Kubernetes", "PostgreSQL", "React",
+    ]
+
+
+def test_an_alias_and_its_skill_are_listed_once():
+    assert _skills("Kubernetes (k8s), python3 and Python") == ["Kubernetes", "Python"]
+
+
+def test_everyday_word_aliases_are_not_extracted():
+    assert _skills("Ready to go the extra mile; the rest is history") == []